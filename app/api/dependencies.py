@@ -1,30 +1,84 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.config import settings
-from app.core.database import get_database
-from app.core.security import decode_token
+from app.core.config import settings, RepositoryBackend
+from app.core.database import get_client, get_database
+from app.core.rate_limit import get_user_rate_limiter
+from app.core.security import InvalidTokenError
+from app.core.token_cache import decode_token_cached
 from app.models.user_model import UserModel
+from app.repositories.user_cache import user_cache
 from app.repositories.user_repository import UserRepository
 from app.repositories.user_repository_mongo import UserRepositoryImpl
+from app.repositories.user_repository_memory import MemoryUserRepository, \
+    get_user_store
 from app.repositories.task_repository import TaskRepository
 from app.repositories.task_repository_mongo import TaskRepositoryImpl
+from app.repositories.task_repository_memory import MemoryTaskRepository, \
+    get_task_store
+from app.repositories.task_change_stream import TaskChangeStream
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.idempotency_repository_mongo import \
+    IdempotencyRepositoryImpl
+from app.repositories.idempotency_repository_memory import \
+    MemoryIdempotencyRepository, get_idempotency_store
 from app.repositories.errors import NotFoundError
 
 
-def get_task_repository(
+def get_mongo_task_repository(
     db: AsyncIOMotorDatabase = Depends(get_database)) -> TaskRepository:
     return TaskRepositoryImpl(db)
 
 
-def get_user_repository(
+def get_mongo_user_repository(
     db: AsyncIOMotorDatabase = Depends(get_database)) -> UserRepository:
     return UserRepositoryImpl(db)
 
 
+def get_mongo_idempotency_repository(
+    db: AsyncIOMotorDatabase = Depends(get_database)
+) -> IdempotencyRepository:
+    return IdempotencyRepositoryImpl(db)
+
+
+def get_memory_task_repository() -> TaskRepository:
+    return MemoryTaskRepository(get_task_store())
+
+
+def get_memory_user_repository() -> UserRepository:
+    return MemoryUserRepository(get_user_store())
+
+
+def get_memory_idempotency_repository() -> IdempotencyRepository:
+    return MemoryIdempotencyRepository(get_idempotency_store())
+
+
+def get_task_change_stream() -> TaskChangeStream:
+    """
+    Change streams need MongoDB (a replica set); 503 when events are off.
+    """
+    if (not settings.task_events_enabled
+            or settings.repository_backend != RepositoryBackend.mongo):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="task events are not available",
+        )
+    return TaskChangeStream(get_database(get_client()))
+
+
+# Chosen once at import so the memory backend never touches Motor
+if settings.repository_backend == RepositoryBackend.memory:
+    get_task_repository = get_memory_task_repository
+    get_user_repository = get_memory_user_repository
+    get_idempotency_repository = get_memory_idempotency_repository
+else:
+    get_task_repository = get_mongo_task_repository
+    get_user_repository = get_mongo_user_repository
+    get_idempotency_repository = get_mongo_idempotency_repository
+
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
@@ -33,24 +87,37 @@ async def get_current_user(
     repo: UserRepository = Depends(get_user_repository),
 ) -> UserModel:
     """
-    Decode JWT and fetch the current user. Return 401 on any issue.
+    Decode JWT and fetch the current user (claims and user are served from
+    per-worker caches when possible). Return 401 on any issue, 429 when the
+    user is over their request rate.
     """
     try:
-        payload = decode_token(
+        payload = decode_token_cached(
             token=token,
             secret=settings.jwt_secret_key.get_secret_value(),
             algorithms=[settings.jwt_algorithm],
         )
         user_id = str(payload.get("sub"))
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication token"
         )
 
+    # Before any database work, so a noisy user is shed for free
+    limiter = get_user_rate_limiter()
+    if limiter is not None:
+        limiter.acquire(user_id)
+
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
     try:
-        return await repo.get_by_id(user_id)
+        user = await repo.get_by_id(user_id)
     except NotFoundError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
+    user_cache.set(user_id, user)
+    return user
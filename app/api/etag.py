@@ -0,0 +1,81 @@
+import hashlib
+from typing import Iterable, Optional
+
+from app.models.task_model import TaskModel
+from app.repositories.errors import PreconditionFailedError
+
+# Codings CompressionMiddleware may apply. A compressed response has other
+# bytes, so it gets its own strong ETag: the coding appended in the quotes
+_CODED_SUFFIXES = ('-gzip"', '-br"', '-zstd"')
+
+
+def task_etag(task: TaskModel) -> str:
+    """
+    Strong ETag for a task: every write bumps ``version``.
+    """
+    return f'"{task.id}-{task.version}"'
+
+
+def list_etag(items: Iterable[TaskModel], *parts: object) -> str:
+    """
+    Strong ETag for a list page: its items' versions plus page metadata.
+    """
+    digest = hashlib.sha1()
+    for task in items:
+        digest.update(f"{task.id}-{task.version};".encode())
+    for part in parts:
+        digest.update(f"|{part}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def coded_etag(etag: str, coding: str) -> str:
+    """
+    Strong ETag for the ``coding``-compressed form of a representation.
+    """
+    return f'{etag[:-1]}-{coding}"'
+
+
+def _strip_coding(tag: str) -> str:
+    for suffix in _CODED_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def _tags(header: str) -> list[str]:
+    return [t.strip() for t in header.split(",") if t.strip()]
+
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """
+    True when the client's cached copy is current (respond 304).
+    If-None-Match uses weak comparison, so W/ prefixes are ignored, and
+    so is the content coding of the copy.
+    """
+    if not header:
+        return False
+    for tag in _tags(header):
+        if tag == "*" or _strip_coding(tag.removeprefix("W/")) == etag:
+            return True
+    return False
+
+
+def expected_version(header: Optional[str], task_id: str) -> Optional[int]:
+    """
+    Turn If-Match into the task version the write must apply to.
+    None means unconditional (no header or ``*``). Raises
+    PreconditionFailedError when no listed tag can refer to this task.
+    """
+    if not header:
+        return None
+    prefix = f'"{task_id.lower()}-'
+    for tag in _tags(header):
+        if tag == "*":
+            return None
+        tag = _strip_coding(tag)
+        # If-Match uses strong comparison: weak tags never match
+        if tag.startswith(prefix) and tag.endswith('"'):
+            version = tag[len(prefix):-1]
+            if version.isdigit():
+                return int(version)
+    raise PreconditionFailedError()
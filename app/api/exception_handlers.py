@@ -2,8 +2,12 @@ from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from app.core.errors import ServiceOverloadedError, RateLimitedError, \
+    IdempotencyInProgressError, IdempotencyKeyReusedError, \
+    ConcurrentUpdateError
 from app.repositories.errors import RepositoryError, NotFoundError, \
-    UniqueViolationError, InvalidIdError
+    UniqueViolationError, InvalidIdError, InvalidCursorError, \
+    PreconditionFailedError
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -30,6 +34,20 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc)}
         )
 
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(_: Request, exc: InvalidCursorError):
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": str(exc)}
+        )
+
+    @app.exception_handler(PreconditionFailedError)
+    async def precondition_handler(_: Request, exc: PreconditionFailedError):
+        return JSONResponse(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            content={"detail": str(exc)}
+        )
+
     @app.exception_handler(RepositoryError)
     async def repo_handler(_: Request, exc: RepositoryError):
         return JSONResponse(
@@ -37,6 +55,48 @@ def register_exception_handlers(app: FastAPI) -> None:
             content={"detail": str(exc)}
         )
 
+    @app.exception_handler(ServiceOverloadedError)
+    async def overloaded_handler(_: Request, exc: ServiceOverloadedError):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(RateLimitedError)
+    async def rate_limited_handler(_: Request, exc: RateLimitedError):
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(IdempotencyInProgressError)
+    async def idempotency_in_progress_handler(
+            _: Request, exc: IdempotencyInProgressError):
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(IdempotencyKeyReusedError)
+    async def idempotency_reused_handler(
+            _: Request, exc: IdempotencyKeyReusedError):
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": str(exc)}
+        )
+
+    @app.exception_handler(ConcurrentUpdateError)
+    async def concurrent_update_handler(_: Request,
+                                        exc: ConcurrentUpdateError):
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     @app.exception_handler(RequestValidationError)
     async def validation_handler(_: Request, exc: RequestValidationError):
         return JSONResponse(
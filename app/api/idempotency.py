@@ -0,0 +1,78 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Depends, Header, Request, Response, status
+from pydantic import BaseModel
+
+from app.api.dependencies import get_current_user, get_idempotency_repository
+from app.api.responses import model_response, json_response
+from app.models.user_model import UserModel
+from app.repositories.idempotency_repository import IdempotencyRepository, \
+    IdempotencyRecord
+from app.services.idempotency import IdempotencyService
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+# Response headers replayed with the body (the rest are per response)
+_STORED_HEADERS = ("location", "etag")
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+class Idempotency:
+    """
+    The request's Idempotency-Key, if any, scoped to the caller and route.
+    """
+
+    def __init__(self, key: Optional[str], owner_id: str,
+                 repository: IdempotencyRepository) -> None:
+        self._key = key
+        self._owner_id = owner_id
+        self._repository = repository
+
+    async def run(self, request: Request, response: Response,
+                  payload: BaseModel,
+                  handler: Callable[[], Awaitable[BaseModel]],
+                  status_code: int = status.HTTP_200_OK
+                  ) -> BaseModel | Response:
+        """
+        Run ``handler`` (which may set headers on ``response``) and return
+        its DTO like ``model_response``. With an Idempotency-Key the
+        response is rendered, stored and, for repeats, replayed instead;
+        ``payload`` is the request body a repeat must match.
+        """
+        if self._key is None:
+            return model_response(await handler(), response, status_code)
+        key = _digest(self._owner_id, request.method, request.url.path,
+                      self._key)
+        fingerprint = _digest(payload.model_dump_json())
+
+        async def produce() -> IdempotencyRecord:
+            model = await handler()
+            return IdempotencyRecord(
+                fingerprint=fingerprint,
+                status_code=status_code,
+                headers={k: v for k, v in response.headers.items()
+                         if k in _STORED_HEADERS},
+                body=model.model_dump_json().encode(),
+            )
+
+        record, replayed = await IdempotencyService.execute(
+            key, fingerprint, produce, self._repository
+        )
+        headers = dict(record.headers)
+        if replayed:
+            headers[REPLAYED_HEADER] = "true"
+        return json_response(record.body, record.status_code, headers)
+
+
+def get_idempotency(
+    idempotency_key: Optional[str] = Header(
+        default=None, alias="Idempotency-Key", min_length=1, max_length=255,
+        description="Retries with the same key get the first response back",
+    ),
+    repository: IdempotencyRepository = Depends(get_idempotency_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> Idempotency:
+    return Idempotency(idempotency_key, current_user.id or "", repository)
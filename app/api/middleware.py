@@ -0,0 +1,177 @@
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.etag import coded_etag
+from app.core.compression import Compressor, negotiate
+from app.core.metrics import Histogram
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code, including "
+    "the full (possibly streamed) response body.",
+    labelnames=("method", "route", "status"),
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope, prefixes: Mapping[int, str]) -> str:
+    """
+    The matched route template (e.g. /api/v1/tasks/{task_id}): mount path,
+    include prefix and the route's own path format. Routes of included
+    routers only carry their unprefixed path, so ``prefixes`` maps
+    id(route) to the prefix it was included with.
+    """
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return UNMATCHED_ROUTE
+    return scope.get("root_path", "") + prefixes.get(id(route), "") \
+        + path_format
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware timing every HTTP request. Labels use the matched
+    route template (e.g. /api/v1/tasks/{task_id}), never the raw path, so
+    cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp,
+                 prefixes: Optional[Mapping[int, str]] = None) -> None:
+        self.app = app
+        self._prefixes = prefixes or {}
+
+    async def __call__(self, scope: Scope, receive: Receive,
+                       send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router records its match in the shared scope dict
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"], route_template(scope, self._prefixes),
+                status_code
+            ).observe(time.perf_counter() - started)
+
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json", "application/x-ndjson", "text/csv", "text/plain",
+    "text/html",
+})
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI content-encoding negotiation (gzip, br, zstd).
+
+    Bodies sent in one message are compressed only when at least
+    ``min_size`` bytes. Streamed bodies (exports) are compressed chunk by
+    chunk and flushed after each, so clients still receive them
+    incrementally. Event streams, already encoded responses and
+    ``exclude_paths`` pass through untouched. Strong ETags of compressed
+    responses stay strong but get the coding appended (``"…-gzip"``), as
+    their bytes differ; app.api.etag strips it again when comparing.
+    """
+
+    def __init__(self, app: ASGIApp,
+                 compressors: Dict[str, Callable[[int], Compressor]],
+                 preferred: List[str], min_size: int, level: int,
+                 exclude_paths: Iterable[str] = ()) -> None:
+        self.app = app
+        self._compressors = compressors
+        self._preferred = [c for c in preferred if c in compressors]
+        self._min_size = min_size
+        self._level = level
+        self._exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive,
+                       send: Send) -> None:
+        coding = None
+        if scope["type"] == "http" and \
+                scope["path"] not in self._exclude_paths:
+            coding = negotiate(
+                Headers(scope=scope).get("accept-encoding", ""),
+                self._preferred,
+            )
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor: Optional[Compressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                if not self._should_compress(start["status"], headers, body,
+                                             more_body):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = self._compressors[coding](self._level)
+                headers["Content-Encoding"] = coding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = coded_etag(etag, coding)
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    compressed = compressor.compress(body, flush=False) \
+                        + compressor.finish()
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body",
+                                "body": compressed})
+                    return
+                await send(start)
+
+            chunk = compressor.compress(body, flush=more_body)
+            if not more_body:
+                chunk += compressor.finish()
+            await send({"type": "http.response.body", "body": chunk,
+                        "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, status_code: int, headers: MutableHeaders,
+                         body: bytes, more_body: bool) -> bool:
+        if status_code < 200 or status_code in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip()
+        if media_type not in COMPRESSIBLE_TYPES:
+            return False
+        if not more_body:
+            return len(body) >= self._min_size
+        length = headers.get("content-length")
+        return length is None or int(length) >= self._min_size
@@ -0,0 +1,50 @@
+from typing import Optional, TypeVar
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+M = TypeVar("M", bound=BaseModel)
+
+JSON_MEDIA_TYPE = "application/json"
+# Set by Response() itself; the rendered body brings its own
+_SKIP_HEADERS = frozenset({"content-length", "content-type"})
+
+
+def json_response(body: bytes, status_code: int = status.HTTP_200_OK,
+                  headers: Optional[dict] = None) -> Response:
+    """
+    Response for an already serialized JSON body.
+    """
+    return Response(
+        body, status_code=status_code, headers=headers,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def model_response(model: M, response: Optional[Response] = None,
+                   status_code: int = status.HTTP_200_OK,
+                   by_alias: bool = False) -> M | Response:
+    """
+    Return a handler's response DTO, rendered once when FAST_JSON_RESPONSES
+    is on.
+
+    Handlers build their DTOs from trusted models, so FastAPI validating
+    them again against ``response_model`` before serializing is pure
+    overhead. The fast path serializes with pydantic-core directly and
+    returns a Response, which FastAPI passes through untouched; headers set
+    on the injected ``response`` are carried over. ``response_model`` stays
+    on the route, so the OpenAPI schema does not change. ``status_code``
+    and ``by_alias`` must match the route's.
+    """
+    if not settings.fast_json_responses:
+        return model
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items()
+                   if k not in _SKIP_HEADERS}
+    return json_response(
+        model.model_dump_json(by_alias=by_alias).encode(),
+        status_code=status_code, headers=headers,
+    )
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.dependencies import get_user_repository, get_current_user
+from app.api.responses import model_response
 from app.models.user_model import UserModel
 from app.repositories.errors import UniqueViolationError, RepositoryError
 from app.repositories.user_repository import UserRepository
@@ -17,7 +18,7 @@ router = APIRouter()
 )
 async def register_user(data: UserCreate, repo: UserRepository = Depends(
     get_user_repository
-)) -> UserPublic:
+)) -> UserPublic | Response:
     try:
         user = await AuthService.register_user(data, repo)
     except UniqueViolationError as e:
@@ -29,7 +30,10 @@ async def register_user(data: UserCreate, repo: UserRepository = Depends(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="internal error"
         )
-    return UserPublic.model_validate(user)
+    return model_response(
+        UserPublic.model_validate(user), status_code=status.HTTP_201_CREATED,
+        by_alias=True,
+    )
 
 
 @router.post(
@@ -39,7 +43,7 @@ async def register_user(data: UserCreate, repo: UserRepository = Depends(
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     repo: UserRepository = Depends(get_user_repository),
-) -> Token:
+) -> Token | Response:
     user = await AuthService.authenticate_user(
         form_data.username, form_data.password, repo
     )
@@ -49,12 +53,15 @@ async def login(
             detail="Incorrect username or password"
         )
     token = AuthService.mint_access_token(user.id or "")
-    return Token(access_token=token)
+    return model_response(Token(access_token=token), by_alias=True)
 
 
 @router.get(
     "/me", response_model=UserPublic, summary="Get current user profile"
 )
 async def me(
-    current_user: UserModel = Depends(get_current_user)) -> UserPublic:
-    return UserPublic.model_validate(current_user)
+    current_user: UserModel = Depends(get_current_user)
+) -> UserPublic | Response:
+    return model_response(
+        UserPublic.model_validate(current_user), by_alias=True
+    )
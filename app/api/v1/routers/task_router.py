@@ -1,16 +1,60 @@
-from fastapi import APIRouter, status, Depends, Response, Request
+from typing import List, Optional
 
-from app.api.dependencies import get_task_repository, get_current_user
+from fastapi import APIRouter, status, Depends, Response, Request, Header, \
+    Query, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies import get_task_repository, get_current_user, \
+    get_task_change_stream
+from app.api.idempotency import Idempotency, get_idempotency
+from app.api.etag import task_etag, list_etag, if_none_match, \
+    expected_version
+from app.api.responses import model_response, json_response
+from app.core.config import settings
+from app.core.response_cache import get_response_cache
+from app.models.task_model import TaskModel
 from app.models.user_model import UserModel
+from app.repositories.errors import RepositoryError, UniqueViolationError, \
+    NotFoundError, InvalidIdError
+from app.repositories.task_change_stream import TaskChangeStream
 from app.repositories.task_repository import TaskRepository, TaskId
 from app.schemas.task_schema import (
     TaskCreate, TaskResponse, TaskList, TaskQueryParams, TaskPutUpdate,
-    TaskPatchUpdate, PageMeta
+    TaskPatchUpdate, PageMeta, TaskBulkCreate, TaskBulkPatch, TaskBulkDelete,
+    TaskBulkResult, TaskBulkItemResult, TaskExportParams, TaskStatsResponse,
+    TaskBatchGet
 )
+from app.services.task_events import get_task_event_hub, stream_events
+from app.services.task_export import EXPORT_MEDIA_TYPES
 from app.services.task_service import TaskService
 
 router = APIRouter()
 
+_BULK_ERROR_STATUS = (
+    (UniqueViolationError, "conflict"),
+    (NotFoundError, "not_found"),
+    (InvalidIdError, "invalid_id"),
+)
+
+
+def _bulk_item(index: int, outcome: TaskModel | RepositoryError | None,
+               success: str, task_id: Optional[str] = None
+               ) -> TaskBulkItemResult:
+    if isinstance(outcome, RepositoryError):
+        item_status = next(
+            (s for cls, s in _BULK_ERROR_STATUS if isinstance(outcome, cls)),
+            "error",
+        )
+        return TaskBulkItemResult(
+            index=index, id=task_id, status=item_status, detail=str(outcome)
+        )
+    if outcome is None:
+        return TaskBulkItemResult(index=index, id=task_id, status=success)
+    return TaskBulkItemResult(
+        index=index, id=outcome.id, status=success,
+        task=TaskResponse.from_model(outcome),
+    )
+
 
 @router.post(
     "/",
@@ -23,17 +67,240 @@ async def create_task(
     task_data: TaskCreate,
     request: Request,
     response: Response,
+    idempotency: Idempotency = Depends(get_idempotency),
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskResponse | Response:
+    async def create() -> TaskResponse:
+        task = await TaskService.create_task(
+            owner_id=current_user.id or "", task_data=task_data,
+            repository=repository
+        )
+        response.headers["Location"] = str(
+            request.url_for("get_task", task_id=task.id)
+        )
+        response.headers["ETag"] = task_etag(task)
+        return TaskResponse.from_model(task)
+
+    return await idempotency.run(
+        request, response, task_data, create, status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResult,
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+    summary="Create many tasks in one batch",
+)
+async def create_tasks_bulk(
+    data: TaskBulkCreate,
+    request: Request,
+    response: Response,
+    idempotency: Idempotency = Depends(get_idempotency),
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskBulkResult | Response:
+    async def create() -> TaskBulkResult:
+        outcomes = await TaskService.create_tasks(
+            owner_id=current_user.id or "", items=data.items,
+            repository=repository
+        )
+        return TaskBulkResult(items=[
+            _bulk_item(i, outcome, "created")
+            for i, outcome in enumerate(outcomes)
+        ])
+
+    return await idempotency.run(request, response, data, create)
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkResult,
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+    summary="Patch many tasks in one batch",
+)
+async def patch_tasks_bulk(
+    data: TaskBulkPatch,
+    request: Request,
+    response: Response,
+    idempotency: Idempotency = Depends(get_idempotency),
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskBulkResult | Response:
+    async def patch() -> TaskBulkResult:
+        updates = [
+            (item.id, item.model_dump(exclude_unset=True, exclude={"id"}))
+            for item in data.items
+        ]
+        outcomes = await TaskService.patch_tasks(
+            owner_id=current_user.id or "", updates=updates,
+            repository=repository
+        )
+        return TaskBulkResult(items=[
+            _bulk_item(i, outcome, "updated", task_id=item.id)
+            for i, (item, outcome) in enumerate(zip(data.items, outcomes))
+        ])
+
+    return await idempotency.run(request, response, data, patch)
+
+
+@router.delete(
+    "/bulk",
+    response_model=TaskBulkResult,
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+    summary="Delete many tasks in one batch",
+)
+async def delete_tasks_bulk(
+    data: TaskBulkDelete,
+    request: Request,
+    response: Response,
+    idempotency: Idempotency = Depends(get_idempotency),
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskBulkResult | Response:
+    async def delete() -> TaskBulkResult:
+        outcomes = await TaskService.delete_tasks(
+            owner_id=current_user.id or "", task_ids=data.ids,
+            repository=repository
+        )
+        return TaskBulkResult(items=[
+            _bulk_item(i, outcome, "deleted", task_id=task_id)
+            for i, (task_id, outcome) in enumerate(zip(data.ids, outcomes))
+        ])
+
+    return await idempotency.run(request, response, data, delete)
+
+
+async def _batch_result(ids: List[str], owner_id: str,
+                        repository: TaskRepository) -> TaskBulkResult:
+    outcomes = await TaskService.get_tasks(
+        owner_id=owner_id, task_ids=ids, repository=repository
+    )
+    return TaskBulkResult(items=[
+        _bulk_item(i, outcome, "found", task_id=task_id)
+        for i, (task_id, outcome) in enumerate(zip(ids, outcomes))
+    ])
+
+
+@router.get(
+    "/batch",
+    response_model=TaskBulkResult,
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+    summary="Get many tasks by id",
+)
+async def get_tasks_batch(
+    params: TaskBatchGet = Query(),
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskBulkResult | Response:
+    """
+    One result per id, in the order given: ``found`` with the task,
+    ``not_found`` or ``invalid_id``. Use POST for long lists.
+    """
+    return model_response(await _batch_result(
+        params.ids, current_user.id or "", repository
+    ))
+
+
+@router.post(
+    "/batch",
+    response_model=TaskBulkResult,
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+    summary="Get many tasks by id (ids in the body)",
+)
+async def post_tasks_batch(
+    data: TaskBatchGet,
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskBulkResult | Response:
+    return model_response(await _batch_result(
+        data.ids, current_user.id or "", repository
+    ))
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Task counts by status and priority",
+)
+async def get_task_stats(
+    repository: TaskRepository = Depends(get_task_repository),
+    current_user: UserModel = Depends(get_current_user),
+) -> TaskStatsResponse | Response:
+    stats = await TaskService.get_stats(
+        owner_id=current_user.id or "", repository=repository
+    )
+    return model_response(
+        TaskStatsResponse.model_validate(stats, from_attributes=True)
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Export all tasks as NDJSON or CSV",
+)
+async def export_tasks(
+    params: TaskExportParams = Depends(),
     repository: TaskRepository = Depends(get_task_repository),
     current_user: UserModel = Depends(get_current_user),
-) -> TaskResponse:
-    task = await TaskService.create_task(
-        owner_id=current_user.id or "", task_data=task_data,
-        repository=repository
+) -> StreamingResponse:
+    body = TaskService.export_tasks(
+        owner_id=current_user.id or "", params=params, repository=repository
     )
-    response.headers["Location"] = str(
-        request.url_for("get_task", task_id=task.id)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[params.format],
+        headers={
+            "Content-Disposition":
+                f'attachment; filename="tasks.{params.format}"'
+        },
+    )
+
+
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream task changes as server-sent events",
+)
+async def task_events(
+    last_event_id: Optional[str] = None,
+    last_event_id_header: Optional[str] = Header(
+        default=None, alias="Last-Event-ID"
+    ),
+    change_stream: TaskChangeStream = Depends(get_task_change_stream),
+    current_user: UserModel = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    ``created``/``updated`` events carry the task, ``deleted`` its id.
+    Reconnect with Last-Event-ID to get missed events; a ``reset`` event
+    means they are gone and the client should refetch the list.
+    """
+    hub = get_task_event_hub()
+    if not await hub.ensure_pump(change_stream):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="task events are not available",
+        )
+    subscription = hub.subscribe(
+        current_user.id or "", last_event_id_header or last_event_id
+    )
+    return StreamingResponse(
+        stream_events(
+            hub, subscription, settings.task_events_heartbeat_seconds
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    return TaskResponse.model_validate(task)
 
 
 @router.get(
@@ -46,13 +313,23 @@ async def create_task(
 )
 async def get_task(
     task_id: TaskId,
+    response: Response,
+    if_none_match_header: Optional[str] = Header(
+        default=None, alias="If-None-Match"
+    ),
     repository: TaskRepository = Depends(get_task_repository),
     current_user: UserModel = Depends(get_current_user),
-) -> TaskResponse:
+) -> TaskResponse | Response:
     task = await TaskService.get_task(
         task_id, owner_id=current_user.id or "", repository=repository
     )
-    return TaskResponse.model_validate(task)
+    etag = task_etag(task)
+    if if_none_match(if_none_match_header, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+    return model_response(TaskResponse.from_model(task), response)
 
 
 @router.get(
@@ -63,20 +340,52 @@ async def get_task(
     summary="List tasks",
 )
 async def list_tasks(
+    response: Response,
     params: TaskQueryParams = Depends(),
+    if_none_match_header: Optional[str] = Header(
+        default=None, alias="If-None-Match"
+    ),
     repository: TaskRepository = Depends(get_task_repository),
     current_user: UserModel = Depends(get_current_user),
-) -> TaskList:
-    items, total = await TaskService.list_tasks(
-        owner_id=current_user.id or "", params=params, repository=repository
+) -> TaskList | Response:
+    owner_id = current_user.id or ""
+    cache = get_response_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = await cache.key(owner_id, params.model_dump_json())
+        cached = await cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            etag, body = cached
+            if if_none_match(if_none_match_header, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+            return json_response(body, headers={"ETag": etag})
+
+    items, total, next_cursor = await TaskService.list_tasks(
+        owner_id=owner_id, params=params, repository=repository
     )
-    return TaskList(
-        items=[TaskResponse.model_validate(t) for t in items],
+    etag = list_etag(items, params.model_dump_json(), total, next_cursor)
+    if if_none_match(if_none_match_header, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    page = TaskList(
+        items=[TaskResponse.from_model(t) for t in items],
         meta=PageMeta(
-            total=total, limit=params.limit, skip=params.skip,
-            sort=params.sort, sort_dir=params.sort_dir
+            total=total, count=params.count, limit=params.limit,
+            skip=params.skip,
+            sort=params.sort, sort_dir=params.sort_dir,
+            next_cursor=next_cursor,
         ),
     )
+    if cache_key is not None:
+        body = page.model_dump_json().encode()
+        await cache.set(cache_key, etag, body)
+        return json_response(body, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return model_response(page, response)
 
 
 @router.put(
@@ -89,14 +398,18 @@ async def list_tasks(
 async def replace_task(
     task_id: TaskId,
     data: TaskPutUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(default=None, alias="If-Match"),
     repository: TaskRepository = Depends(get_task_repository),
     current_user: UserModel = Depends(get_current_user),
-) -> TaskResponse:
+) -> TaskResponse | Response:
     task = await TaskService.replace_task(
         task_id, owner_id=current_user.id or "", data=data,
-        repository=repository
+        repository=repository,
+        expected_version=expected_version(if_match, task_id),
     )
-    return TaskResponse.model_validate(task)
+    response.headers["ETag"] = task_etag(task)
+    return model_response(TaskResponse.from_model(task), response)
 
 
 @router.patch(
@@ -109,15 +422,19 @@ async def replace_task(
 async def patch_task(
     task_id: TaskId,
     data: TaskPatchUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(default=None, alias="If-Match"),
     repository: TaskRepository = Depends(get_task_repository),
     current_user: UserModel = Depends(get_current_user),
-) -> TaskResponse:
+) -> TaskResponse | Response:
     payload = {k: v for k, v in data.model_dump(exclude_unset=True).items()}
     task = await TaskService.patch_task(
         task_id, owner_id=current_user.id or "", data=payload,
-        repository=repository
+        repository=repository,
+        expected_version=expected_version(if_match, task_id),
     )
-    return TaskResponse.model_validate(task)
+    response.headers["ETag"] = task_etag(task)
+    return model_response(TaskResponse.from_model(task), response)
 
 
 @router.delete(
@@ -0,0 +1,84 @@
+"""
+Operational commands, run with the same environment as the API:
+
+    python -m app.cli rebuild-task-stats [--owner-id ID]
+    python -m app.cli migrate-indexes [--dry-run]
+    python -m app.cli archive-tasks [--max-batches N]
+"""
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from app.core.config import settings
+from app.core.database import get_client, close_client
+from app.core.indexes import plan_all_indexes, ensure_indexes
+from app.repositories.task_archive_mongo import TaskArchiveStore
+from app.repositories.task_repository_mongo import TaskRepositoryImpl
+from app.services.task_archiver import build_task_archiver
+
+
+async def rebuild_task_stats(owner_id: Optional[str]) -> None:
+    db = get_client()[settings.mongo_db]
+    owners = await TaskRepositoryImpl(db).rebuild_stats(owner_id)
+    print(f"rebuilt task stats for {owners} owner(s)")
+
+
+async def migrate_indexes(dry_run: bool) -> None:
+    db = get_client()[settings.mongo_db]
+    for name, plan in (await plan_all_indexes(db)).items():
+        create = [m.document["name"] for m in plan.create]
+        print(f"{name}: create {create or '-'}, drop {plan.drop or '-'}, "
+              f"set {sorted(plan.options) or '-'}")
+    if not dry_run:
+        await ensure_indexes(db, wait=True)
+        print("indexes in sync")
+
+
+async def archive_tasks(max_batches: Optional[int]) -> None:
+    db = get_client()[settings.mongo_db]
+    archiver = build_task_archiver(TaskArchiveStore(db))
+    moved = await archiver.run_once(max_batches)
+    print(f"archived {moved} task(s)")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser(
+        "rebuild-task-stats",
+        help="Recompute per-owner task counters with one aggregation",
+    )
+    rebuild.add_argument("--owner-id", default=None)
+
+    migrate = commands.add_parser(
+        "migrate-indexes",
+        help="Create missing/changed indexes in one batch per collection "
+             "(waits for the index lock)",
+    )
+    migrate.add_argument("--dry-run", action="store_true",
+                         help="only print what would change")
+
+    archive = commands.add_parser(
+        "archive-tasks",
+        help="Move resolved tasks older than TASK_ARCHIVE_AFTER_DAYS to "
+             "tasks_archive now",
+    )
+    archive.add_argument("--max-batches", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "rebuild-task-stats":
+            asyncio.run(rebuild_task_stats(args.owner_id))
+        elif args.command == "migrate-indexes":
+            asyncio.run(migrate_indexes(args.dry_run))
+        elif args.command == "archive-tasks":
+            asyncio.run(archive_tasks(args.max_batches))
+    finally:
+        close_client()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
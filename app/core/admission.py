@@ -0,0 +1,125 @@
+import asyncio
+import functools
+import math
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.errors import ServiceOverloadedError
+from app.core.metrics import Counter, Histogram
+
+T = TypeVar("T")
+
+ADMISSION_WAIT = Histogram(
+    "admission_wait_seconds",
+    "Time a repository operation waited for a database slot.",
+)
+ADMISSION_REJECTED = Counter(
+    "admission_rejected_total",
+    "Repository operations shed before reaching the Mongo pool.",
+    labelnames=("reason",),
+)
+
+# Set while the current task holds a slot: nested repository calls (and
+# tasks they gather) run under the caller's slot instead of taking a second
+# one, which could deadlock once every slot is held by a waiting caller.
+_admitted: ContextVar[bool] = ContextVar("admitted", default=False)
+
+# Weight of the latest operation in the service time estimate
+_EWMA_ALPHA = 0.1
+
+
+class DatabaseBusyError(ServiceOverloadedError):
+    DEFAULT_MESSAGE = "database is temporarily overloaded"
+
+
+class AdmissionController:
+    """
+    Cap concurrent repository operations per worker below the Mongo pool.
+
+    At most ``limit`` operations run; up to ``max_queue`` more may wait, each
+    for at most ``max_wait`` seconds. A caller is rejected right away when
+    the queue is full or when the expected wait (queue position times the
+    average operation time) already exceeds ``max_wait``, so overload turns
+    into fast 503s instead of requests stuck inside the driver until its
+    timeouts fire.
+    """
+
+    def __init__(self, limit: int, max_queue: int, max_wait: float) -> None:
+        self._limit = limit
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._slots = asyncio.Semaphore(limit)
+        self._waiting = 0
+        self._service_time = 0.0
+        self._retry_after = max(1, math.ceil(max_wait))
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        if _admitted.get():
+            return await fn()
+        await self._acquire()
+        token = _admitted.set(True)
+        started_at = time.perf_counter()
+        try:
+            return await fn()
+        finally:
+            _admitted.reset(token)
+            self._slots.release()
+            elapsed = time.perf_counter() - started_at
+            self._service_time += _EWMA_ALPHA * (elapsed - self._service_time)
+
+    async def _acquire(self) -> None:
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return
+        if self._waiting >= self._max_queue:
+            self._reject("queue_full")
+        expected = (self._waiting + 1) / self._limit * self._service_time
+        if expected > self._max_wait:
+            self._reject("deadline")
+
+        enqueued_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._max_wait)
+        except asyncio.TimeoutError:
+            self._reject("timeout")
+        finally:
+            self._waiting -= 1
+        ADMISSION_WAIT.observe(time.perf_counter() - enqueued_at)
+
+    def _reject(self, reason: str) -> None:
+        ADMISSION_REJECTED.labels(reason).inc()
+        raise DatabaseBusyError(retry_after=self._retry_after)
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """
+    Provide the per-worker admission controller singleton.
+    """
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(
+            limit=settings.admission_max_concurrency,
+            max_queue=settings.admission_max_queue,
+            max_wait=settings.admission_max_wait_ms / 1000,
+        )
+    return _controller
+
+
+def admitted(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Run a repository coroutine method under the admission controller.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> T:
+        return await get_admission_controller().run(
+            lambda: fn(*args, **kwargs)
+        )
+
+    return wrapper
@@ -0,0 +1,66 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.core.metrics import Counter
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CACHE_HITS = Counter(
+    "cache_hits_total", "In-process cache hits.", labelnames=("cache",)
+)
+CACHE_MISSES = Counter(
+    "cache_misses_total", "In-process cache misses.", labelnames=("cache",)
+)
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded per-worker cache with LRU eviction and per-entry expiry.
+
+    Intended to be used from the event loop only (no locking).
+    """
+
+    def __init__(self, name: str, max_size: int, ttl_seconds: float) -> None:
+        self.name = name
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._hits = CACHE_HITS.labels(name)
+        self._misses = CACHE_MISSES.labels(name)
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self._hits.inc()
+                return value
+            del self._data[key]
+        self._misses.inc()
+        return None
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value``; ``ttl`` may only shorten the configured TTL.
+        """
+        if self._max_size <= 0:
+            return
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
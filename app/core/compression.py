@@ -0,0 +1,108 @@
+import zlib
+from typing import Callable, Dict, List, Optional, Protocol
+
+# brotli and zstandard are optional: their encodings are offered only when
+# the package is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        """
+        Compress ``data``; with ``flush`` also emit everything buffered so
+        far, so a streamed chunk reaches the client without waiting.
+        """
+        ...
+
+    def finish(self) -> bytes:
+        ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(
+            min(max(level, 1), 9), zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        out = self._obj.compress(data)
+        if flush:
+            out += self._obj.flush(zlib.Z_SYNC_FLUSH)
+        return out
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        self._obj = brotli.Compressor(quality=min(max(level, 0), 11))
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        out = self._obj.process(data)
+        if flush:
+            out += self._obj.flush()
+        return out
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._obj = zstandard.ZstdCompressor(
+            level=min(max(level, 1), 22)
+        ).compressobj()
+
+    def compress(self, data: bytes, flush: bool) -> bytes:
+        out = self._obj.compress(data)
+        if flush:
+            out += self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        return out
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_compressors() -> Dict[str, Callable[[int], Compressor]]:
+    """
+    Content-coding name -> factory taking the compression level.
+    """
+    codecs: Dict[str, Callable[[int], Compressor]] = {"gzip": GzipCompressor}
+    if brotli is not None:
+        codecs["br"] = BrotliCompressor
+    if zstandard is not None:
+        codecs["zstd"] = ZstdCompressor
+    return codecs
+
+
+def negotiate(accept_encoding: str, preferred: List[str]) -> Optional[str]:
+    """
+    Pick the coding to use from an Accept-Encoding header: the client's
+    highest q-value wins, ties go to the first in ``preferred``.
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        accepted[name.strip()] = q
+    best, best_q = None, 0.0
+    for coding in preferred:
+        q = accepted.get(coding, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
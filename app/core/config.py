@@ -1,7 +1,7 @@
 import os
 from enum import StrEnum
 from pathlib import Path
-from pydantic import SecretStr
+from pydantic import SecretStr, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +11,17 @@ class AppMode(StrEnum):
     production = "production"
 
 
+class RepositoryBackend(StrEnum):
+    mongo = "mongo"
+    memory = "memory"
+
+
+class ResponseCacheBackend(StrEnum):
+    none = "none"
+    memory = "memory"
+    redis = "redis"
+
+
 # Fail fast if APP_MODE is not provided or invalid
 try:
     _APP_MODE_RAW = os.environ["APP_MODE"]
@@ -41,6 +52,9 @@ class Settings(BaseSettings):
     app_host: str
     app_port: int
 
+    # --- Storage ---
+    repository_backend: RepositoryBackend
+
     # --- MongoDB ---
     mongo_url: str
     mongo_db: str
@@ -52,12 +66,76 @@ class Settings(BaseSettings):
     mongo_max_connecting: int
     mongo_max_idle_time_ms: int
     mongo_compressors: str
+    mongo_sync_indexes_on_startup: bool
 
     # --- Auth/JWT ---
     jwt_secret_key: SecretStr
     jwt_algorithm: str
     access_token_expire_minutes: int
 
+    # --- Debug ---
+    strict_read_validation: bool
+
+    # --- Responses ---
+    fast_json_responses: bool
+    compression_encodings: str
+    compression_min_size: int
+    compression_level: int
+
+    # --- Tasks ---
+    task_bulk_max_items: int
+    task_count_estimate_cap: int
+    task_export_batch_size: int
+    task_archive_enabled: bool
+    task_archive_after_days: int
+    task_archive_batch_size: int
+    task_archive_batch_pause_ms: int
+    task_archive_interval_seconds: int
+
+    # --- Idempotency keys ---
+    idempotency_ttl_seconds: int
+    idempotency_lease_seconds: int
+    idempotency_wait_ms: int
+    idempotency_cache_max_size: int
+
+    # --- Password hashing ---
+    password_hash_workers: int
+    password_hash_max_queue: int
+
+    # --- Admission control ---
+    admission_max_concurrency: int
+    admission_max_queue: int
+    admission_max_wait_ms: int
+    rate_limit_per_second: float
+    rate_limit_burst: int
+    rate_limit_max_users: int
+
+    # --- Caches ---
+    user_cache_max_size: int
+    user_cache_ttl_seconds: int
+    jwt_claims_cache_max_size: int
+    jwt_claims_cache_ttl_seconds: int
+    response_cache_backend: ResponseCacheBackend
+    response_cache_ttl_seconds: int
+    response_cache_max_bytes: int
+    response_cache_redis_url: str
+
+    # --- Slow query log ---
+    slow_query_log_enabled: bool
+    slow_query_threshold_ms: int
+    slow_query_sample_rate: float = Field(ge=0.0, le=1.0)
+    slow_query_explain: bool
+    slow_query_log_file: str
+    slow_query_log_max_bytes: int
+    slow_query_log_backup_count: int
+
+    # --- Task events (SSE) ---
+    task_events_enabled: bool
+    task_events_client_buffer: int
+    task_events_replay_size: int
+    task_events_heartbeat_seconds: int
+    task_events_max_clients: int
+
     model_config = SettingsConfigDict(
         env_file=_detect_env_file(),
         env_file_encoding="utf-8",
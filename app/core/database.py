@@ -3,6 +3,10 @@ from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.core.config import settings
+from app.core.mongo_monitoring import CommandMetricsListener, \
+    PoolMetricsListener
+from app.core.slow_query import get_slow_query_listener, \
+    close_slow_query_listener
 
 _DATABASE_URL: str = settings.mongo_url
 _DATABASE_NAME: str = settings.mongo_db
@@ -14,6 +18,7 @@ _SOCKET_TIMEOUT_MS: int = settings.mongo_socket_timeout_ms
 _MAX_CONNECTING: int = settings.mongo_max_connecting
 _MAX_IDLE_TIME_MS: int = settings.mongo_max_idle_time_ms
 _COMPRESSORS: str = settings.mongo_compressors
+_SLOW_QUERY_LOG_ENABLED: bool = settings.slow_query_log_enabled
 
 _client: Optional[AsyncIOMotorClient] = None
 
@@ -24,6 +29,9 @@ def get_client() -> AsyncIOMotorClient:
     """
     global _client
     if _client is None:
+        listeners = [CommandMetricsListener(), PoolMetricsListener()]
+        if _SLOW_QUERY_LOG_ENABLED:
+            listeners.append(get_slow_query_listener())
         kwargs = dict(
             maxPoolSize=_MAX_POOL_SIZE,
             minPoolSize=_MIN_POOL_SIZE,
@@ -36,6 +44,7 @@ def get_client() -> AsyncIOMotorClient:
             retryWrites=True,
             retryReads=True,
             uuidRepresentation="standard",
+            event_listeners=listeners,
         )
         if _COMPRESSORS.strip():
             kwargs["compressors"] = _COMPRESSORS
@@ -60,3 +69,4 @@ def close_client() -> None:
     if _client is not None:
         _client.close()
         _client = None
+    close_slow_query_listener()
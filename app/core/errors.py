@@ -0,0 +1,49 @@
+from typing import Optional
+
+
+class ServiceOverloadedError(Exception):
+    """Raised when a bounded resource cannot accept more work right now."""
+    DEFAULT_MESSAGE = "service temporarily overloaded"
+
+    def __init__(self, message: Optional[str] = None,
+                 retry_after: int = 1) -> None:
+        super().__init__(message or self.DEFAULT_MESSAGE)
+        self.retry_after = retry_after
+
+
+class RateLimitedError(Exception):
+    """Raised when a caller exceeds its request rate."""
+    DEFAULT_MESSAGE = "too many requests"
+
+    def __init__(self, message: Optional[str] = None,
+                 retry_after: int = 1) -> None:
+        super().__init__(message or self.DEFAULT_MESSAGE)
+        self.retry_after = retry_after
+
+
+class IdempotencyInProgressError(Exception):
+    """Raised when a request with the same Idempotency-Key is still running."""
+    DEFAULT_MESSAGE = "a request with this Idempotency-Key is in progress"
+
+    def __init__(self, message: Optional[str] = None,
+                 retry_after: int = 1) -> None:
+        super().__init__(message or self.DEFAULT_MESSAGE)
+        self.retry_after = retry_after
+
+
+class IdempotencyKeyReusedError(Exception):
+    """Raised when an Idempotency-Key is sent again with a different body."""
+    DEFAULT_MESSAGE = "Idempotency-Key was already used for another request"
+
+    def __init__(self, message: Optional[str] = None) -> None:
+        super().__init__(message or self.DEFAULT_MESSAGE)
+
+
+class ConcurrentUpdateError(Exception):
+    """Raised when a write keeps losing to concurrent writes."""
+    DEFAULT_MESSAGE = "resource is being modified concurrently; retry"
+
+    def __init__(self, message: Optional[str] = None,
+                 retry_after: int = 1) -> None:
+        super().__init__(message or self.DEFAULT_MESSAGE)
+        self.retry_after = retry_after
@@ -1,52 +1,296 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pymongo.collation import Collation
+from pymongo.errors import OperationFailure
 
+from app.core.config import settings
+from app.core.locks import acquire_lock, release_lock
+
+logger = logging.getLogger(__name__)
+
+TASK_SORT_FIELDS = ("created_at", "updated_at")
+TASK_FILTER_SHAPES = ((), ("status",), ("priority",), ("status", "priority"))
+LEGACY_TASK_INDEXES = (
+    "idx_tasks_created_at", "idx_tasks_updated_at", "idx_tasks_status",
+    "idx_tasks_priority",
+)
+
+INDEX_LOCK_ID = "indexes"
+# A crashed holder's lock is ignored after this long
+INDEX_LOCK_TTL = timedelta(minutes=10)
+INDEX_LOCK_POLL_SECONDS = 1.0
 
-async def init_task_indexes(db: AsyncIOMotorDatabase) -> None:
-    """
-    Create indexes for the 'tasks' collection.
-    """
-    tasks = db["tasks"]
 
+def _task_index_name(equality: tuple, sort_field: str,
+                     prefix: str = "idx_tasks") -> str:
+    return "_".join([f"{prefix}_owner", *equality, sort_field, "id"])
+
+
+def _owner_list_indexes(shapes: tuple,
+                        prefix: str = "idx_tasks") -> List[IndexModel]:
+    # Every list/count query is owner_id equality, optional status and/or
+    # priority equality, then a range/sort on (sort field, _id). Following
+    # ESR (equality, sort, range) there is one index per filter shape and
+    # sort field, so no query needs a COLLSCAN or an in-memory SORT.
+    # Descending keys are walked backwards for ascending sorts.
+    return [
+        IndexModel(
+            [("owner_id", ASCENDING)]
+            + [(field, ASCENDING) for field in equality]
+            + [(sort_field, DESCENDING), ("_id", DESCENDING)],
+            name=_task_index_name(equality, sort_field, prefix),
+        )
+        for sort_field in TASK_SORT_FIELDS
+        for equality in shapes
+    ]
+
+
+def _task_indexes() -> List[IndexModel]:
     # Unique title per owner (case-insensitive)
-    await tasks.create_index(
+    indexes = [IndexModel(
         [("owner_id", ASCENDING), ("title", ASCENDING)],
         name="uniq_owner_title",
         unique=True,
         collation=Collation(locale="en", strength=2),
-    )
+    )]
+    indexes.extend(_owner_list_indexes(TASK_FILTER_SHAPES))
+    # Archive candidates only: partial, so it holds just the resolved
+    # tasks still in the hot collection
+    indexes.append(IndexModel(
+        [("updated_at", ASCENDING), ("created_at", ASCENDING)],
+        name="idx_tasks_resolved_updated_at_created_at",
+        partialFilterExpression={"status": "resolved"},
+    ))
+    return indexes
+
+
+def _task_archive_indexes() -> List[IndexModel]:
+    # Everything archived is resolved, so status adds nothing to the key
+    return _owner_list_indexes(((), ("priority",)), "idx_tasks_archive")
+
+
+def _idempotency_indexes() -> List[IndexModel]:
+    # Keys are looked up by _id only; this just expires them
+    return [IndexModel(
+        [("expires_at", ASCENDING)], name="idx_idempotency_expires_at",
+        expireAfterSeconds=0,
+    )]
+
+
+def _user_indexes() -> List[IndexModel]:
+    return [
+        IndexModel(
+            [("username", ASCENDING)], unique=True, name="uniq_username",
+            collation=Collation(locale="en", strength=2)
+        ),
+        IndexModel(
+            [("email", ASCENDING)], unique=True, name="uniq_email",
+            collation=Collation(locale="en", strength=2)
+        ),
+        IndexModel([("created_at", DESCENDING)], name="idx_users_created_at"),
+    ]
+
+
+# Declarative spec: every index the app needs, per collection, plus
+# indexes that must be gone
+INDEX_SPEC: Dict[str, List[IndexModel]] = {
+    "users": _user_indexes(),
+    "tasks": _task_indexes(),
+    "tasks_archive": _task_archive_indexes(),
+    "idempotency_keys": _idempotency_indexes(),
+}
+OBSOLETE_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "tasks": LEGACY_TASK_INDEXES,
+}
+
+
+def _collection_options() -> Dict[str, dict]:
+    """
+    collMod options the app relies on, applied together with the indexes
+    (so by a privileged deploy step, not from request handling).
+    """
+    options: Dict[str, dict] = {}
+    if settings.task_events_enabled:
+        # The event stream routes deletes to an owner by their pre-image.
+        # MongoDB then stores a pre-image for every update, replace and
+        # delete on tasks (one extra write each, kept until
+        # changeStreamOptions.preAndPostImages.expireAfterSeconds).
+        options["tasks"] = {
+            "changeStreamPreAndPostImages": {"enabled": True}
+        }
+    return options
+
+
+@dataclass
+class IndexPlan:
+    create: List[IndexModel] = field(default_factory=list)
+    drop: List[str] = field(default_factory=list)
+    # collMod to apply once the indexes are built
+    options: dict = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.create or self.drop or self.options)
+
+
+def _matches(existing: dict, wanted: dict) -> bool:
+    if list(existing["key"].items()) != list(wanted["key"].items()):
+        return False
+    if bool(existing.get("unique")) != bool(wanted.get("unique")):
+        return False
+    if existing.get("partialFilterExpression") != \
+            wanted.get("partialFilterExpression"):
+        return False
+    if existing.get("expireAfterSeconds") != wanted.get("expireAfterSeconds"):
+        return False
+    wanted_collation = wanted.get("collation") or {}
+    existing_collation = existing.get("collation") or {}
+    return all(existing_collation.get(k) == v
+               for k, v in wanted_collation.items())
 
-    await tasks.create_index(
-        [("created_at", DESCENDING)], name="idx_tasks_created_at"
-    )
-    await tasks.create_index(
-        [("updated_at", DESCENDING)], name="idx_tasks_updated_at"
-    )
-    await tasks.create_index([("status", ASCENDING)], name="idx_tasks_status")
-    await tasks.create_index(
-        [("priority", ASCENDING)], name="idx_tasks_priority"
-    )
+
+def plan_indexes(existing: List[dict], wanted: List[IndexModel],
+                 obsolete: Tuple[str, ...] = ()) -> IndexPlan:
+    """
+    Diff ``list_indexes()`` output against the spec. An index whose
+    definition changed under the same name is dropped and recreated.
+    """
+    by_name = {info["name"]: info for info in existing}
+    plan = IndexPlan()
+    for model in wanted:
+        doc = model.document
+        current = by_name.get(doc["name"])
+        if current is None:
+            plan.create.append(model)
+        elif not _matches(current, doc):
+            plan.drop.append(doc["name"])
+            plan.create.append(model)
+    plan.drop.extend(name for name in obsolete if name in by_name)
+    return plan
+
+
+async def _missing_options(db: AsyncIOMotorDatabase, name: str,
+                           wanted: dict) -> dict:
+    cursor = await db.list_collections(filter={"name": name})
+    infos = await cursor.to_list(None)
+    current = infos[0].get("options", {}) if infos else {}
+    return {k: v for k, v in wanted.items() if current.get(k) != v}
+
+
+async def plan_all_indexes(db: AsyncIOMotorDatabase) -> Dict[str, IndexPlan]:
+    plans = {}
+    options = _collection_options()
+    for name, wanted in INDEX_SPEC.items():
+        existing = await db[name].list_indexes().to_list(None)
+        plans[name] = plan_indexes(
+            existing, wanted, OBSOLETE_INDEXES.get(name, ())
+        )
+        if name in options:
+            plans[name].options = await _missing_options(
+                db, name, options[name]
+            )
+    return plans
+
+
+async def apply_index_plans(db: AsyncIOMotorDatabase,
+                            plans: Dict[str, IndexPlan]) -> None:
+    for name, plan in plans.items():
+        collection = db[name]
+        for index_name in plan.drop:
+            try:
+                await collection.drop_index(index_name)
+            except OperationFailure:
+                pass  # already gone
+        if plan.create:
+            # One createIndexes command: the server builds them together
+            await collection.create_indexes(plan.create)
+        if plan.create or plan.drop:
+            logger.info(
+                "indexes on %s: created %s, dropped %s", name,
+                [m.document["name"] for m in plan.create], plan.drop,
+            )
+        if plan.options:
+            # The collection exists by now: its indexes were created first
+            try:
+                await db.command("collMod", name, **plan.options)
+            except OperationFailure as e:
+                logger.warning("cannot set %s on %s: %s",
+                               sorted(plan.options), name, e)
+            else:
+                logger.info("options on %s: set %s", name,
+                            sorted(plan.options))
+
+
+async def sync_indexes(db: AsyncIOMotorDatabase) -> Dict[str, IndexPlan]:
+    """
+    Bring every collection's indexes in line with INDEX_SPEC; a no-op
+    (one listIndexes per collection) when nothing changed.
+    """
+    plans = await plan_all_indexes(db)
+    await apply_index_plans(db, plans)
+    return plans
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase, wait: bool) -> bool:
+    """
+    Cluster-safe index sync. Workers first diff without locking (the
+    common, nothing-to-do case); only if something is missing does one
+    process take the lock document and build. With ``wait=False`` a worker
+    that loses the race returns False immediately instead of blocking its
+    startup; with ``wait=True`` (migrate-indexes) it waits its turn.
+    """
+    if not any((await plan_all_indexes(db)).values()):
+        return True
+
+    owner = uuid.uuid4().hex
+    while not await acquire_lock(db, INDEX_LOCK_ID, owner, INDEX_LOCK_TTL):
+        if not wait:
+            logger.info("index sync running elsewhere; not waiting")
+            return False
+        await asyncio.sleep(INDEX_LOCK_POLL_SECONDS)
+    try:
+        # Re-plan under the lock: the previous holder may have done it all
+        await sync_indexes(db)
+    finally:
+        await release_lock(db, INDEX_LOCK_ID, owner)
+    return True
+
+
+async def init_task_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create indexes for the 'tasks' collection.
+    """
+    existing = await db["tasks"].list_indexes().to_list(None)
+    await apply_index_plans(db, {"tasks": plan_indexes(
+        existing, INDEX_SPEC["tasks"], OBSOLETE_INDEXES["tasks"]
+    )})
+
+
+async def init_task_archive_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Create indexes for the 'tasks_archive' collection.
+    """
+    existing = await db["tasks_archive"].list_indexes().to_list(None)
+    await apply_index_plans(db, {"tasks_archive": plan_indexes(
+        existing, INDEX_SPEC["tasks_archive"]
+    )})
 
 
 async def init_user_indexes(db: AsyncIOMotorDatabase) -> None:
     """
     Create indexes for the 'users' collection.
     """
-    users = db["users"]
-    await users.create_index(
-        [("username", ASCENDING)], unique=True, name="uniq_username",
-        collation=Collation(locale="en", strength=2)
-    )
-    await users.create_index(
-        [("email", ASCENDING)], unique=True, name="uniq_email",
-        collation=Collation(locale="en", strength=2)
-    )
-    await users.create_index(
-        [("created_at", DESCENDING)], name="idx_users_created_at"
-    )
+    existing = await db["users"].list_indexes().to_list(None)
+    await apply_index_plans(db, {"users": plan_indexes(
+        existing, INDEX_SPEC["users"]
+    )})
 
 
 async def init_all_indexes(db: AsyncIOMotorDatabase) -> None:
-    await init_user_indexes(db)
-    await init_task_indexes(db)
+    await sync_indexes(db)
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, UTC
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+
+LOCK_COLLECTION = "locks"
+
+
+async def acquire_lock(db: AsyncIOMotorDatabase, lock_id: str, owner: str,
+                       ttl: timedelta) -> bool:
+    """
+    Take (or renew, for the same owner) the named lock document. A lock
+    whose holder crashed is taken over once ``ttl`` has passed.
+    """
+    now = datetime.now(UTC)
+    try:
+        await db[LOCK_COLLECTION].find_one_and_update(
+            {"_id": lock_id,
+             "$or": [{"expires_at": {"$lt": now}}, {"owner": owner}]},
+            {"$set": {"owner": owner, "expires_at": now + ttl}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        return False  # held by someone else and not expired
+    return True
+
+
+async def release_lock(db: AsyncIOMotorDatabase, lock_id: str,
+                       owner: str) -> None:
+    await db[LOCK_COLLECTION].delete_one({"_id": lock_id, "owner": owner})
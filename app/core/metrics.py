@@ -0,0 +1,191 @@
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0,
+)
+
+REGISTRY: List["_Metric"] = []
+
+
+class _Sharded:
+    """
+    Per-thread storage: each thread only ever writes its own shard, so the
+    hot path takes no lock. Readers sum the shards; a scrape racing a
+    write may be one observation behind, never corrupt.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: List[list] = []
+        self._shards_lock = threading.Lock()
+
+    def _new_shard(self) -> list:
+        raise NotImplementedError
+
+    def _shard(self) -> list:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+
+class _HistogramChild(_Sharded):
+    """
+    Cumulative-bucket histogram for one label set.
+
+    A shard is ``[count per bucket..., +Inf count, sum]``.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        super().__init__()
+        self._buckets = buckets
+
+    def _new_shard(self) -> list:
+        return [0] * (len(self._buckets) + 1) + [0.0]
+
+    def observe(self, value: float) -> None:
+        shard = self._shard()
+        shard[bisect_left(self._buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        counts = [0] * (len(self._buckets) + 1)
+        total = 0.0
+        for shard in list(self._shards):
+            for i in range(len(counts)):
+                counts[i] += shard[i]
+            total += shard[-1]
+        return counts, total
+
+
+class _CounterChild(_Sharded):
+    def _new_shard(self) -> list:
+        return [0.0]
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(shard[0] for shard in list(self._shards))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str,
+                 labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        return list(self._children.items())
+
+
+class Counter(_Metric):
+    """
+    Monotonic counter, optionally labelled.
+    """
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Histogram(_Metric):
+    """
+    Latency histogram (seconds), optionally labelled.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str,
+                 labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render_latest() -> str:
+    """
+    Render every registered metric in the Prometheus text exposition
+    format (version 0.0.4).
+    """
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for values, child in sorted(metric.children()):
+            if isinstance(child, _CounterChild):
+                lines.append(
+                    f"{metric.name}{_labels(metric.labelnames, values)} "
+                    f"{_number(child.value)}"
+                )
+                continue
+            counts, total = child.snapshot()
+            names = (*metric.labelnames, "le")
+            cumulative = 0
+            for bound, count in zip((*metric.buckets, math.inf), counts):
+                cumulative += count
+                lines.append(
+                    f"{metric.name}_bucket"
+                    f"{_labels(names, (*values, _number(bound)))} {cumulative}"
+                )
+            labels = _labels(metric.labelnames, values)
+            lines.append(f"{metric.name}_sum{labels} {_number(total)}")
+            lines.append(f"{metric.name}_count{labels} {cumulative}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.errors import ServiceOverloadedError
+from app.core.metrics import Counter, Histogram
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hash/verify job waited for a worker thread.",
+    labelnames=("op",),
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent inside bcrypt for a password hash/verify job.",
+    labelnames=("op",),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash/verify jobs rejected because the queue was full.",
+    labelnames=("op",),
+)
+
+
+class PasswordHasherBusyError(ServiceOverloadedError):
+    DEFAULT_MESSAGE = "authentication is temporarily overloaded"
+
+
+class PasswordHasher:
+    """
+    Run bcrypt off the event loop on a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    without the pickling overhead of a process pool. At most ``workers``
+    jobs run at once and at most ``max_queue`` more may wait; anything
+    beyond that is rejected immediately instead of piling up latency.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._capacity = workers + max_queue
+        self._in_flight = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit("hash", get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+    async def _submit(self, op: str, fn: Callable[..., T], *args) -> T:
+        if self._in_flight >= self._capacity:
+            PASSWORD_HASH_REJECTED.labels(op).inc()
+            raise PasswordHasherBusyError()
+
+        enqueued_at = time.perf_counter()
+
+        def job() -> T:
+            started_at = time.perf_counter()
+            PASSWORD_HASH_QUEUE_WAIT.labels(op).observe(
+                started_at - enqueued_at
+            )
+            try:
+                return fn(*args)
+            finally:
+                PASSWORD_HASH_DURATION.labels(op).observe(
+                    time.perf_counter() - started_at
+                )
+
+        loop = asyncio.get_running_loop()
+
+        def release(_) -> None:
+            # Runs when the job has finished (or was dropped before it
+            # started), not when its caller stops waiting: a disconnected
+            # client's bcrypt call still occupies the pool until it ends
+            try:
+                loop.call_soon_threadsafe(self._release)
+            except RuntimeError:
+                pass  # loop already closed at shutdown
+
+        self._in_flight += 1
+        try:
+            future = self._executor.submit(job)
+        except RuntimeError:
+            self._in_flight -= 1
+            raise
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """
+    Provide the per-worker password hasher singleton.
+    """
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher(
+            workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+    return _hasher
+
+
+def close_password_hasher() -> None:
+    """
+    Shut down the hashing pool and reset the singleton.
+    """
+    global _hasher
+    if _hasher is not None:
+        _hasher.shutdown()
+        _hasher = None
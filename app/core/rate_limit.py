@@ -0,0 +1,72 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.core.errors import RateLimitedError
+from app.core.metrics import Counter
+
+RATE_LIMITED = Counter(
+    "rate_limited_total",
+    "Requests rejected by the per-user token bucket.",
+)
+
+
+class TokenBucketLimiter:
+    """
+    Per-key token buckets: ``rate`` tokens per second up to ``burst``.
+
+    Buckets refill lazily on access, so idle keys cost nothing but their
+    entry; at most ``max_keys`` are kept and the least recently seen is
+    dropped first (a dropped key simply starts again with a full bucket).
+    Per worker, so the effective limit is multiplied by the worker count.
+    """
+
+    def __init__(self, rate: float, burst: int, max_keys: int) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._max_keys = max_keys
+        # key -> (tokens, monotonic time of last refill)
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: str) -> None:
+        """
+        Take one token for ``key`` or raise RateLimitedError.
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.pop(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - last) * self._rate)
+        if tokens >= 1:
+            tokens -= 1
+            self._store(key, tokens, now)
+            return
+        self._store(key, tokens, now)
+        RATE_LIMITED.inc()
+        raise RateLimitedError(
+            retry_after=max(1, math.ceil((1 - tokens) / self._rate))
+        )
+
+    def _store(self, key: str, tokens: float, now: float) -> None:
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+
+
+_limiter: Optional[TokenBucketLimiter] = None
+
+
+def get_user_rate_limiter() -> Optional[TokenBucketLimiter]:
+    """
+    Provide the per-user limiter, or None when RATE_LIMIT_PER_SECOND is 0.
+    """
+    global _limiter
+    if settings.rate_limit_per_second <= 0:
+        return None
+    if _limiter is None:
+        _limiter = TokenBucketLimiter(
+            rate=settings.rate_limit_per_second,
+            burst=settings.rate_limit_burst,
+            max_keys=settings.rate_limit_max_users,
+        )
+    return _limiter
@@ -0,0 +1,227 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Protocol, Tuple
+
+from app.core.cache import CACHE_HITS, CACHE_MISSES
+from app.core.config import settings, ResponseCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """
+    Byte store behind ResponseCache. Counters never expire or get evicted:
+    losing a generation would resurrect stale entries.
+    """
+
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        ...
+
+    async def get_counter(self, key: str) -> int:
+        ...
+
+    async def incr(self, key: str) -> int:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    Per-worker LRU bounded by the total size of the stored values.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._data: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        if len(value) > self._max_bytes:
+            return
+        self._remove(key)
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._bytes += len(value)
+        while self._bytes > self._max_bytes:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+
+    async def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+class RedisCacheBackend:
+    """
+    Shared across workers. ``client`` is anything with the redis.asyncio
+    ``get``/``set``/``incr``/``aclose`` API (e.g. fakeredis for tests).
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def get_counter(self, key: str) -> int:
+        value = await self._client.get(key)
+        return int(value) if value is not None else 0
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class ResponseCache:
+    """
+    Serialized responses keyed by (owner, generation, request key).
+
+    Every write for an owner bumps that owner's generation, which changes
+    every key built afterwards; old entries are never looked up again and
+    age out by TTL/LRU, so invalidation needs no key scans. Readers must
+    take the generation *before* querying, so a page read concurrently
+    with a write is stored under the old generation.
+
+    Backend errors degrade to cache misses; they never fail a request.
+    """
+
+    def __init__(self, name: str, backend: CacheBackend, ttl: int) -> None:
+        self.name = name
+        self._backend = backend
+        self._ttl = ttl
+        self._hits = CACHE_HITS.labels(name)
+        self._misses = CACHE_MISSES.labels(name)
+
+    def _generation_key(self, owner_id: str) -> str:
+        return f"{self.name}:gen:{owner_id}"
+
+    async def key(self, owner_id: str, request_key: str) -> Optional[str]:
+        try:
+            generation = await self._backend.get_counter(
+                self._generation_key(owner_id)
+            )
+        except Exception:
+            logger.warning("%s: generation lookup failed", self.name,
+                           exc_info=True)
+            return None
+        digest = hashlib.sha1(request_key.encode()).hexdigest()
+        return f"{self.name}:{owner_id}:{generation}:{digest}"
+
+    async def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Return ``(etag, body)`` on a hit.
+        """
+        try:
+            value = await self._backend.get(key)
+        except Exception:
+            logger.warning("%s: get failed", self.name, exc_info=True)
+            value = None
+        if value is None:
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        etag, _, body = value.partition(b"\n")
+        return etag.decode(), body
+
+    async def set(self, key: str, etag: str, body: bytes) -> None:
+        try:
+            await self._backend.set(
+                key, etag.encode() + b"\n" + body, self._ttl
+            )
+        except Exception:
+            logger.warning("%s: set failed", self.name, exc_info=True)
+
+    async def bump(self, owner_id: str) -> None:
+        try:
+            await self._backend.incr(self._generation_key(owner_id))
+        except Exception:
+            # Entries expire after the TTL at the latest
+            logger.error("%s: generation bump failed for %s", self.name,
+                         owner_id, exc_info=True)
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+
+def _build_backend() -> CacheBackend:
+    if settings.response_cache_backend == ResponseCacheBackend.redis:
+        try:
+            from redis.asyncio import from_url
+        except ImportError as e:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the redis package"
+            ) from e
+        return RedisCacheBackend(from_url(settings.response_cache_redis_url))
+    return MemoryCacheBackend(settings.response_cache_max_bytes)
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Provide the task list response cache, or None when disabled.
+    """
+    global _cache
+    if settings.response_cache_backend == ResponseCacheBackend.none:
+        return None
+    if _cache is None:
+        _cache = ResponseCache(
+            "task_list", _build_backend(),
+            ttl=settings.response_cache_ttl_seconds,
+        )
+    return _cache
+
+
+async def close_response_cache() -> None:
+    """
+    Close the backend (Redis connections) and reset the singleton.
+    """
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
+
+
+async def bump_owner_generation(owner_id: str) -> None:
+    """
+    Invalidate every cached response of ``owner_id``. Task writes call this.
+    """
+    cache = get_response_cache()
+    if cache is not None:
+        await cache.bump(owner_id)
@@ -1,22 +1,35 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List
 
-from jose import jwt, JWTError
-from passlib.context import CryptContext
+# jose (and its crypto backends) and passlib+bcrypt are imported on first
+# use, not at startup: they are a sizeable share of worker boot time and
+# most requests only need them once the caches are cold.
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+class InvalidTokenError(Exception):
+    """Raised when a JWT cannot be decoded or verified."""
+
+
+@lru_cache(maxsize=1)
+def _pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _pwd_context().verify(plain_password, hashed_password)
 
 
 def create_access_token(subject: str, minutes: int, secret: str,
                         algorithm: str) -> str:
+    from jose import jwt
+
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=minutes)
     to_encode: Dict[str, Any] = {
@@ -29,4 +42,9 @@ def create_access_token(subject: str, minutes: int, secret: str,
 
 def decode_token(token: str, secret: str, algorithms: List[str]) -> Dict[
     str, Any]:
-    return jwt.decode(token, secret, algorithms=algorithms)
+    from jose import jwt, JWTError
+
+    try:
+        return jwt.decode(token, secret, algorithms=algorithms)
+    except JWTError as e:
+        raise InvalidTokenError(str(e)) from e
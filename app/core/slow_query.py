@@ -0,0 +1,298 @@
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from pymongo import MongoClient, monitoring
+from pymongo.errors import PyMongoError
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.slow_query")
+
+# Collections written by TaskRepositoryImpl / UserRepositoryImpl
+SLOW_QUERY_COLLECTIONS = frozenset({"tasks", "users", "task_stats"})
+TRACKED_COMMANDS = frozenset({
+    "find", "aggregate", "count", "distinct", "findAndModify", "update",
+    "delete", "insert",
+})
+# Driver/session fields that must not be replayed inside explain
+_NOT_EXPLAINABLE = frozenset({
+    "lsid", "txnNumber", "autocommit", "startTransaction", "readConcern",
+    "writeConcern", "maxTimeMS",
+})
+_MAX_PENDING = 10_000
+REDACTED = "?"
+
+
+def redact(value: Any) -> Any:
+    """
+    Keep field names and operators, replace every value with ``"?"``.
+    Lists collapse to their distinct redacted shapes (``$in`` -> ["?"]).
+    """
+    if isinstance(value, dict):
+        return {k: redact(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = redact(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return REDACTED
+
+
+def _redact_pipeline(pipeline: list) -> list:
+    return [
+        {name: redact(spec) if name == "$match" else spec
+         for name, spec in stage.items()}
+        for stage in pipeline
+    ]
+
+
+def describe(command_name: str, command: dict) -> Dict[str, Any]:
+    """
+    Query shape of a tracked command with all filter values redacted.
+    """
+    shape: Dict[str, Any] = {}
+    if command_name == "find":
+        shape["filter"] = redact(command.get("filter", {}))
+        for key in ("sort", "skip", "limit", "batchSize"):
+            if key in command:
+                shape[key] = command[key]
+    elif command_name == "aggregate":
+        shape["pipeline"] = _redact_pipeline(command.get("pipeline", []))
+    elif command_name in ("count", "distinct"):
+        shape["filter"] = redact(command.get("query", {}))
+        for key in ("key", "skip", "limit"):
+            if key in command:
+                shape[key] = command[key]
+    elif command_name == "findAndModify":
+        shape["filter"] = redact(command.get("query", {}))
+        if "sort" in command:
+            shape["sort"] = command["sort"]
+        update = command.get("update")
+        if isinstance(update, dict):
+            shape["update"] = redact(update)
+        shape["remove"] = bool(command.get("remove"))
+    elif command_name in ("update", "delete"):
+        statements = command.get(f"{command_name}s", [])
+        shape["filter"] = redact([s.get("q", {}) for s in statements])
+        shape["statements"] = len(statements)
+    elif command_name == "insert":
+        shape["documents"] = len(command.get("documents", []))
+    return shape
+
+
+def _find_key(doc: Any, key: str) -> Optional[Any]:
+    if isinstance(doc, dict):
+        if key in doc:
+            return doc[key]
+        children: Iterator[Any] = iter(doc.values())
+    elif isinstance(doc, list):
+        children = iter(doc)
+    else:
+        return None
+    for child in children:
+        found = _find_key(child, key)
+        if found is not None:
+            return found
+    return None
+
+
+def _plan_indexes(plan: Any) -> Iterator[str]:
+    if isinstance(plan, dict):
+        if plan.get("stage") == "COLLSCAN":
+            yield "COLLSCAN"
+        if "indexName" in plan:
+            yield plan["indexName"]
+        for value in plan.values():
+            yield from _plan_indexes(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _plan_indexes(item)
+
+
+def summarize_explain(explain: dict) -> Dict[str, Any]:
+    """
+    Keys/docs examined, rows returned and the winning index(es) of an
+    ``executionStats`` explain, for find, aggregate and write commands.
+    """
+    stats = _find_key(explain, "executionStats") or {}
+    winning = _find_key(explain, "winningPlan") or {}
+    return {
+        "index": sorted(set(_plan_indexes(winning))),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "n_returned": stats.get("nReturned"),
+        "execution_ms": stats.get("executionTimeMillis"),
+    }
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """
+    Log commands on the repository collections that take longer than
+    ``threshold_ms``, with redacted filter shape, sort and skip/limit.
+
+    Overhead stays bounded: ``started`` only remembers the command document
+    of tracked commands, only ``sample_rate`` of slow commands are logged,
+    and at most one ``explain("executionStats")`` runs at a time, on a
+    background thread with its own listener-free client.
+    """
+
+    def __init__(self, threshold_ms: int, sample_rate: float,
+                 explain: bool) -> None:
+        self._threshold_micros = threshold_ms * 1000
+        self._sample_rate = sample_rate
+        self._explain = explain
+        self._pending: Dict[Tuple[Any, int], dict] = {}
+        self._explain_busy = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._explain_client: Optional[MongoClient] = None
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in TRACKED_COMMANDS or \
+                event.command.get(event.command_name) \
+                not in SLOW_QUERY_COLLECTIONS:
+            return
+        if len(self._pending) >= _MAX_PENDING:
+            self._pending.clear()
+        self._pending[(event.connection_id, event.request_id)] = \
+            event.command
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finished(event, failed=True)
+
+    def _finished(self, event, failed: bool) -> None:
+        command = self._pending.pop(
+            (event.connection_id, event.request_id), None
+        )
+        if command is None or event.duration_micros < self._threshold_micros:
+            return
+        if random.random() >= self._sample_rate:
+            return
+
+        record = {
+            "ts": datetime.now(UTC).isoformat(),
+            "db": event.database_name,
+            "collection": command[event.command_name],
+            "command": event.command_name,
+            "duration_ms": round(event.duration_micros / 1000, 3),
+            "failed": failed,
+            **describe(event.command_name, command),
+        }
+        if self._explain and event.command_name != "insert" and \
+                self._explain_busy.acquire(blocking=False):
+            self._get_executor().submit(
+                self._explain_and_log, record, event.database_name, command
+            )
+        else:
+            self._log(record)
+
+    def _explain_and_log(self, record: dict, database: str,
+                         command: dict) -> None:
+        try:
+            explainable = {
+                k: v for k, v in command.items()
+                if not k.startswith("$") and k not in _NOT_EXPLAINABLE
+            }
+            started = time.perf_counter()
+            explain = self._get_explain_client()[database].command(
+                "explain", explainable, verbosity="executionStats"
+            )
+            record["explain"] = summarize_explain(explain)
+            record["explain"]["explain_ms"] = round(
+                (time.perf_counter() - started) * 1000, 3
+            )
+        except PyMongoError as e:
+            record["explain_error"] = str(e)
+        finally:
+            self._explain_busy.release()
+        self._log(record)
+
+    @staticmethod
+    def _log(record: dict) -> None:
+        logger.warning(json.dumps(record, default=str))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="slow-query-explain"
+            )
+        return self._executor
+
+    def _get_explain_client(self) -> MongoClient:
+        if self._explain_client is None:
+            self._explain_client = MongoClient(
+                settings.mongo_url, tz_aware=True,
+                serverSelectionTimeoutMS=(
+                    settings.mongo_server_selection_timeout_ms
+                ),
+                maxPoolSize=1,
+            )
+        return self._explain_client
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._explain_client is not None:
+            self._explain_client.close()
+            self._explain_client = None
+
+
+def configure_slow_query_log() -> None:
+    """
+    Send the slow-query logger to its own rotating file (JSON lines).
+    """
+    if any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
+        return
+    path = Path(settings.slow_query_log_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=settings.slow_query_log_max_bytes,
+        backupCount=settings.slow_query_log_backup_count,
+        encoding="utf-8",
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING)
+    logger.propagate = False
+
+
+_listener: Optional[SlowQueryListener] = None
+
+
+def get_slow_query_listener() -> SlowQueryListener:
+    """
+    Provide the per-worker slow-query listener singleton.
+    """
+    global _listener
+    if _listener is None:
+        configure_slow_query_log()
+        _listener = SlowQueryListener(
+            threshold_ms=settings.slow_query_threshold_ms,
+            sample_rate=settings.slow_query_sample_rate,
+            explain=settings.slow_query_explain,
+        )
+    return _listener
+
+
+def close_slow_query_listener() -> None:
+    """
+    Stop background explains and reset the singleton.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.close()
+        _listener = None
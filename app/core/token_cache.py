@@ -0,0 +1,32 @@
+import hashlib
+import time
+from typing import Any, Dict, List
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import decode_token
+
+# Per-worker cache of verified JWT claims, keyed by a SHA-256 digest of the
+# token so raw bearer tokens are never held as keys. Only tokens that passed
+# verification are stored, and never past their ``exp``.
+claims_cache: TTLCache[bytes, Dict[str, Any]] = TTLCache(
+    "jwt_claims",
+    max_size=settings.jwt_claims_cache_max_size,
+    ttl_seconds=settings.jwt_claims_cache_ttl_seconds,
+)
+
+
+def decode_token_cached(token: str, secret: str,
+                        algorithms: List[str]) -> Dict[str, Any]:
+    """
+    ``decode_token`` that skips re-verifying a token seen recently.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    claims = claims_cache.get(key)
+    if claims is not None:
+        return claims
+    claims = decode_token(token=token, secret=secret, algorithms=algorithms)
+    exp = claims.get("exp")
+    ttl = None if exp is None else float(exp) - time.time()
+    claims_cache.set(key, claims, ttl=ttl)
+    return claims
@@ -1,27 +1,48 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, status, HTTPException
+from fastapi import FastAPI, status, HTTPException, Response
 from pymongo.errors import PyMongoError
 
 from app.api.exception_handlers import register_exception_handlers
+from app.api.middleware import RequestMetricsMiddleware, \
+    CompressionMiddleware
 from app.api.v1.routers.task_router import router as task_router
 from app.api.v1.routers.auth_router import router as auth_router
-from app.core.config import settings
+from app.core.compression import available_compressors
+from app.core.config import settings, RepositoryBackend
 from app.core.database import get_client, close_client
-from app.core.indexes import init_all_indexes
+from app.core.indexes import ensure_indexes
 from app.core.logging import configure_logging
+from app.core.metrics import render_latest, CONTENT_TYPE_LATEST
+from app.core.password_hasher import close_password_hasher
+from app.core.response_cache import close_response_cache
+from app.repositories.task_archive_mongo import TaskArchiveStore
+from app.services.task_archiver import start_task_archiver, \
+    close_task_archiver
+from app.services.task_events import close_task_event_hub
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
-    client = get_client()
+    use_mongo = settings.repository_backend == RepositoryBackend.mongo
     try:
-        await client.admin.command("ping")
-        db = client[settings.mongo_db]
-        await init_all_indexes(db)
+        if use_mongo:
+            client = get_client()
+            await client.admin.command("ping")
+            if settings.mongo_sync_indexes_on_startup:
+                await ensure_indexes(client[settings.mongo_db], wait=False)
+            if settings.task_archive_enabled:
+                start_task_archiver(
+                    TaskArchiveStore(client[settings.mongo_db])
+                )
         yield
     finally:
-        close_client()
+        await close_task_archiver()
+        close_password_hasher()
+        await close_task_event_hub()
+        await close_response_cache()
+        if use_mongo:
+            close_client()
 
 
 def create_app() -> FastAPI:
@@ -35,9 +56,30 @@ def create_app() -> FastAPI:
     )
 
     register_exception_handlers(app)
+    encodings = [e.strip() for e in settings.compression_encodings.split(",")
+                 if e.strip()]
+    if encodings:
+        app.add_middleware(
+            CompressionMiddleware,
+            compressors=available_compressors(),
+            preferred=encodings,
+            min_size=settings.compression_min_size,
+            level=settings.compression_level,
+            exclude_paths=("/health",),
+        )
+    routers = (
+        (auth_router, "/api/v1/auth", "Auth"),
+        (task_router, "/api/v1/tasks", "Tasks"),
+    )
+    # Added last, so it is outermost and times compression too
+    app.add_middleware(
+        RequestMetricsMiddleware,
+        prefixes={id(route): prefix
+                  for router, prefix, _ in routers for route in router.routes},
+    )
 
-    app.include_router(auth_router, prefix="/api/v1/auth", tags=["Auth"])
-    app.include_router(task_router, prefix="/api/v1/tasks", tags=["Tasks"])
+    for router, prefix, tag in routers:
+        app.include_router(router, prefix=prefix, tags=[tag])
 
     @app.get("/", tags=["Root"], status_code=status.HTTP_200_OK)
     async def root():
@@ -45,6 +87,8 @@ def create_app() -> FastAPI:
 
     @app.get("/health", tags=["Health"], status_code=status.HTTP_200_OK)
     async def health():
+        if settings.repository_backend == RepositoryBackend.memory:
+            return {"status": "healthy"}
         try:
             await get_client().admin.command("ping")
             return {"status": "healthy"}
@@ -54,6 +98,10 @@ def create_app() -> FastAPI:
                 detail="degraded"
             )
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(render_latest(), media_type=CONTENT_TYPE_LATEST)
+
     return app
 
 
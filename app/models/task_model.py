@@ -1,6 +1,6 @@
 from datetime import datetime, UTC
 from enum import StrEnum
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -31,5 +31,20 @@ class TaskModel(BaseModel):
     priority: TaskPriority = TaskPriority.MEDIUM
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: Optional[datetime] = None
+    # Bumped on every write; documents that predate it read as version 0
+    version: int = 1
 
     model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True)
+
+
+class TaskStats(BaseModel):
+    """
+    Per-owner task counters.
+    """
+    total: int = 0
+    status: Dict[TaskStatus, int] = Field(
+        default_factory=lambda: dict.fromkeys(TaskStatus, 0)
+    )
+    priority: Dict[TaskPriority, int] = Field(
+        default_factory=lambda: dict.fromkeys(TaskPriority, 0)
+    )
@@ -0,0 +1,22 @@
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def build_trusted(cls: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Instantiate ``cls`` from a complete, already-valid mapping of field
+    name -> value without running validation.
+
+    Same result as ``cls.model_construct(**values)`` when every field is
+    given, without its per-field alias/default resolution (which makes
+    model_construct slower than validating in pydantic-core).
+    """
+    obj = cls.__new__(cls)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__pydantic_fields_set__", set(values))
+    object.__setattr__(obj, "__pydantic_extra__", None)
+    object.__setattr__(obj, "__pydantic_private__", None)
+    return obj
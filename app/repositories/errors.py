@@ -19,3 +19,11 @@ class UniqueViolationError(RepositoryError):
 
 class InvalidIdError(RepositoryError):
     DEFAULT_MESSAGE = "invalid id format"
+
+
+class InvalidCursorError(RepositoryError):
+    DEFAULT_MESSAGE = "invalid pagination cursor"
+
+
+class PreconditionFailedError(RepositoryError):
+    DEFAULT_MESSAGE = "resource has been modified"
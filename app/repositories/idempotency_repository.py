@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Protocol, runtime_checkable
+
+
+@dataclass
+class IdempotencyRecord:
+    """
+    What is stored under an Idempotency-Key: the request's fingerprint and,
+    once the first request finished, the response to replay.
+    """
+    fingerprint: str
+    completed: bool = False
+    status_code: int = 0
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    # Until when an unfinished reservation belongs to its request
+    locked_until: Optional[datetime] = None
+
+
+@runtime_checkable
+class IdempotencyRepository(Protocol):
+    """
+    Repository contract for stored Idempotency-Key responses.
+    """
+
+    async def reserve(self, key: str, fingerprint: str, lease: timedelta,
+                      ttl: timedelta) -> Optional[IdempotencyRecord]:
+        """
+        Claim ``key`` for the calling request. Returns None if claimed
+        (new, or taken over from a request whose lease ran out), otherwise
+        the record already stored.
+        """
+        ...
+
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        ...
+
+    async def complete(self, key: str, record: IdempotencyRecord,
+                       ttl: timedelta) -> None:
+        ...
+
+    async def release(self, key: str) -> None:
+        """
+        Drop an unfinished reservation so a retry can run.
+        """
+        ...
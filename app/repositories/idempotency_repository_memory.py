@@ -0,0 +1,75 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, UTC
+from typing import Dict, Optional, Tuple
+
+from app.repositories.idempotency_repository import IdempotencyRepository, \
+    IdempotencyRecord
+
+
+class MemoryIdempotencyStore:
+    """
+    In-process idempotency keys: key -> (record, expires_at). Expired keys
+    are dropped when touched.
+    """
+
+    def __init__(self) -> None:
+        self.records: Dict[str, Tuple[IdempotencyRecord, datetime]] = {}
+
+
+_store = MemoryIdempotencyStore()
+
+
+def get_idempotency_store() -> MemoryIdempotencyStore:
+    return _store
+
+
+class MemoryIdempotencyRepository(IdempotencyRepository):
+    """
+    In-process implementation of IdempotencyRepository
+    (REPOSITORY_BACKEND=memory).
+    """
+
+    def __init__(self, store: MemoryIdempotencyStore):
+        self._store = store
+
+    def _live(self, key: str, now: datetime) -> Optional[IdempotencyRecord]:
+        entry = self._store.records.get(key)
+        if entry is None:
+            return None
+        record, expires_at = entry
+        if expires_at < now:
+            del self._store.records[key]
+            return None
+        return record
+
+    async def reserve(self, key: str, fingerprint: str, lease: timedelta,
+                      ttl: timedelta) -> Optional[IdempotencyRecord]:
+        now = datetime.now(UTC)
+        existing = self._live(key, now)
+        if existing is not None and (existing.completed
+                                     or existing.locked_until >= now):
+            return existing
+        self._store.records[key] = (
+            IdempotencyRecord(fingerprint=fingerprint,
+                              locked_until=now + lease),
+            now + ttl,
+        )
+        return None
+
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        return self._live(key, datetime.now(UTC))
+
+    async def complete(self, key: str, record: IdempotencyRecord,
+                       ttl: timedelta) -> None:
+        existing = self._live(key, datetime.now(UTC))
+        if existing is None or existing.fingerprint != record.fingerprint:
+            return
+        self._store.records[key] = (
+            replace(record, completed=True, locked_until=None),
+            datetime.now(UTC) + ttl,
+        )
+
+    async def release(self, key: str) -> None:
+        existing = self._store.records.get(key)
+        if existing is not None and not existing[0].completed:
+            del self._store.records[key]
@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError, DuplicateKeyError
+
+from app.core.admission import admitted
+from app.repositories.errors import RepositoryError
+from app.repositories.idempotency_repository import IdempotencyRepository, \
+    IdempotencyRecord
+
+COLLECTION_NAME = "idempotency_keys"
+# insert -> taken over -> read can lose to a concurrent delete each round
+_RESERVE_ATTEMPTS = 3
+
+
+def _record_from_doc(doc: dict) -> IdempotencyRecord:
+    return IdempotencyRecord(
+        fingerprint=doc["fingerprint"],
+        completed=doc.get("completed", False),
+        status_code=doc.get("status_code", 0),
+        headers=doc.get("headers") or {},
+        body=bytes(doc.get("body") or b""),
+        locked_until=doc.get("locked_until"),
+    )
+
+
+class IdempotencyRepositoryImpl(IdempotencyRepository):
+    """
+    MongoDB implementation of IdempotencyRepository. The TTL index on
+    ``expires_at`` (idx_idempotency_expires_at) removes expired keys; until
+    the TTL monitor gets to them they are treated as absent.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._collection = db.get_collection(COLLECTION_NAME)
+
+    @admitted
+    async def reserve(self, key: str, fingerprint: str, lease: timedelta,
+                      ttl: timedelta) -> Optional[IdempotencyRecord]:
+        now = datetime.now(UTC)
+        doc = {
+            "_id": key,
+            "fingerprint": fingerprint,
+            "completed": False,
+            "locked_until": now + lease,
+            "expires_at": now + ttl,
+        }
+        try:
+            for _ in range(_RESERVE_ATTEMPTS):
+                try:
+                    await self._collection.insert_one(doc)
+                    return None
+                except DuplicateKeyError:
+                    pass
+                # The holder died without releasing, or the window is over
+                taken = await self._collection.replace_one(
+                    {"_id": key, "$or": [
+                        {"completed": False, "locked_until": {"$lt": now}},
+                        {"expires_at": {"$lt": now}},
+                    ]},
+                    doc,
+                )
+                if taken.matched_count:
+                    return None
+                existing = await self._collection.find_one({"_id": key})
+                if existing is not None:
+                    return _record_from_doc(existing)
+        except PyMongoError:
+            raise RepositoryError()
+        raise RepositoryError()
+
+    @admitted
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        try:
+            doc = await self._collection.find_one(
+                {"_id": key, "expires_at": {"$gte": datetime.now(UTC)}}
+            )
+        except PyMongoError:
+            raise RepositoryError()
+        return _record_from_doc(doc) if doc is not None else None
+
+    @admitted
+    async def complete(self, key: str, record: IdempotencyRecord,
+                       ttl: timedelta) -> None:
+        try:
+            await self._collection.update_one(
+                {"_id": key, "fingerprint": record.fingerprint},
+                {
+                    "$set": {
+                        "completed": True,
+                        "status_code": record.status_code,
+                        "headers": record.headers,
+                        "body": Binary(record.body),
+                        "expires_at": datetime.now(UTC) + ttl,
+                    },
+                    "$unset": {"locked_until": ""},
+                },
+            )
+        except PyMongoError:
+            raise RepositoryError()
+
+    @admitted
+    async def release(self, key: str) -> None:
+        try:
+            await self._collection.delete_one(
+                {"_id": key, "completed": False}
+            )
+        except PyMongoError:
+            raise RepositoryError()
@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError, BulkWriteError
+
+from app.core.admission import admitted
+from app.core.locks import acquire_lock, release_lock
+from app.models.task_model import TaskStatus
+from app.repositories.errors import RepositoryError
+from app.repositories.task_repository_mongo import COLLECTION_NAME, \
+    ARCHIVE_COLLECTION_NAME, DUPLICATE_KEY_CODE, gather_bounded
+
+ARCHIVE_LOCK_ID = "task_archiver"
+
+
+class TaskArchiveStore:
+    """
+    Moves resolved tasks that have not changed since ``cutoff`` from the
+    hot collection into ``tasks_archive``.
+
+    A batch is copied first and then deleted only where the task still
+    has the version that was copied; for a task written (or deleted by
+    its owner) in between, the copy is dropped from the archive again.
+    Re-running after a crash is safe: a copy already in the archive is
+    overwritten with the task as just read, so it never lags the task it
+    replaces. Counters in task_stats count archived tasks too, so they
+    are not touched. The change stream reports each move as ``archived``
+    (TaskChangeStream finds the task in the archive), not ``deleted``.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._db = db
+        self._collection = db.get_collection(COLLECTION_NAME)
+        self._archive = db.get_collection(ARCHIVE_COLLECTION_NAME)
+
+    @admitted
+    async def archive_batch(self, cutoff: datetime,
+                            batch_size: int) -> List[str]:
+        """
+        Archive up to ``batch_size`` tasks; returns the owner id of every
+        task moved.
+        """
+        query = self._candidate_query(cutoff)
+        try:
+            docs = await self._collection.find(query).limit(
+                batch_size
+            ).to_list(batch_size)
+            if not docs:
+                return []
+            try:
+                await self._archive.insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(err.get("code") != DUPLICATE_KEY_CODE
+                       for err in errors):
+                    raise
+                # Left by an earlier run; the task may have changed since
+                await gather_bounded([
+                    lambda doc=docs[err["index"]]: self._archive.replace_one(
+                        {"_id": doc["_id"]}, doc, upsert=True
+                    )
+                    for err in errors
+                ])
+            removed = await gather_bounded([
+                lambda doc=doc: self._collection.find_one_and_delete(
+                    {"_id": doc["_id"],
+                     "status": TaskStatus.RESOLVED.value,
+                     "version": doc.get("version")},
+                    projection={"_id": 1},
+                )
+                for doc in docs
+            ])
+            # Written or deleted since we read it: drop the stale copy
+            stale = [doc["_id"] for doc, gone in zip(docs, removed)
+                     if gone is None]
+            if stale:
+                await self._archive.delete_many({"_id": {"$in": stale}})
+        except PyMongoError:
+            raise RepositoryError()
+        return [doc["owner_id"] for doc, gone in zip(docs, removed)
+                if gone is not None]
+
+    @staticmethod
+    def _candidate_query(cutoff: datetime) -> dict:
+        # Served by the partial idx_tasks_resolved_updated_at_created_at
+        return {
+            "status": TaskStatus.RESOLVED.value,
+            "$or": [
+                {"updated_at": {"$lt": cutoff}},
+                {"updated_at": None, "created_at": {"$lt": cutoff}},
+            ],
+        }
+
+    async def try_lock(self, owner: str, ttl: timedelta) -> bool:
+        """
+        Take or renew the cluster-wide archiver lock.
+        """
+        try:
+            return await acquire_lock(self._db, ARCHIVE_LOCK_ID, owner, ttl)
+        except PyMongoError:
+            raise RepositoryError()
+
+    async def unlock(self, owner: str) -> None:
+        try:
+            await release_lock(self._db, ARCHIVE_LOCK_ID, owner)
+        except PyMongoError:
+            raise RepositoryError()
@@ -0,0 +1,105 @@
+import logging
+from dataclasses import dataclass, replace
+from typing import AsyncIterator, Callable, Literal, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.models.task_model import TaskModel
+from app.repositories.task_repository_mongo import COLLECTION_NAME, \
+    ARCHIVE_COLLECTION_NAME, RESTORED_FIELD, task_from_doc
+
+logger = logging.getLogger(__name__)
+
+TaskChangeType = Literal["created", "updated", "deleted", "archived"]
+
+_OPERATIONS = {
+    "insert": "created",
+    "update": "updated",
+    "replace": "updated",
+    "delete": "deleted",
+}
+# The server can no longer resume from the given token
+RESUME_FAILED_CODES = frozenset({260, 280, 286})
+# Change streams are only supported on replica sets and sharded clusters
+UNSUPPORTED_CODES = frozenset({40573})
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    token: str
+    type: TaskChangeType
+    owner_id: str
+    task_id: str
+    # Current state for created/updated; None for deleted/archived
+    task: Optional[TaskModel]
+
+
+class TaskChangeStream:
+    """
+    Change stream over the tasks collection (requires a replica set).
+
+    Deletes only carry the document key, so the collection must have
+    pre-images enabled to route them to an owner; the index sync
+    (app/core/indexes.py, migrate-indexes) turns them on.
+
+    Moves between tasks and tasks_archive are not creations/deletions: a
+    delete whose task is now in the archive is reported as ``archived``
+    (the task still exists, readable by id), and a task restored from the
+    archive (marked with RESTORED_FIELD) as ``updated``.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._collection = db.get_collection(COLLECTION_NAME)
+        self._archive = db.get_collection(ARCHIVE_COLLECTION_NAME)
+
+    async def changes(self, resume_after: Optional[str] = None,
+                      on_open: Optional[Callable[[], None]] = None
+                      ) -> AsyncIterator[TaskChange]:
+        """
+        Yield changes after ``resume_after``; ``on_open`` is called once the
+        server has accepted the watch (it fails right away when change
+        streams are unsupported).
+        """
+        pipeline = [{"$match": {"operationType": {"$in": list(_OPERATIONS)}}}]
+        async with self._collection.watch(
+            pipeline,
+            full_document="updateLookup",
+            full_document_before_change="whenAvailable",
+            resume_after={"_data": resume_after} if resume_after else None,
+        ) as stream:
+            if on_open is not None:
+                on_open()
+            async for event in stream:
+                change = self._to_change(event)
+                if change is None:
+                    continue
+                if change.type == "deleted" and \
+                        await self._archive.find_one(
+                            event["documentKey"], {"_id": 1}
+                        ) is not None:
+                    change = replace(change, type="archived")
+                yield change
+
+    @staticmethod
+    def _to_change(event: dict) -> Optional[TaskChange]:
+        change_type = _OPERATIONS[event["operationType"]]
+        task_id = str(event["documentKey"]["_id"])
+        doc = event.get("fullDocument")
+        if change_type == "created" and doc and doc.get(RESTORED_FIELD):
+            change_type = "updated"
+        before = event.get("fullDocumentBeforeChange")
+        owner_id = (doc or before or {}).get("owner_id")
+        if owner_id is None:
+            logger.debug("cannot route %s of task %s: no owner",
+                         change_type, task_id)
+            return None
+        task = None
+        if change_type != "deleted" and doc is not None:
+            task = task_from_doc(doc)
+        elif change_type != "deleted":
+            # Updated, then deleted before the lookup: the delete follows
+            return None
+        return TaskChange(
+            token=event["_id"]["_data"], type=change_type,
+            owner_id=owner_id, task_id=task_id, task=task,
+        )
@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Literal, Optional
+
+from app.repositories.errors import InvalidCursorError
+from app.repositories.task_repository import TaskCursor, TaskId
+
+
+def encode_cursor(sort: Literal["created_at", "updated_at"],
+                  sort_dir: Literal["asc", "desc"],
+                  value: Optional[datetime], task_id: TaskId) -> str:
+    """
+    Encode the last ``(sort value, _id)`` pair of a page as an opaque token.
+    """
+    payload = {
+        "s": sort,
+        "d": sort_dir,
+        "v": value.isoformat() if value is not None else None,
+        "id": task_id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: Literal["created_at", "updated_at"],
+                  sort_dir: Literal["asc", "desc"]) -> TaskCursor:
+    """
+    Decode a token produced by ``encode_cursor`` for the same sort order.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value = payload["v"]
+        parsed = TaskCursor(
+            value=datetime.fromisoformat(value) if value is not None else None,
+            id=str(payload["id"]),
+        )
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError()
+    if payload.get("s") != sort or payload.get("d") != sort_dir:
+        raise InvalidCursorError("cursor does not match sort order")
+    return parsed
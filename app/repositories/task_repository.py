@@ -1,15 +1,31 @@
+from datetime import datetime
 from typing import List, Optional, Protocol, runtime_checkable, Literal, \
-    TypedDict
+    TypedDict, Tuple, Union, AsyncIterator
 
-from app.models.task_model import TaskModel, TaskStatus, TaskPriority
+from app.models.task_model import TaskModel, TaskStatus, TaskPriority, \
+    TaskStats
+from app.repositories.errors import RepositoryError
 
 TaskId = str
+CountMode = Literal["exact", "estimate", "none"]
+# Per-item result of a bulk write: the stored task or the error for that item
+TaskBulkOutcome = Union[TaskModel, RepositoryError]
 
 
 class TaskListFilters(TypedDict, total=False):
     owner_id: str
     status: TaskStatus
     priority: TaskPriority
+    # Also match archived tasks (implied by status=resolved)
+    include_archived: bool
+
+
+class TaskCursor(TypedDict):
+    """
+    Keyset position: the sort value and id of the last item already seen.
+    """
+    value: Optional[datetime]
+    id: TaskId
 
 
 class TaskPatchData(TypedDict, total=False):
@@ -32,12 +48,41 @@ class TaskRepository(Protocol):
         sort: Literal["created_at", "updated_at"],
         sort_dir: Literal["asc", "desc"],
         filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
     ) -> List[TaskModel]:
         ...
 
     async def count(self, filters: Optional[TaskListFilters]) -> int:
         ...
 
+    async def list_page(
+        self,
+        limit: int,
+        skip: int,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
+        count: CountMode = "exact",
+    ) -> Tuple[List[TaskModel], Optional[int]]:
+        """
+        Return one page and the total in a single call. The total is None
+        when ``count`` is "none".
+        """
+        ...
+
+    def stream(
+        self,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        batch_size: int,
+    ) -> AsyncIterator[TaskModel]:
+        """
+        Iterate over every matching task without materializing the result.
+        """
+        ...
+
     async def get(self, task_id: TaskId, owner_id: str) -> TaskModel:
         ...
 
@@ -45,12 +90,60 @@ class TaskRepository(Protocol):
         ...
 
     async def replace(self, task_id: TaskId, owner_id: str,
-                      task: TaskModel) -> TaskModel:
+                      task: TaskModel,
+                      expected_version: Optional[int] = None) -> TaskModel:
+        """
+        Replace the task; with ``expected_version`` only if it still has
+        that version (PreconditionFailedError otherwise).
+        """
         ...
 
     async def patch(self, task_id: TaskId, owner_id: str,
-                    update_data: TaskPatchData) -> TaskModel:
+                    update_data: TaskPatchData,
+                    expected_version: Optional[int] = None) -> TaskModel:
+        """
+        Patch the task and bump its version; ``expected_version`` as for
+        ``replace``.
+        """
         ...
 
     async def delete(self, task_id: TaskId, owner_id: str) -> None:
         ...
+
+    async def stats(self, owner_id: str) -> TaskStats:
+        """
+        Per-status/priority counts for the owner, without scanning tasks.
+        """
+        ...
+
+    async def create_many(self,
+                          tasks: List[TaskModel]) -> List[TaskBulkOutcome]:
+        """
+        Insert all tasks in one unordered batch; one outcome per input.
+        """
+        ...
+
+    async def patch_many(
+        self, owner_id: str, updates: List[Tuple[TaskId, TaskPatchData]]
+    ) -> List[TaskBulkOutcome]:
+        """
+        Apply all patches in one unordered batch; one outcome per input.
+        """
+        ...
+
+    async def get_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[TaskBulkOutcome]:
+        """
+        Fetch tasks by id in one batch, in the order asked for; ids that do
+        not parse or match nothing get InvalidIdError / NotFoundError.
+        """
+        ...
+
+    async def delete_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[Optional[RepositoryError]]:
+        """
+        Delete all tasks in one batch; None marks a successful delete.
+        """
+        ...
@@ -0,0 +1,293 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import datetime, UTC
+from typing import Dict, Iterator, List, Literal, Optional, Tuple, \
+    AsyncIterator
+
+from bson import ObjectId
+
+from app.core.config import settings
+from app.models.task_model import TaskModel, TaskStats, TaskStatus, \
+    TaskPriority
+from app.repositories.errors import RepositoryError, UniqueViolationError, \
+    NotFoundError, InvalidIdError, PreconditionFailedError
+from app.repositories.task_repository import TaskRepository, TaskId, \
+    TaskPatchData, TaskListFilters, TaskCursor, CountMode, TaskBulkOutcome
+
+SortField = Literal["created_at", "updated_at"]
+# (has value, value, id): BSON orders null below any date, ties on _id
+SortKey = Tuple[bool, datetime, str]
+# (owner_id, sort field, status or None, priority or None)
+IndexKey = Tuple[str, str, Optional[str], Optional[str]]
+
+_SORT_FIELDS: Tuple[SortField, ...] = ("created_at", "updated_at")
+_MIN_TIME = datetime.min.replace(tzinfo=UTC)
+
+
+def _sort_key(value: Optional[datetime], task_id: str) -> SortKey:
+    return value is not None, value or _MIN_TIME, task_id
+
+
+class MemoryTaskStore:
+    """
+    In-process task storage with the same access paths as the Mongo
+    indexes: one sorted key list per (owner, sort field, status?,
+    priority?) mirroring the ESR compound indexes, a case-insensitive
+    (owner, title) map mirroring uniq_owner_title, and per-owner counters.
+    """
+
+    def __init__(self) -> None:
+        self.tasks: Dict[str, TaskModel] = {}
+        self.titles: Dict[Tuple[str, str], str] = {}
+        self.indexes: Dict[IndexKey, List[SortKey]] = {}
+        self.stats: Dict[str, Counter] = {}
+
+    @staticmethod
+    def _index_keys(task: TaskModel) -> Iterator[Tuple[IndexKey, SortKey]]:
+        for field in _SORT_FIELDS:
+            key = _sort_key(getattr(task, field), task.id or "")
+            for status in (None, task.status.value):
+                for priority in (None, task.priority.value):
+                    yield (task.owner_id, field, status, priority), key
+
+    @staticmethod
+    def _counter_keys(task: TaskModel) -> Tuple[str, ...]:
+        return "total", f"status.{task.status}", f"priority.{task.priority}"
+
+    def _title_key(self, task: TaskModel) -> Tuple[str, str]:
+        return task.owner_id, task.title.casefold()
+
+    def insert(self, task: TaskModel) -> None:
+        title_key = self._title_key(task)
+        if self.titles.get(title_key, task.id) != task.id:
+            raise UniqueViolationError("title must be unique per owner")
+        self.tasks[task.id or ""] = task
+        self.titles[title_key] = task.id or ""
+        for index_key, sort_key in self._index_keys(task):
+            insort(self.indexes.setdefault(index_key, []), sort_key)
+        self.stats.setdefault(task.owner_id, Counter()).update(
+            self._counter_keys(task)
+        )
+
+    def remove(self, task: TaskModel) -> None:
+        del self.tasks[task.id or ""]
+        self.titles.pop(self._title_key(task), None)
+        for index_key, sort_key in self._index_keys(task):
+            keys = self.indexes[index_key]
+            del keys[bisect_left(keys, sort_key)]
+        self.stats[task.owner_id].subtract(self._counter_keys(task))
+
+    def swap(self, old: TaskModel, new: TaskModel) -> None:
+        """
+        Replace ``old`` by ``new`` (same id), all-or-nothing on conflicts.
+        """
+        self.remove(old)
+        try:
+            self.insert(new)
+        except UniqueViolationError:
+            self.insert(old)
+            raise
+
+
+_store = MemoryTaskStore()
+
+
+def get_task_store() -> MemoryTaskStore:
+    return _store
+
+
+class MemoryTaskRepository(TaskRepository):
+    """
+    In-process implementation of TaskRepository for benchmarking and
+    hermetic load tests (REPOSITORY_BACKEND=memory). State is per worker.
+    """
+
+    def __init__(self, store: MemoryTaskStore):
+        self._store = store
+
+    def _index(self, sort: SortField,
+               filters: Optional[TaskListFilters]) -> List[SortKey]:
+        filters = filters or {}
+        if "owner_id" not in filters:
+            # Not an API query shape; fall back to a scan. Nothing is ever
+            # archived in memory, so include_archived changes nothing.
+            fields = {k: v for k, v in filters.items()
+                      if k != "include_archived"}
+            return sorted(
+                _sort_key(getattr(t, sort), t.id or "")
+                for t in self._store.tasks.values()
+                if all(getattr(t, k) == v for k, v in fields.items())
+            )
+        status = filters.get("status")
+        priority = filters.get("priority")
+        return self._store.indexes.get((
+            filters["owner_id"], sort,
+            status.value if status is not None else None,
+            priority.value if priority is not None else None,
+        ), [])
+
+    async def list(
+        self,
+        limit: int,
+        skip: int,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
+    ) -> List[TaskModel]:
+        keys = self._index(sort, filters)
+        if after is not None:
+            self._to_oid(after["id"])
+            bound = _sort_key(after["value"], after["id"])
+            skip = 0
+        if sort_dir == "asc":
+            start = bisect_right(keys, bound) if after is not None else 0
+            window = keys[start + skip:start + skip + limit]
+        else:
+            end = bisect_left(keys, bound) if after is not None else len(keys)
+            end -= skip
+            window = keys[max(end - limit, 0):max(end, 0)][::-1]
+        return [self._store.tasks[key[2]] for key in window]
+
+    async def count(self, filters: Optional[TaskListFilters]) -> int:
+        return len(self._index("created_at", filters))
+
+    def stream(
+        self,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        batch_size: int,
+    ) -> AsyncIterator[TaskModel]:
+        keys = list(self._index(sort, filters))
+        if sort_dir == "desc":
+            keys.reverse()
+        return self._iterate(keys)
+
+    async def _iterate(self, keys: List[SortKey]) -> AsyncIterator[TaskModel]:
+        for key in keys:
+            task = self._store.tasks.get(key[2])
+            if task is not None:
+                yield task
+
+    async def list_page(
+        self,
+        limit: int,
+        skip: int,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
+        count: CountMode = "exact",
+    ) -> Tuple[List[TaskModel], Optional[int]]:
+        items = await self.list(limit, skip, sort, sort_dir, filters, after)
+        if count == "none":
+            return items, None
+        total = await self.count(filters)
+        if count == "estimate":
+            total = min(total, settings.task_count_estimate_cap)
+        return items, total
+
+    async def get(self, task_id: TaskId, owner_id: str) -> TaskModel:
+        task = self._store.tasks.get(str(self._to_oid(task_id)))
+        if task is None or task.owner_id != owner_id:
+            raise NotFoundError("task not found")
+        return task
+
+    async def create(self, task: TaskModel) -> TaskModel:
+        stored = task.model_copy(update={"id": str(ObjectId())})
+        self._store.insert(stored)
+        return stored
+
+    async def replace(self, task_id: TaskId, owner_id: str,
+                      task: TaskModel,
+                      expected_version: Optional[int] = None) -> TaskModel:
+        existing = await self._get_for_write(
+            task_id, owner_id, expected_version
+        )
+        stored = task.model_copy(update={"id": existing.id})
+        self._store.swap(existing, stored)
+        return stored
+
+    async def patch(self, task_id: TaskId, owner_id: str,
+                    update_data: TaskPatchData,
+                    expected_version: Optional[int] = None) -> TaskModel:
+        existing = await self._get_for_write(
+            task_id, owner_id, expected_version
+        )
+        stored = existing.model_copy(update=dict(update_data) | {
+            "updated_at": datetime.now(UTC),
+            "version": existing.version + 1,
+        })
+        self._store.swap(existing, stored)
+        return stored
+
+    async def delete(self, task_id: TaskId, owner_id: str) -> None:
+        self._store.remove(await self.get(task_id, owner_id))
+
+    async def stats(self, owner_id: str) -> TaskStats:
+        counter = self._store.stats.get(owner_id, Counter())
+        stats = TaskStats(total=counter["total"])
+        for status in TaskStatus:
+            stats.status[status] = counter[f"status.{status}"]
+        for priority in TaskPriority:
+            stats.priority[priority] = counter[f"priority.{priority}"]
+        return stats
+
+    async def create_many(self,
+                          tasks: List[TaskModel]) -> List[TaskBulkOutcome]:
+        outcomes: List[TaskBulkOutcome] = []
+        for task in tasks:
+            try:
+                outcomes.append(await self.create(task))
+            except RepositoryError as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def patch_many(
+        self, owner_id: str, updates: List[Tuple[TaskId, TaskPatchData]]
+    ) -> List[TaskBulkOutcome]:
+        outcomes: List[TaskBulkOutcome] = []
+        for task_id, data in updates:
+            try:
+                outcomes.append(await self.patch(task_id, owner_id, data))
+            except RepositoryError as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def get_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[TaskBulkOutcome]:
+        outcomes: List[TaskBulkOutcome] = []
+        for task_id in task_ids:
+            try:
+                outcomes.append(await self.get(task_id, owner_id))
+            except RepositoryError as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def delete_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[Optional[RepositoryError]]:
+        outcomes: List[Optional[RepositoryError]] = []
+        for task_id in task_ids:
+            try:
+                await self.delete(task_id, owner_id)
+                outcomes.append(None)
+            except RepositoryError as e:
+                outcomes.append(e)
+        return outcomes
+
+    async def _get_for_write(self, task_id: TaskId, owner_id: str,
+                             expected_version: Optional[int]) -> TaskModel:
+        existing = await self.get(task_id, owner_id)
+        if expected_version is not None and \
+                existing.version != expected_version:
+            raise PreconditionFailedError()
+        return existing
+
+    @staticmethod
+    def _to_oid(task_id: str) -> ObjectId:
+        if not ObjectId.is_valid(task_id):
+            raise InvalidIdError()
+        return ObjectId(task_id)
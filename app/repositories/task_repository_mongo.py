@@ -1,28 +1,145 @@
+import asyncio
+import heapq
+from collections import defaultdict
 from datetime import datetime, UTC
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Tuple, AsyncIterator, Callable, \
+    Awaitable, TypeVar
 
 from bson import ObjectId, errors as bson_errors
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from motor.motor_asyncio import AsyncIOMotorDatabase, \
+    AsyncIOMotorCollection
 from pymongo import ASCENDING, DESCENDING, ReturnDocument
-from pymongo.errors import PyMongoError, DuplicateKeyError
+from pymongo.errors import PyMongoError, DuplicateKeyError, BulkWriteError
 
-from app.models.task_model import TaskModel
+from app.core.admission import admitted
+from app.core.config import settings
+from app.models.task_model import TaskModel, TaskStatus, TaskPriority, \
+    TaskStats
+from app.models.trusted import build_trusted
 from app.repositories.errors import RepositoryError, UniqueViolationError, \
-    NotFoundError, InvalidIdError
+    NotFoundError, InvalidIdError, PreconditionFailedError
 from app.repositories.task_repository import TaskRepository, TaskId, \
-    TaskPatchData, TaskListFilters
+    TaskPatchData, TaskListFilters, TaskCursor, CountMode, TaskBulkOutcome
+from app.repositories.task_stats_mongo import TaskStatsStore
 
 COLLECTION_NAME = "tasks"
+ARCHIVE_COLLECTION_NAME = "tasks_archive"
+# Set on a task moved back from the archive until its write lands, so the
+# change stream reports the move as an update rather than a creation
+RESTORED_FIELD = "restored_from_archive"
+DUPLICATE_KEY_CODE = 11000
+# Bulk items written one by one (to see each item's own result) run this
+# many at a time, i.e. hold up to this many pool connections
+BULK_ITEM_CONCURRENCY = 8
+# Dict lookups are much cheaper than calling the enum constructors
+_STATUSES = {s.value: s for s in TaskStatus}
+_PRIORITIES = {p.value: p for p in TaskPriority}
+
+
+T = TypeVar("T")
+
+
+async def gather_bounded(calls: List[Callable[[], Awaitable[T]]]
+                         ) -> List[T]:
+    """
+    Await every call, at most BULK_ITEM_CONCURRENCY at a time, in order.
+    """
+    semaphore = asyncio.Semaphore(BULK_ITEM_CONCURRENCY)
+
+    async def run(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await call()
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
+def _stored_time(value: datetime) -> datetime:
+    """
+    Truncate to the millisecond precision Mongo stores, so values we
+    return match what a later read sees.
+    """
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def _stored_now() -> datetime:
+    return _stored_time(datetime.now(UTC))
+
+
+def _merge_key(sort: str) -> Callable[[TaskModel], tuple]:
+    """
+    (sort value, id) order as Mongo sorts it: null below any date.
+    """
+    def key(task: TaskModel) -> tuple:
+        value = getattr(task, sort)
+        return value is not None, value, task.id or ""
+
+    return key
+
+
+async def _merge_streams(first: AsyncIterator[TaskModel],
+                         second: AsyncIterator[TaskModel],
+                         key: Callable[[TaskModel], tuple],
+                         reverse: bool) -> AsyncIterator[TaskModel]:
+    """
+    Merge two streams that are each sorted by ``key``.
+    """
+    a = await anext(first, None)
+    b = await anext(second, None)
+    while a is not None and b is not None:
+        if (key(a) >= key(b)) == reverse:
+            yield a
+            a = await anext(first, None)
+        else:
+            yield b
+            b = await anext(second, None)
+    rest, tail = (a, first) if a is not None else (b, second)
+    if rest is not None:
+        yield rest
+        async for task in tail:
+            yield task
+
+
+def task_from_doc(doc: dict,
+                  strict: bool = settings.strict_read_validation) -> TaskModel:
+    """
+    Build a TaskModel from a stored document. Documents were validated on
+    the way in, so unless ``strict`` is set they are trusted and only the
+    enum/id conversions are applied.
+    """
+    doc["_id"] = str(doc["_id"])
+    doc.setdefault("version", 0)
+    if strict:
+        return TaskModel.model_validate(doc)
+    return build_trusted(TaskModel, {
+        "id": doc["_id"],
+        "owner_id": doc["owner_id"],
+        "title": doc["title"],
+        "description": doc.get("description"),
+        "status": _STATUSES[doc["status"]],
+        "priority": _PRIORITIES[doc["priority"]],
+        "created_at": doc["created_at"],
+        "updated_at": doc.get("updated_at"),
+        "version": doc["version"],
+    })
 
 
 class TaskRepositoryImpl(TaskRepository):
     """
     MongoDB implementation of TaskRepository.
+
+    Old resolved tasks are moved to ``tasks_archive`` (TaskArchiveStore).
+    Lists, counts and exports read it too only when they filter on
+    status=resolved or pass include_archived; single-task reads fall back
+    to it on a miss, and single-task writes move the task back first.
+    Bulk patches do not look there (archived ids report not_found).
     """
 
     def __init__(self, db: AsyncIOMotorDatabase):
         self._collection = db.get_collection(COLLECTION_NAME)
+        self._archive = db.get_collection(ARCHIVE_COLLECTION_NAME)
+        self._stats = TaskStatsStore(db)
 
+    @admitted
     async def create(self, task: TaskModel) -> TaskModel:
         payload = task.model_dump(by_alias=True, exclude={"id"})
         try:
@@ -32,32 +149,44 @@ class TaskRepositoryImpl(TaskRepository):
             raise UniqueViolationError("title must be unique per owner")
         except PyMongoError:
             raise RepositoryError()
+        await self._stats.record(task.owner_id, added=[payload])
         return task.model_copy(update={"id": str(res.inserted_id)})
 
+    @admitted
     async def get(self, task_id: TaskId, owner_id: str) -> TaskModel:
         oid = self._to_oid(task_id)
         try:
             doc = await self._collection.find_one(
                 {"_id": oid, "owner_id": owner_id}
             )
+            if doc is None:
+                doc = await self._archive.find_one(
+                    {"_id": oid, "owner_id": owner_id}
+                )
         except PyMongoError:
             raise RepositoryError()
         if doc is None:
             raise NotFoundError("task not found")
-        doc["_id"] = str(doc["_id"])
-        return TaskModel.model_validate(doc)
+        return task_from_doc(doc)
 
+    @admitted
     async def delete(self, task_id: TaskId, owner_id: str) -> None:
         oid = self._to_oid(task_id)
         try:
-            res = await self._collection.delete_one(
-                {"_id": oid, "owner_id": owner_id}
-            )
+            for collection in (self._collection, self._archive):
+                doc = await collection.find_one_and_delete(
+                    {"_id": oid, "owner_id": owner_id},
+                    projection={"status": 1, "priority": 1},
+                )
+                if doc is not None:
+                    break
         except PyMongoError:
             raise RepositoryError()
-        if res.deleted_count == 0:
+        if doc is None:
             raise NotFoundError("task not found")
+        await self._stats.record(owner_id, removed=[doc])
 
+    @admitted
     async def list(
         self,
         limit: int,
@@ -65,82 +194,497 @@ class TaskRepositoryImpl(TaskRepository):
         sort: Literal["created_at", "updated_at"],
         sort_dir: Literal["asc", "desc"],
         filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
     ) -> List[TaskModel]:
-        query: dict = {}
-        if filters:
-            if "owner_id" in filters:
-                query["owner_id"] = filters["owner_id"]
-            if "status" in filters:
-                query["status"] = filters["status"]
-            if "priority" in filters:
-                query["priority"] = filters["priority"]
+        query = self._build_query(filters)
+        if after is not None:
+            query |= self._keyset_clause(sort, sort_dir, after)
+            skip = 0
+        if not self._reads_archive(filters):
+            return await self._find(self._collection, query, sort, sort_dir,
+                                    skip, limit)
+        # Each collection's first skip + limit rows hold the merged page
+        hot, cold = await asyncio.gather(
+            self._find(self._collection, query, sort, sort_dir, 0,
+                       skip + limit),
+            self._find(self._archive, query, sort, sort_dir, 0, skip + limit),
+        )
+        merged = heapq.merge(hot, cold, key=_merge_key(sort),
+                             reverse=sort_dir == "desc")
+        return list(merged)[skip:skip + limit]
 
+    @staticmethod
+    async def _find(collection: AsyncIOMotorCollection, query: dict,
+                    sort: str, sort_dir: Literal["asc", "desc"], skip: int,
+                    limit: int) -> List[TaskModel]:
         sort_order = DESCENDING if sort_dir == "desc" else ASCENDING
-
         try:
-            cursor = self._collection.find(query).sort(sort, sort_order).skip(
-                skip
-            ).limit(limit)
+            # _id breaks ties so keyset pages are stable
+            cursor = collection.find(query).sort(
+                [(sort, sort_order), ("_id", sort_order)]
+            )
+            if skip:
+                cursor = cursor.skip(skip)
+            cursor = cursor.limit(limit)
             items: List[TaskModel] = []
             async for doc in cursor:
-                doc["_id"] = str(doc["_id"])
-                items.append(TaskModel.model_validate(doc))
+                items.append(task_from_doc(doc))
             return items
         except PyMongoError:
             raise RepositoryError()
 
+    @admitted
     async def count(self, filters: Optional[TaskListFilters]) -> int:
-        query: dict = {}
-        if filters:
-            if "owner_id" in filters:
-                query["owner_id"] = filters["owner_id"]
-            if "status" in filters:
-                query["status"] = filters["status"]
-            if "priority" in filters:
-                query["priority"] = filters["priority"]
+        return await self._count_capped(filters, "exact")
+
+    def stream(
+        self,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        batch_size: int,
+    ) -> AsyncIterator[TaskModel]:
+        query = self._build_query(filters)
+        hot = self._stream(self._collection, query, sort, sort_dir,
+                           batch_size)
+        if not self._reads_archive(filters):
+            return hot
+        cold = self._stream(self._archive, query, sort, sort_dir, batch_size)
+        return _merge_streams(hot, cold, _merge_key(sort), sort_dir == "desc")
+
+    @staticmethod
+    async def _stream(collection: AsyncIOMotorCollection, query: dict,
+                      sort: str, sort_dir: Literal["asc", "desc"],
+                      batch_size: int) -> AsyncIterator[TaskModel]:
+        sort_order = DESCENDING if sort_dir == "desc" else ASCENDING
+        cursor = collection.find(query, batch_size=batch_size).sort(
+            [(sort, sort_order), ("_id", sort_order)]
+        )
         try:
-            return await self._collection.count_documents(query)
+            async for doc in cursor:
+                yield task_from_doc(doc)
         except PyMongoError:
             raise RepositoryError()
+        finally:
+            await cursor.close()
 
+    @admitted
+    async def list_page(
+        self,
+        limit: int,
+        skip: int,
+        sort: Literal["created_at", "updated_at"],
+        sort_dir: Literal["asc", "desc"],
+        filters: Optional[TaskListFilters],
+        after: Optional[TaskCursor] = None,
+        count: CountMode = "exact",
+    ) -> Tuple[List[TaskModel], Optional[int]]:
+        page = self.list(limit, skip, sort, sort_dir, filters, after)
+        if count == "none":
+            return await page, None
+        # Both run concurrently on separate pooled connections, so the
+        # latency is one round trip rather than two.
+        items, total = await asyncio.gather(
+            page, self._count_capped(filters, count)
+        )
+        return items, total
+
+    async def _count_capped(self, filters: Optional[TaskListFilters],
+                            count: CountMode) -> int:
+        query = self._build_query(filters)
+        kwargs = {}
+        if count == "estimate":
+            # Stop walking the index after the cap; the result is exact
+            # below it and a lower bound at it.
+            kwargs["limit"] = settings.task_count_estimate_cap
+        try:
+            if not self._reads_archive(filters):
+                return await self._collection.count_documents(query, **kwargs)
+            hot, cold = await asyncio.gather(
+                self._collection.count_documents(query, **kwargs),
+                self._archive.count_documents(query, **kwargs),
+            )
+        except PyMongoError:
+            raise RepositoryError()
+        total = hot + cold
+        if "limit" in kwargs:
+            total = min(total, kwargs["limit"])
+        return total
+
+    @admitted
     async def replace(self, task_id: TaskId, owner_id: str,
-                      task: TaskModel) -> TaskModel:
+                      task: TaskModel,
+                      expected_version: Optional[int] = None) -> TaskModel:
         oid = self._to_oid(task_id)
         payload = task.model_dump(by_alias=True, exclude={"id"})
+        if payload.get("updated_at") is not None:
+            payload["updated_at"] = _stored_time(payload["updated_at"])
+        query = self._write_query(oid, owner_id, expected_version)
+
+        async def write() -> Optional[dict]:
+            try:
+                # The previous status/priority drive the counter update;
+                # the new document is exactly the payload.
+                return await self._collection.find_one_and_replace(
+                    query,
+                    payload,
+                    projection={"status": 1, "priority": 1},
+                    return_document=ReturnDocument.BEFORE,
+                )
+            except DuplicateKeyError:
+                raise UniqueViolationError("title must be unique per owner")
+            except PyMongoError:
+                raise RepositoryError()
+
+        before = await write()
+        if before is None and await self._unarchive(oid, owner_id):
+            before = await write()
+        if before is None:
+            await self._raise_write_miss(oid, owner_id, expected_version)
+        await self._stats.record(owner_id, removed=[before], added=[payload])
+        return task_from_doc(payload | {"_id": oid})
+
+    @admitted
+    async def patch(self, task_id: TaskId, owner_id: str,
+                    update_data: TaskPatchData,
+                    expected_version: Optional[int] = None) -> TaskModel:
+        oid = self._to_oid(task_id)
+        changes = dict(update_data) | {"updated_at": _stored_now()}
+        update_doc = {"$set": changes, "$inc": {"version": 1}}
+        query = self._write_query(oid, owner_id, expected_version)
+
+        async def write() -> Optional[dict]:
+            try:
+                # Take the document as it was to diff counters, then apply
+                # the same $set/$inc locally to get the stored result.
+                return await self._collection.find_one_and_update(
+                    query,
+                    update_doc,
+                    return_document=ReturnDocument.BEFORE,
+                )
+            except DuplicateKeyError:
+                raise UniqueViolationError("title must be unique per owner")
+            except PyMongoError:
+                raise RepositoryError()
+
+        before = await write()
+        if before is None and await self._unarchive(oid, owner_id):
+            update_doc["$unset"] = {RESTORED_FIELD: ""}
+            before = await write()
+        if before is None:
+            await self._raise_write_miss(oid, owner_id, expected_version)
+        before.pop(RESTORED_FIELD, None)
+        after = before | changes | {"version": before.get("version", 0) + 1}
+        await self._stats.record(owner_id, removed=[before], added=[after])
+        return task_from_doc(after)
+
+    @staticmethod
+    def _write_query(oid: ObjectId, owner_id: str,
+                     expected_version: Optional[int]) -> dict:
+        query: dict = {"_id": oid, "owner_id": owner_id}
+        if expected_version is not None:
+            # Documents written before versioning have no field (version 0)
+            query["version"] = (
+                {"$in": [0, None]} if expected_version == 0
+                else expected_version
+            )
+        return query
+
+    async def _unarchive(self, oid: ObjectId, owner_id: str) -> bool:
+        """
+        Move an archived task back into the hot collection so it can be
+        written. False when there is no such archived task.
+        """
         try:
-            doc = await self._collection.find_one_and_replace(
-                {"_id": oid, "owner_id": owner_id},
-                payload,
-                return_document=ReturnDocument.AFTER,
+            doc = await self._archive.find_one(
+                {"_id": oid, "owner_id": owner_id}
             )
-        except DuplicateKeyError:
-            raise UniqueViolationError("title must be unique per owner")
+            if doc is None:
+                return False
+            try:
+                # The write that follows replaces or $unsets the marker
+                await self._collection.insert_one(doc | {RESTORED_FIELD: True})
+            except DuplicateKeyError as e:
+                # Same _id: restored concurrently. Otherwise a hot task
+                # took its title while it was archived.
+                if (e.details or {}).get("keyPattern") != {"_id": 1}:
+                    raise UniqueViolationError(
+                        "title must be unique per owner"
+                    )
+            await self._archive.delete_one({"_id": oid})
         except PyMongoError:
             raise RepositoryError()
-        if doc is None:
-            raise NotFoundError("task not found")
-        doc["_id"] = str(doc["_id"])
-        return TaskModel.model_validate(doc)
+        return True
 
-    async def patch(self, task_id: TaskId, owner_id: str,
-                    update_data: TaskPatchData) -> TaskModel:
-        oid = self._to_oid(task_id)
-        update_doc = {
-            "$set": dict(update_data) | {"updated_at": datetime.now(UTC)}}
+    async def _raise_write_miss(self, oid: ObjectId, owner_id: str,
+                                expected_version: Optional[int]) -> None:
+        """
+        A conditional write matched nothing: tell "gone" from "changed".
+        """
+        if expected_version is not None:
+            try:
+                exists = await self._collection.count_documents(
+                    {"_id": oid, "owner_id": owner_id}, limit=1
+                )
+            except PyMongoError:
+                raise RepositoryError()
+            if exists:
+                raise PreconditionFailedError()
+        raise NotFoundError("task not found")
+
+    @admitted
+    async def create_many(self,
+                          tasks: List[TaskModel]) -> List[TaskBulkOutcome]:
+        # insert_many assigns _id to each payload before sending, so ids
+        # are known for the successful items even when the batch errors.
+        payloads = [t.model_dump(by_alias=True, exclude={"id"}) for t in tasks]
         try:
-            doc = await self._collection.find_one_and_update(
-                {"_id": oid, "owner_id": owner_id},
-                update_doc,
-                return_document=ReturnDocument.AFTER,
+            await self._collection.insert_many(payloads, ordered=False)
+            write_errors: dict = {}
+        except BulkWriteError as e:
+            write_errors = self._write_errors_by_index(e)
+        except PyMongoError:
+            raise RepositoryError()
+
+        outcomes: List[TaskBulkOutcome] = []
+        inserted: dict = defaultdict(list)
+        for i, (task, payload) in enumerate(zip(tasks, payloads)):
+            if i in write_errors:
+                outcomes.append(write_errors[i])
+            else:
+                inserted[task.owner_id].append(payload)
+                outcomes.append(
+                    task.model_copy(update={"id": str(payload["_id"])})
+                )
+        for owner_id, docs in inserted.items():
+            await self._stats.record(owner_id, added=docs)
+        return outcomes
+
+    @admitted
+    async def patch_many(
+        self, owner_id: str, updates: List[Tuple[TaskId, TaskPatchData]]
+    ) -> List[TaskBulkOutcome]:
+        now = _stored_now()
+        outcomes: List[Optional[TaskBulkOutcome]] = [None] * len(updates)
+        items: List[Tuple[int, ObjectId, dict]] = []
+        for i, (task_id, data) in enumerate(updates):
+            try:
+                oid = self._to_oid(task_id)
+            except InvalidIdError as e:
+                outcomes[i] = e
+                continue
+            items.append((i, oid, dict(data) | {"updated_at": now}))
+
+        async def patch_one(oid: ObjectId,
+                            changes: dict) -> TaskBulkOutcome | dict:
+            # Like patch(): the document as this write found it drives the
+            # counter update, so only writes that took effect are counted
+            try:
+                before = await self._collection.find_one_and_update(
+                    {"_id": oid, "owner_id": owner_id},
+                    {"$set": changes, "$inc": {"version": 1}},
+                    return_document=ReturnDocument.BEFORE,
+                )
+            except DuplicateKeyError:
+                return UniqueViolationError("title must be unique per owner")
+            except PyMongoError:
+                # This item only: the others' writes are applied already
+                # and must still be counted
+                return RepositoryError()
+            if before is None:
+                return NotFoundError("task not found")
+            return before
+
+        results = await gather_bounded([
+            lambda oid=oid, changes=changes: patch_one(oid, changes)
+            for _, oid, changes in items
+        ])
+        removed, added = [], []
+        for (i, _, changes), result in zip(items, results):
+            if isinstance(result, RepositoryError):
+                outcomes[i] = result
+                continue
+            after = result | changes | {
+                "version": result.get("version", 0) + 1
+            }
+            removed.append(result)
+            added.append(after)
+            outcomes[i] = task_from_doc(after)
+        await self._stats.record(owner_id, removed=removed, added=added)
+        return outcomes
+
+    @admitted
+    async def get_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[TaskBulkOutcome]:
+        outcomes: List[TaskBulkOutcome] = [None] * len(task_ids)
+        oids: dict = {}
+        for i, task_id in enumerate(task_ids):
+            try:
+                oids[i] = self._to_oid(task_id)
+            except InvalidIdError as e:
+                outcomes[i] = e
+        # One $in per collection; the archive only for ids not found hot
+        unique = list(dict.fromkeys(oids.values()))
+        docs = await self._find_by_ids(owner_id, unique)
+        missing = [oid for oid in unique if str(oid) not in docs]
+        docs |= await self._find_by_ids(
+            owner_id, missing, collection=self._archive
+        )
+        tasks = {task_id: task_from_doc(doc) for task_id, doc in docs.items()}
+        for i, oid in oids.items():
+            task = tasks.get(str(oid))
+            outcomes[i] = task if task is not None \
+                else NotFoundError("task not found")
+        return outcomes
+
+    @admitted
+    async def delete_many(
+        self, owner_id: str, task_ids: List[TaskId]
+    ) -> List[Optional[RepositoryError]]:
+        outcomes: List[Optional[RepositoryError]] = [None] * len(task_ids)
+        oids: dict = {}
+        for i, task_id in enumerate(task_ids):
+            try:
+                oids[i] = self._to_oid(task_id)
+            except InvalidIdError as e:
+                outcomes[i] = e
+
+        async def delete_one(oid: ObjectId
+                             ) -> Optional[dict] | RepositoryError:
+            # find_one_and_delete returns what this call removed, so a
+            # concurrent delete (or the archiver moving the task) is never
+            # reported or counted twice
+            query = {"_id": oid, "owner_id": owner_id}
+            projection = {"status": 1, "priority": 1}
+            try:
+                doc = await self._collection.find_one_and_delete(
+                    query, projection=projection
+                )
+                if doc is None:
+                    doc = await self._archive.find_one_and_delete(
+                        query, projection=projection
+                    )
+            except PyMongoError:
+                # This item only: the others are deleted already and must
+                # still be counted
+                return RepositoryError()
+            return doc
+
+        removed = await gather_bounded([
+            lambda oid=oid: delete_one(oid) for oid in oids.values()
+        ])
+        deleted = []
+        for i, result in zip(oids, removed):
+            if isinstance(result, RepositoryError):
+                outcomes[i] = result
+            elif result is None:
+                outcomes[i] = NotFoundError("task not found")
+            else:
+                deleted.append(result)
+        await self._stats.record(owner_id, removed=deleted)
+        return outcomes
+
+    @admitted
+    async def stats(self, owner_id: str) -> TaskStats:
+        return await self._stats.get(owner_id)
+
+    @admitted
+    async def rebuild_stats(self, owner_id: Optional[str] = None) -> int:
+        """
+        Recompute the counters documents from the tasks collection.
+        """
+        return await self._stats.rebuild(
+            self._collection, owner_id, archive=ARCHIVE_COLLECTION_NAME
+        )
+
+    async def _find_by_ids(
+            self, owner_id: str, oids: List[ObjectId],
+            projection: Optional[dict] = None,
+            collection: Optional[AsyncIOMotorCollection] = None) -> dict:
+        """
+        Fetch the owner's tasks among ``oids``, keyed by string id (from
+        the hot collection unless ``collection`` is given).
+        """
+        if not oids:
+            return {}
+        collection = collection if collection is not None \
+            else self._collection
+        try:
+            cursor = collection.find(
+                {"_id": {"$in": oids}, "owner_id": owner_id}, projection
             )
-        except DuplicateKeyError:
-            raise UniqueViolationError("title must be unique per owner")
+            docs = {}
+            async for doc in cursor:
+                doc["_id"] = str(doc["_id"])
+                docs[doc["_id"]] = doc
+            return docs
         except PyMongoError:
             raise RepositoryError()
-        if doc is None:
-            raise NotFoundError("task not found")
-        doc["_id"] = str(doc["_id"])
-        return TaskModel.model_validate(doc)
+
+    @staticmethod
+    def _write_errors_by_index(exc: BulkWriteError) -> dict:
+        errors = {}
+        for err in exc.details.get("writeErrors", []):
+            if err.get("code") == DUPLICATE_KEY_CODE:
+                errors[err["index"]] = UniqueViolationError(
+                    "title must be unique per owner"
+                )
+            else:
+                errors[err["index"]] = RepositoryError()
+        if exc.details.get("writeConcernErrors"):
+            raise RepositoryError()
+        return errors
+
+    @staticmethod
+    def _reads_archive(filters: Optional[TaskListFilters]) -> bool:
+        """
+        Only requests that ask for resolved or archived tasks pay for a
+        second query against the archive.
+        """
+        if not filters:
+            return False
+        return bool(filters.get("include_archived")) \
+            or filters.get("status") == TaskStatus.RESOLVED
+
+    @staticmethod
+    def _build_query(filters: Optional[TaskListFilters]) -> dict:
+        query: dict = {}
+        if filters:
+            if "owner_id" in filters:
+                query["owner_id"] = filters["owner_id"]
+            if "status" in filters:
+                query["status"] = filters["status"]
+            if "priority" in filters:
+                query["priority"] = filters["priority"]
+        return query
+
+    @classmethod
+    def _keyset_clause(cls, sort: str, sort_dir: Literal["asc", "desc"],
+                       after: TaskCursor) -> dict:
+        """
+        Match everything strictly after ``after`` in ``(sort, _id)`` order.
+        BSON orders null below any date, so nulls come last when descending
+        and first when ascending.
+        """
+        desc = sort_dir == "desc"
+        op = "$lt" if desc else "$gt"
+        oid = cls._to_oid(after["id"])
+        value = after["value"]
+        if value is None:
+            if desc:
+                return {sort: None, "_id": {op: oid}}
+            return {"$or": [
+                {sort: None, "_id": {op: oid}},
+                {sort: {"$ne": None}},
+            ]}
+        branches: List[dict] = [
+            {sort: {op: value}},
+            {sort: value, "_id": {op: oid}},
+        ]
+        if desc:
+            branches.append({sort: None})
+        return {"$or": branches}
 
     @staticmethod
     def _to_oid(task_id: str) -> ObjectId:
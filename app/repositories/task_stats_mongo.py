@@ -0,0 +1,125 @@
+import logging
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import ReplaceOne
+from pymongo.errors import PyMongoError
+
+from app.models.task_model import TaskStats, TaskStatus, TaskPriority
+from app.repositories.errors import RepositoryError
+
+STATS_COLLECTION_NAME = "task_stats"
+
+logger = logging.getLogger(__name__)
+
+
+def _counter_keys(doc: dict) -> Iterable[str]:
+    yield "total"
+    yield f"status.{doc['status']}"
+    yield f"priority.{doc['priority']}"
+
+
+class TaskStatsStore:
+    """
+    Per-owner counters document ({_id: owner_id, total, status.*,
+    priority.*}) kept in step with task writes via $inc, so dashboard
+    reads are a single _id lookup.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._collection = db.get_collection(STATS_COLLECTION_NAME)
+
+    async def record(self, owner_id: str, removed: Iterable[dict] = (),
+                     added: Iterable[dict] = ()) -> None:
+        """
+        Apply the counter change of replacing ``removed`` task documents
+        with ``added`` ones (each needs ``status`` and ``priority``).
+        """
+        delta: Counter = Counter()
+        for doc in removed:
+            delta.subtract(_counter_keys(doc))
+        for doc in added:
+            delta.update(_counter_keys(doc))
+        inc = {k: v for k, v in delta.items() if v}
+        if not inc:
+            return
+        try:
+            await self._collection.update_one(
+                {"_id": owner_id}, {"$inc": inc}, upsert=True
+            )
+        except PyMongoError:
+            # The task write already succeeded; failing the request would
+            # invite a retry. Counters drift until rebuild() repairs them.
+            logger.warning("task stats update failed for owner %s", owner_id)
+
+    async def get(self, owner_id: str) -> TaskStats:
+        try:
+            doc = await self._collection.find_one({"_id": owner_id})
+        except PyMongoError:
+            raise RepositoryError()
+        stats = TaskStats()
+        if doc is None:
+            return stats
+        stats.total = doc.get("total", 0)
+        for key, value in doc.get("status", {}).items():
+            stats.status[TaskStatus(key)] = value
+        for key, value in doc.get("priority", {}).items():
+            stats.priority[TaskPriority(key)] = value
+        return stats
+
+    async def rebuild(self, tasks: AsyncIOMotorCollection,
+                      owner_id: Optional[str] = None,
+                      archive: Optional[str] = None) -> int:
+        """
+        Recompute counters from the tasks collection (plus the ``archive``
+        collection, if given) with one aggregation, for one owner or
+        everyone. Returns the number of owners written. Concurrent writes
+        during a rebuild may be missed; run it again if in doubt.
+        """
+        pipeline: list = []
+        if owner_id is not None:
+            pipeline.append({"$match": {"owner_id": owner_id}})
+        if archive is not None:
+            pipeline.append({"$unionWith": {
+                "coll": archive, "pipeline": list(pipeline),
+            }})
+        pipeline.append({"$group": {
+            "_id": {
+                "owner_id": "$owner_id",
+                "status": "$status",
+                "priority": "$priority",
+            },
+            "n": {"$sum": 1},
+        }})
+
+        counters: Dict[str, Counter] = defaultdict(Counter)
+        try:
+            async for row in tasks.aggregate(pipeline):
+                key = row["_id"]
+                for counter_key in _counter_keys(key):
+                    counters[key["owner_id"]][counter_key] += row["n"]
+
+            ops = [
+                ReplaceOne({"_id": owner}, self._as_document(c), upsert=True)
+                for owner, c in counters.items()
+            ]
+            if ops:
+                await self._collection.bulk_write(ops, ordered=False)
+            stale = {"_id": {"$nin": list(counters)}}
+            if owner_id is not None:
+                stale = {"_id": owner_id} if not counters else None
+            if stale is not None:
+                await self._collection.delete_many(stale)
+        except PyMongoError:
+            raise RepositoryError()
+        return len(counters)
+
+    @staticmethod
+    def _as_document(counter: Counter) -> dict:
+        doc: dict = {"total": counter["total"], "status": {}, "priority": {}}
+        for key, value in counter.items():
+            group, _, name = key.partition(".")
+            if name:
+                doc[group][name] = value
+        return doc
@@ -0,0 +1,16 @@
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user_model import UserModel
+from app.repositories.user_repository import UserId
+
+# Per-worker cache of authenticated users, keyed by user id.
+# Repository methods that mutate a user must call ``invalidate_user``.
+user_cache: TTLCache[UserId, UserModel] = TTLCache(
+    "users",
+    max_size=settings.user_cache_max_size,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+
+
+def invalidate_user(user_id: UserId) -> None:
+    user_cache.invalidate(user_id)
@@ -0,0 +1,66 @@
+from typing import Dict, Optional
+
+from bson import ObjectId
+
+from app.models.user_model import UserModel
+from app.repositories.errors import UniqueViolationError, NotFoundError, \
+    InvalidIdError
+from app.repositories.user_cache import invalidate_user
+from app.repositories.user_repository import UserRepository, UserId
+
+
+class MemoryUserStore:
+    """
+    In-process user storage. Usernames and emails are unique
+    case-insensitively (like uniq_username/uniq_email); lookups by
+    username are exact, as the Mongo query has no collation.
+    """
+
+    def __init__(self) -> None:
+        self.users: Dict[str, UserModel] = {}
+        self.by_username: Dict[str, str] = {}
+        self.unique_usernames: Dict[str, str] = {}
+        self.unique_emails: Dict[str, str] = {}
+
+
+_store = MemoryUserStore()
+
+
+def get_user_store() -> MemoryUserStore:
+    return _store
+
+
+class MemoryUserRepository(UserRepository):
+    """
+    In-process implementation of UserRepository (REPOSITORY_BACKEND=memory).
+    """
+
+    def __init__(self, store: MemoryUserStore):
+        self._store = store
+
+    async def get_by_username(self, username: str) -> Optional[UserModel]:
+        user_id = self._store.by_username.get(username)
+        return self._store.users[user_id] if user_id is not None else None
+
+    async def get_by_id(self, user_id: UserId) -> UserModel:
+        if not ObjectId.is_valid(user_id):
+            raise InvalidIdError("invalid user id format")
+        user = self._store.users.get(str(ObjectId(user_id)))
+        if user is None:
+            raise NotFoundError("user not found")
+        return user
+
+    async def create(self, user: UserModel) -> UserModel:
+        username_key = user.username.casefold()
+        email_key = str(user.email).casefold()
+        if username_key in self._store.unique_usernames or \
+                email_key in self._store.unique_emails:
+            raise UniqueViolationError("username or email already exists")
+        user_id = str(ObjectId())
+        stored = user.model_copy(update={"id": user_id})
+        self._store.users[user_id] = stored
+        self._store.by_username[user.username] = user_id
+        self._store.unique_usernames[username_key] = user_id
+        self._store.unique_emails[email_key] = user_id
+        invalidate_user(user_id)
+        return stored
@@ -3,7 +3,9 @@ from bson import ObjectId, errors as bson_errors
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.errors import PyMongoError, DuplicateKeyError
 
+from app.core.admission import admitted
 from app.models.user_model import UserModel
+from app.repositories.user_cache import invalidate_user
 from app.repositories.errors import RepositoryError, UniqueViolationError, \
     NotFoundError, InvalidIdError
 from app.repositories.user_repository import UserRepository, UserId
@@ -19,6 +21,7 @@ class UserRepositoryImpl(UserRepository):
     def __init__(self, db: AsyncIOMotorDatabase):
         self._collection = db.get_collection(COLLECTION_NAME)
 
+    @admitted
     async def get_by_username(self, username: str) -> Optional[UserModel]:
         try:
             doc = await self._collection.find_one({"username": username})
@@ -29,6 +32,7 @@ class UserRepositoryImpl(UserRepository):
         doc["_id"] = str(doc["_id"])
         return UserModel.model_validate(doc)
 
+    @admitted
     async def get_by_id(self, user_id: UserId) -> UserModel:
         try:
             oid = ObjectId(user_id)
@@ -43,6 +47,7 @@ class UserRepositoryImpl(UserRepository):
         doc["_id"] = str(doc["_id"])
         return UserModel.model_validate(doc)
 
+    @admitted
     async def create(self, user: UserModel) -> UserModel:
         payload = user.model_dump(by_alias=True, exclude={"id"})
         try:
@@ -53,4 +58,6 @@ class UserRepositoryImpl(UserRepository):
             ) from e
         except PyMongoError as e:
             raise RepositoryError() from e
-        return user.model_copy(update={"id": str(res.inserted_id)})
+        user_id = str(res.inserted_id)
+        invalidate_user(user_id)
+        return user.model_copy(update={"id": user_id})
@@ -1,10 +1,12 @@
 from datetime import datetime
 from enum import StrEnum
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Dict
 
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import Field, ConfigDict, model_validator, field_validator
 
-from app.models.task_model import TaskStatus, TaskPriority
+from app.core.config import settings
+from app.models.task_model import TaskModel, TaskStatus, TaskPriority
+from app.models.trusted import build_trusted
 from .base import RequestBaseModel, ResponseBaseModel
 
 
@@ -45,6 +47,51 @@ class TaskPatchUpdate(RequestBaseModel):
         raise ValueError("At least one field must be provided")
 
 
+class TaskBulkCreate(RequestBaseModel):
+    items: List[TaskCreate] = Field(
+        min_length=1, max_length=settings.task_bulk_max_items
+    )
+
+
+class TaskBulkPatchItem(TaskPatchUpdate):
+    id: str
+
+
+class TaskBulkPatch(RequestBaseModel):
+    items: List[TaskBulkPatchItem] = Field(
+        min_length=1, max_length=settings.task_bulk_max_items
+    )
+
+
+class TaskBulkDelete(RequestBaseModel):
+    ids: List[str] = Field(
+        min_length=1, max_length=settings.task_bulk_max_items
+    )
+
+
+class TaskBatchGet(RequestBaseModel):
+    ids: List[str] = Field(
+        min_length=1, max_length=settings.task_bulk_max_items,
+        description="Task ids (repeated or comma-separated in the query)"
+    )
+
+    @field_validator("ids", mode="before")
+    @classmethod
+    def split_comma_separated(cls, value):
+        if isinstance(value, str):
+            value = [value]
+        if not isinstance(value, list):
+            return value
+        ids = []
+        for item in value:
+            if not isinstance(item, str):
+                ids.append(item)
+                continue
+            ids.extend(part.strip() for part in item.split(",")
+                       if part.strip())
+        return ids
+
+
 # --- Responses ---
 class TaskResponse(ResponseBaseModel):
     id: str = Field(alias="_id")
@@ -56,13 +103,57 @@ class TaskResponse(ResponseBaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    @classmethod
+    def from_model(
+        cls, task: TaskModel, strict: bool = settings.strict_read_validation
+    ) -> "TaskResponse":
+        """
+        Build the response from a domain model without revalidating it
+        (unless ``strict``); the domain model is already trusted.
+        """
+        if strict:
+            return cls.model_validate(task)
+        return build_trusted(cls, {
+            "id": task.id,
+            "owner_id": task.owner_id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status,
+            "priority": task.priority,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        })
+
+
+class TaskStatsResponse(ResponseBaseModel):
+    total: int
+    status: Dict[TaskStatus, int]
+    priority: Dict[TaskPriority, int]
+
+
+class TaskBulkItemResult(ResponseBaseModel):
+    index: int
+    id: Optional[str] = None
+    status: Literal[
+        "created", "updated", "deleted", "found", "conflict", "not_found",
+        "invalid_id", "error"
+    ]
+    detail: Optional[str] = None
+    task: Optional[TaskResponse] = None
+
+
+class TaskBulkResult(ResponseBaseModel):
+    items: List[TaskBulkItemResult]
+
 
 class PageMeta(ResponseBaseModel):
-    total: int
+    total: Optional[int]
+    count: Literal["exact", "estimate", "none"]
     limit: int
     skip: int
     sort: Literal["created_at", "updated_at"]
     sort_dir: Literal["asc", "desc"]
+    next_cursor: Optional[str] = None
 
 
 class TaskList(ResponseBaseModel):
@@ -76,7 +167,14 @@ class TaskQueryParams(RequestBaseModel):
         50, ge=1, le=100, description="Max number of tasks to return"
     )
     skip: int = Field(
-        0, ge=0, description="Number of tasks to skip from the beginning"
+        0, ge=0,
+        description="Number of tasks to skip from the beginning (legacy; "
+                    "prefer cursor)"
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor from meta.next_cursor; skip is ignored "
+                    "when set"
     )
     sort: Literal["created_at", "updated_at"] = Field(
         default="created_at", description="Sort field"
@@ -84,11 +182,40 @@ class TaskQueryParams(RequestBaseModel):
     sort_dir: Literal["asc", "desc"] = Field(
         default="desc", description="Sort direction"
     )
+    count: Literal["exact", "estimate", "none"] = Field(
+        default="exact",
+        description="How to compute meta.total: exact, estimate (capped "
+                    "count) or none (skip counting; use next_cursor)"
+    )
+    status: Optional[TaskStatus] = Field(
+        default=None, description="Filter by status"
+    )
+    priority: Optional[TaskPriority] = Field(
+        default=None, description="Filter by priority"
+    )
+    include_archived: bool = Field(
+        default=False,
+        description="Also return archived (old resolved) tasks; implied "
+                    "by status=resolved"
+    )
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+
+class TaskExportParams(RequestBaseModel):
+    format: Literal["ndjson", "csv"] = Field(
+        default="ndjson", description="Export format"
+    )
     status: Optional[TaskStatus] = Field(
         default=None, description="Filter by status"
     )
     priority: Optional[TaskPriority] = Field(
         default=None, description="Filter by priority"
     )
+    include_archived: bool = Field(
+        default=False,
+        description="Also return archived (old resolved) tasks; implied "
+                    "by status=resolved"
+    )
 
     model_config = ConfigDict(str_strip_whitespace=True)
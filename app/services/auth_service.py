@@ -1,6 +1,6 @@
 from app.core.config import settings
-from app.core.security import get_password_hash, verify_password, \
-    create_access_token
+from app.core.password_hasher import get_password_hasher
+from app.core.security import create_access_token
 from app.models.user_model import UserModel
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth_schema import UserCreate
@@ -14,7 +14,7 @@ class AuthService:
     @staticmethod
     async def register_user(data: UserCreate,
                             repo: UserRepository) -> UserModel:
-        hashed = get_password_hash(data.password)
+        hashed = await get_password_hasher().hash(data.password)
         user = UserModel(
             username=data.username, email=data.email, hashed_password=hashed
         )
@@ -24,7 +24,9 @@ class AuthService:
     async def authenticate_user(username: str, password: str,
                                 repo: UserRepository) -> UserModel | None:
         user = await repo.get_by_username(username)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await get_password_hasher().verify(
+            password, user.hashed_password
+        ):
             return None
         return user
 
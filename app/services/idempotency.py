@@ -0,0 +1,149 @@
+import asyncio
+from datetime import datetime, timedelta, UTC
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.errors import IdempotencyInProgressError, \
+    IdempotencyKeyReusedError
+from app.core.metrics import Counter
+from app.repositories.idempotency_repository import IdempotencyRepository, \
+    IdempotencyRecord
+
+IDEMPOTENT_REPLAYS = Counter(
+    "idempotent_replays_total",
+    "Stored responses replayed for a repeated Idempotency-Key.",
+)
+
+# Polling for a key reserved by another worker
+_POLL_INITIAL_SECONDS = 0.05
+_POLL_MAX_SECONDS = 0.5
+
+# Completed responses, so repeats on this worker skip the database
+idempotency_cache: TTLCache[str, IdempotencyRecord] = TTLCache(
+    "idempotency",
+    max_size=settings.idempotency_cache_max_size,
+    ttl_seconds=settings.idempotency_ttl_seconds,
+)
+# Keys this worker is running right now -> resolved when they finish
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+def _replay(record: IdempotencyRecord,
+            fingerprint: str) -> Tuple[IdempotencyRecord, bool]:
+    if record.fingerprint != fingerprint:
+        raise IdempotencyKeyReusedError()
+    IDEMPOTENT_REPLAYS.inc()
+    return record, True
+
+
+class IdempotencyService:
+    """
+    Runs a request at most once per Idempotency-Key.
+
+    The first request reserves the key, runs, and stores its response;
+    repeats within IDEMPOTENCY_TTL_SECONDS get that response back.
+    Duplicates arriving while the first is still running wait for it
+    (an in-process future on the same worker, polling otherwise) for up to
+    IDEMPOTENCY_WAIT_MS, then get 409. Only successful responses are
+    stored: if the first request fails, its reservation is released and
+    the next duplicate runs instead.
+    """
+
+    @staticmethod
+    async def execute(
+        key: str, fingerprint: str,
+        produce: Callable[[], Awaitable[IdempotencyRecord]],
+        repository: IdempotencyRepository,
+    ) -> Tuple[IdempotencyRecord, bool]:
+        """
+        Returns the response record and whether it was replayed.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.idempotency_wait_ms / 1000
+        while True:
+            cached = idempotency_cache.get(key)
+            if cached is not None:
+                return _replay(cached, fingerprint)
+            pending = _in_flight.get(key)
+            if pending is not None:
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(pending),
+                        max(deadline - loop.time(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    raise IdempotencyInProgressError()
+                continue
+
+            future = loop.create_future()
+            _in_flight[key] = future
+            try:
+                existing = await repository.reserve(
+                    key, fingerprint,
+                    timedelta(seconds=settings.idempotency_lease_seconds),
+                    timedelta(seconds=settings.idempotency_ttl_seconds),
+                )
+                if existing is None:
+                    return await IdempotencyService._run(
+                        key, produce, repository
+                    ), False
+            finally:
+                del _in_flight[key]
+                future.set_result(None)
+            if existing.fingerprint != fingerprint:
+                raise IdempotencyKeyReusedError()
+            if not existing.completed:
+                existing = await IdempotencyService._wait_elsewhere(
+                    key, repository, deadline
+                )
+                if existing is None:
+                    continue  # free again; try to reserve it
+            idempotency_cache.set(key, existing)
+            return _replay(existing, fingerprint)
+
+    @staticmethod
+    async def _run(
+        key: str, produce: Callable[[], Awaitable[IdempotencyRecord]],
+        repository: IdempotencyRepository,
+    ) -> IdempotencyRecord:
+        try:
+            record = await produce()
+        except Exception:
+            try:
+                await repository.release(key)
+            except Exception:
+                pass  # the lease runs out instead
+            raise
+        record.completed = True
+        await repository.complete(
+            key, record,
+            timedelta(seconds=settings.idempotency_ttl_seconds),
+        )
+        idempotency_cache.set(key, record)
+        return record
+
+    @staticmethod
+    async def _wait_elsewhere(
+        key: str, repository: IdempotencyRepository, deadline: float
+    ) -> Optional[IdempotencyRecord]:
+        """
+        Wait for a key another worker is running. Returns the completed
+        record, or None once the key is free to be reserved again.
+        """
+        loop = asyncio.get_running_loop()
+        delay = _POLL_INITIAL_SECONDS
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise IdempotencyInProgressError()
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX_SECONDS)
+            record = await repository.get(key)
+            if record is None:
+                return None
+            if record.completed:
+                return record
+            if record.locked_until is not None and \
+                    record.locked_until < datetime.now(UTC):
+                return None  # its holder died; take it over
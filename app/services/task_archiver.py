@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from app.core.config import settings
+from app.core.errors import ServiceOverloadedError
+from app.core.metrics import Counter
+from app.core.response_cache import bump_owner_generation
+from app.repositories.errors import RepositoryError
+from app.repositories.task_archive_mongo import TaskArchiveStore
+
+logger = logging.getLogger(__name__)
+
+TASKS_ARCHIVED = Counter(
+    "tasks_archived_total",
+    "Resolved tasks moved from the hot collection to the archive.",
+)
+
+
+class TaskArchiver:
+    """
+    Background job moving old resolved tasks to the archive in batches.
+
+    One worker in the cluster runs at a time (lock document, renewed per
+    batch). Batches are throttled by a pause in between, and batches go
+    through admission control, so the job backs off as soon as request
+    traffic saturates the pool instead of competing with it.
+    """
+
+    def __init__(self, store: TaskArchiveStore, after: timedelta,
+                 batch_size: int, pause: float, interval: float) -> None:
+        self._store = store
+        self._after = after
+        self._batch_size = batch_size
+        self._pause = pause
+        self._interval = interval
+        self._lock_owner = uuid.uuid4().hex
+        # A holder that dies mid-run is replaced after this long
+        self._lock_ttl = timedelta(seconds=max(60.0, interval))
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self, max_batches: Optional[int] = None) -> int:
+        """
+        Archive until no candidates are left (or ``max_batches``);
+        returns the number of tasks moved. Skips if another process holds
+        the lock.
+        """
+        moved = 0
+        batches = 0
+        cutoff = datetime.now(UTC) - self._after
+        try:
+            while max_batches is None or batches < max_batches:
+                if not await self._store.try_lock(self._lock_owner,
+                                                  self._lock_ttl):
+                    logger.info("task archiver running elsewhere")
+                    break
+                owners = await self._store.archive_batch(
+                    cutoff, self._batch_size
+                )
+                batches += 1
+                moved += len(owners)
+                TASKS_ARCHIVED.inc(len(owners))
+                for owner_id in set(owners):
+                    await bump_owner_generation(owner_id)
+                if len(owners) < self._batch_size:
+                    break
+                await asyncio.sleep(self._pause)
+        finally:
+            await self._store.unlock(self._lock_owner)
+        if moved:
+            logger.info("archived %d resolved task(s)", moved)
+        return moved
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except ServiceOverloadedError:
+                logger.info("task archiver backing off: database busy")
+            except RepositoryError:
+                logger.warning("task archiver run failed", exc_info=True)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def build_task_archiver(store: TaskArchiveStore) -> TaskArchiver:
+    return TaskArchiver(
+        store,
+        after=timedelta(days=settings.task_archive_after_days),
+        batch_size=settings.task_archive_batch_size,
+        pause=settings.task_archive_batch_pause_ms / 1000,
+        interval=settings.task_archive_interval_seconds,
+    )
+
+
+_archiver: Optional[TaskArchiver] = None
+
+
+def start_task_archiver(store: TaskArchiveStore) -> None:
+    """
+    Start this worker's archiver loop (a no-op if already running).
+    """
+    global _archiver
+    if _archiver is None:
+        _archiver = build_task_archiver(store)
+    _archiver.start()
+
+
+async def close_task_archiver() -> None:
+    """
+    Stop the archiver loop and reset the singleton.
+    """
+    global _archiver
+    if _archiver is not None:
+        await _archiver.stop()
+        _archiver = None
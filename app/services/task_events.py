@@ -0,0 +1,262 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Set
+
+from pymongo.errors import PyMongoError, OperationFailure
+
+from app.core.config import settings
+from app.core.errors import ServiceOverloadedError
+from app.core.metrics import Counter
+from app.repositories.task_change_stream import TaskChangeStream, \
+    TaskChange, RESUME_FAILED_CODES, UNSUPPORTED_CODES
+from app.schemas.task_schema import TaskResponse
+
+logger = logging.getLogger(__name__)
+
+TASK_EVENTS_PUBLISHED = Counter(
+    "task_events_published_total",
+    "Task change events received from the change stream.",
+)
+TASK_EVENTS_OVERFLOWS = Counter(
+    "task_events_overflows_total",
+    "SSE subscribers reset because their buffer filled up.",
+)
+
+# Sent instead of events the client can no longer get: refetch the list
+RESET_FRAME = b"event: reset\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+_MAX_BACKOFF_SECONDS = 30.0
+# How long the first subscriber waits to learn whether the stream opens
+_OPEN_TIMEOUT_SECONDS = 5.0
+
+
+class TaskEventsBusyError(ServiceOverloadedError):
+    DEFAULT_MESSAGE = "too many event stream subscribers"
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    id: str
+    owner_id: str
+    frame: bytes
+
+
+def encode_event(change: TaskChange) -> TaskEvent:
+    """
+    Render a change once as an SSE frame shared by all subscribers.
+    """
+    if change.task is not None:
+        data = TaskResponse.from_model(change.task).model_dump_json()
+    else:
+        data = json.dumps({"id": change.task_id})
+    frame = (f"id: {change.token}\nevent: {change.type}\n"
+             f"data: {data}\n\n").encode()
+    return TaskEvent(id=change.token, owner_id=change.owner_id, frame=frame)
+
+
+@dataclass(eq=False)
+class Subscription:
+    owner_id: str
+    queue: "asyncio.Queue[bytes]" = field(default_factory=asyncio.Queue)
+    closed: bool = False
+
+
+class TaskEventHub:
+    """
+    Fan out one change stream to per-owner subscribers.
+
+    Each subscriber gets at most ``buffer_size`` undelivered frames; a
+    slower client is sent a reset and dropped instead of growing memory.
+    The last ``replay_size`` events are kept so a reconnecting client can
+    resume from its Last-Event-ID. Every worker watches the same stream,
+    so the ids (change stream resume tokens) are valid on any worker.
+    """
+
+    def __init__(self, buffer_size: int, replay_size: int,
+                 max_clients: int) -> None:
+        self._buffer_size = buffer_size
+        self._max_clients = max_clients
+        self._recent: Deque[TaskEvent] = deque(maxlen=replay_size)
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._clients = 0
+        self._pump: Optional[asyncio.Task] = None
+        self._last_token: Optional[str] = None
+        # Resolved True once the stream opened, False if the deployment
+        # cannot run change streams at all
+        self._opened: Optional[asyncio.Future] = None
+
+    def subscribe(self, owner_id: str,
+                  last_event_id: Optional[str] = None) -> Subscription:
+        if self._clients >= self._max_clients:
+            raise TaskEventsBusyError()
+        sub = Subscription(owner_id)
+        if last_event_id:
+            self._replay(sub, last_event_id)
+        self._subscribers.setdefault(owner_id, set()).add(sub)
+        self._clients += 1
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.owner_id)
+        if subs is not None and sub in subs:
+            subs.discard(sub)
+            self._clients -= 1
+            if not subs:
+                del self._subscribers[sub.owner_id]
+        sub.closed = True
+
+    def publish(self, event: TaskEvent) -> None:
+        self._recent.append(event)
+        TASK_EVENTS_PUBLISHED.inc()
+        for sub in list(self._subscribers.get(event.owner_id, ())):
+            self._deliver(sub, event.frame)
+
+    def reset_all(self) -> None:
+        """
+        Tell every subscriber it may have missed events.
+        """
+        self._recent.clear()
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                self._reset(sub)
+
+    def _replay(self, sub: Subscription, last_event_id: str) -> None:
+        ids = [e.id for e in self._recent]
+        if last_event_id not in ids:
+            sub.queue.put_nowait(RESET_FRAME)
+            return
+        start = ids.index(last_event_id) + 1
+        for event in list(self._recent)[start:]:
+            if event.owner_id == sub.owner_id:
+                self._deliver(sub, event.frame)
+
+    def _deliver(self, sub: Subscription, frame: bytes) -> None:
+        if sub.queue.qsize() >= self._buffer_size:
+            TASK_EVENTS_OVERFLOWS.inc()
+            self._reset(sub)
+            return
+        sub.queue.put_nowait(frame)
+
+    def _reset(self, sub: Subscription) -> None:
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(RESET_FRAME)
+        self.unsubscribe(sub)
+
+    async def ensure_pump(self, stream: TaskChangeStream) -> bool:
+        """
+        Start this worker's single change stream reader if not running.
+        False when the deployment does not support change streams
+        (standalone mongod); the reader is then not restarted. Transient
+        failures are retried in the background and do not block callers
+        for longer than _OPEN_TIMEOUT_SECONDS.
+        """
+        if self._opened is None:
+            self._opened = asyncio.get_running_loop().create_future()
+        if self._opened.done() and not self._opened.result():
+            return False
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._run_pump(stream))
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(self._opened), _OPEN_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            return True
+
+    def _set_opened(self, opened: bool) -> None:
+        if self._opened is not None and not self._opened.done():
+            self._opened.set_result(opened)
+
+    async def _run_pump(self, stream: TaskChangeStream) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                async for change in stream.changes(
+                        self._last_token, lambda: self._set_opened(True)):
+                    self.publish(encode_event(change))
+                    self._last_token = change.token
+                    backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as e:
+                if isinstance(e, OperationFailure) and \
+                        e.code in UNSUPPORTED_CODES:
+                    logger.error("change streams are not supported by this "
+                                 "MongoDB deployment (it must be a replica "
+                                 "set); task events are off: %s", e)
+                    self._set_opened(False)
+                    self.reset_all()
+                    return
+                if isinstance(e, OperationFailure) and \
+                        e.code in RESUME_FAILED_CODES:
+                    logger.warning("task change stream cannot resume; "
+                                   "restarting from now: %s", e)
+                    self._last_token = None
+                    self.reset_all()
+                else:
+                    logger.warning("task change stream failed, retrying "
+                                   "in %.0fs: %s", backoff, e)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF_SECONDS)
+
+    async def close(self) -> None:
+        if self._pump is not None:
+            self._pump.cancel()
+            try:
+                await self._pump
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._pump = None
+        self.reset_all()
+
+
+async def stream_events(hub: TaskEventHub, sub: Subscription,
+                        heartbeat_seconds: float):
+    """
+    Yield SSE frames for one subscriber until it is reset or disconnects.
+    """
+    try:
+        while not sub.closed or not sub.queue.empty():
+            try:
+                frame = await asyncio.wait_for(
+                    sub.queue.get(), timeout=heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            yield frame
+            if frame is RESET_FRAME:
+                return
+    finally:
+        hub.unsubscribe(sub)
+
+
+_hub: Optional[TaskEventHub] = None
+
+
+def get_task_event_hub() -> TaskEventHub:
+    """
+    Provide the per-worker event hub singleton.
+    """
+    global _hub
+    if _hub is None:
+        _hub = TaskEventHub(
+            buffer_size=settings.task_events_client_buffer,
+            replay_size=settings.task_events_replay_size,
+            max_clients=settings.task_events_max_clients,
+        )
+    return _hub
+
+
+async def close_task_event_hub() -> None:
+    """
+    Stop the change stream reader, reset subscribers and the singleton.
+    """
+    global _hub
+    if _hub is not None:
+        await _hub.close()
+        _hub = None
@@ -0,0 +1,53 @@
+import csv
+import io
+from typing import AsyncIterator, Literal
+
+from app.models.task_model import TaskModel
+from app.schemas.task_schema import TaskResponse
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_FIELDS = list(TaskResponse.model_fields)
+_EXPORT_INCLUDE = set(EXPORT_FIELDS)
+# Rows are coalesced into chunks of roughly this size before being sent
+_CHUNK_BYTES = 64 * 1024
+
+
+async def _chunked(lines: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for line in lines:
+        buffer += line
+        if len(buffer) >= _CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _ndjson_lines(tasks: AsyncIterator[TaskModel]) -> AsyncIterator[
+    bytes]:
+    async for task in tasks:
+        yield task.model_dump_json(include=_EXPORT_INCLUDE).encode() + b"\n"
+
+
+async def _csv_lines(tasks: AsyncIterator[TaskModel]) -> AsyncIterator[bytes]:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    async for task in tasks:
+        writer.writerow(task.model_dump(mode="json", include=_EXPORT_INCLUDE))
+        yield out.getvalue().encode()
+        out.seek(0)
+        out.truncate()
+    if out.tell():
+        yield out.getvalue().encode()
+
+
+def encode_export(tasks: AsyncIterator[TaskModel],
+                  fmt: ExportFormat) -> AsyncIterator[bytes]:
+    """
+    Encode a task stream as NDJSON or CSV byte chunks, one row at a time.
+    """
+    lines = _ndjson_lines(tasks) if fmt == "ndjson" else _csv_lines(tasks)
+    return _chunked(lines)
@@ -1,10 +1,21 @@
 from datetime import datetime, UTC
-from typing import Tuple, List
+from typing import Tuple, List, Optional, AsyncIterator
 
-from app.models.task_model import TaskModel
+from app.models.task_model import TaskModel, TaskStats
 from app.repositories.task_repository import TaskRepository, TaskId, \
-    TaskPatchData, TaskListFilters
-from app.schemas.task_schema import TaskCreate, TaskPutUpdate, TaskQueryParams
+    TaskPatchData, TaskListFilters, TaskBulkOutcome
+from app.repositories.errors import RepositoryError, \
+    PreconditionFailedError
+from app.repositories.task_cursor import encode_cursor, decode_cursor
+from app.core.config import settings
+from app.core.errors import ConcurrentUpdateError
+from app.core.response_cache import bump_owner_generation
+from app.schemas.task_schema import TaskCreate, TaskPutUpdate, \
+    TaskQueryParams, TaskExportParams
+from app.services.task_export import encode_export
+
+# Re-reads for a PUT without If-Match that keeps losing to concurrent writes
+_REPLACE_ATTEMPTS = 3
 
 
 class TaskService:
@@ -16,55 +27,164 @@ class TaskService:
     async def create_task(owner_id: str, task_data: TaskCreate,
                           repository: TaskRepository) -> TaskModel:
         task = TaskModel(owner_id=owner_id, **task_data.model_dump())
-        return await repository.create(task)
+        created = await repository.create(task)
+        await bump_owner_generation(owner_id)
+        return created
+
+    @staticmethod
+    async def create_tasks(owner_id: str, items: List[TaskCreate],
+                           repository: TaskRepository) -> List[
+        TaskBulkOutcome]:
+        tasks = [
+            TaskModel(owner_id=owner_id, **item.model_dump()) for item in items
+        ]
+        outcomes = await repository.create_many(tasks)
+        await bump_owner_generation(owner_id)
+        return outcomes
+
+    @staticmethod
+    async def patch_tasks(owner_id: str,
+                          updates: List[Tuple[TaskId, TaskPatchData]],
+                          repository: TaskRepository) -> List[
+        TaskBulkOutcome]:
+        outcomes = await repository.patch_many(owner_id, updates)
+        await bump_owner_generation(owner_id)
+        return outcomes
+
+    @staticmethod
+    async def delete_tasks(owner_id: str, task_ids: List[TaskId],
+                           repository: TaskRepository) -> List[
+        Optional[RepositoryError]]:
+        outcomes = await repository.delete_many(owner_id, task_ids)
+        await bump_owner_generation(owner_id)
+        return outcomes
 
     @staticmethod
     async def get_task(task_id: TaskId, owner_id: str,
                        repository: TaskRepository) -> TaskModel:
         return await repository.get(task_id, owner_id)
 
+    @staticmethod
+    async def get_tasks(owner_id: str, task_ids: List[TaskId],
+                        repository: TaskRepository) -> List[TaskBulkOutcome]:
+        return await repository.get_many(owner_id, task_ids)
+
     @staticmethod
     async def delete_task(task_id: TaskId, owner_id: str,
                           repository: TaskRepository) -> None:
-        return await repository.delete(task_id, owner_id)
+        await repository.delete(task_id, owner_id)
+        await bump_owner_generation(owner_id)
 
     @staticmethod
     async def list_tasks(owner_id: str, params: TaskQueryParams,
                          repository: TaskRepository) -> Tuple[
-        List[TaskModel], int]:
+        List[TaskModel], Optional[int], Optional[str]]:
+        """
+        Return one page, the total (None when count="none") and the cursor
+        of the next page (if any).
+        """
         filters: TaskListFilters = {"owner_id": owner_id}
         if params.status is not None:
             filters["status"] = params.status
         if params.priority is not None:
             filters["priority"] = params.priority
+        if params.include_archived:
+            filters["include_archived"] = True
 
-        items = await repository.list(
-            limit=params.limit,
+        after = None
+        if params.cursor is not None:
+            after = decode_cursor(params.cursor, params.sort, params.sort_dir)
+
+        # One extra row tells us whether a next page exists
+        items, total = await repository.list_page(
+            limit=params.limit + 1,
             skip=params.skip,
             sort=params.sort,
             sort_dir=params.sort_dir,
             filters=filters,
+            after=after,
+            count=params.count,
         )
-        total = await repository.count(filters=filters)
-        return items, total
+        next_cursor = None
+        if len(items) > params.limit:
+            items = items[:params.limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                params.sort, params.sort_dir, getattr(last, params.sort),
+                last.id or ""
+            )
+        return items, total, next_cursor
 
     @staticmethod
-    async def replace_task(task_id: TaskId, owner_id: str, data: TaskPutUpdate,
-                           repository: TaskRepository) -> TaskModel:
-        existing = await repository.get(task_id, owner_id)
-        new_model = TaskModel(
-            id=existing.id,
-            owner_id=owner_id,
-            title=data.title,
-            description=data.description,
-            status=data.status,
-            priority=data.priority,
-            created_at=existing.created_at,
-            updated_at=datetime.now(UTC),
+    def export_tasks(owner_id: str, params: TaskExportParams,
+                     repository: TaskRepository) -> AsyncIterator[bytes]:
+        """
+        Stream every matching task, oldest first, as encoded byte chunks.
+        """
+        filters: TaskListFilters = {"owner_id": owner_id}
+        if params.status is not None:
+            filters["status"] = params.status
+        if params.priority is not None:
+            filters["priority"] = params.priority
+        if params.include_archived:
+            filters["include_archived"] = True
+        tasks = repository.stream(
+            sort="created_at", sort_dir="asc", filters=filters,
+            batch_size=settings.task_export_batch_size,
         )
-        return await repository.replace(task_id, owner_id, new_model)
+        return encode_export(tasks, params.format)
+
+    @staticmethod
+    async def get_stats(owner_id: str,
+                        repository: TaskRepository) -> TaskStats:
+        return await repository.stats(owner_id)
+
+    @staticmethod
+    async def replace_task(task_id: TaskId, owner_id: str, data: TaskPutUpdate,
+                           repository: TaskRepository,
+                           expected_version: Optional[int] = None
+                           ) -> TaskModel:
+        # The new version is computed from the one read here, so the write
+        # is always conditional on it: a concurrent write in between would
+        # otherwise leave two representations with the same version (and
+        # ETag). Without If-Match the replace is simply retried; only a
+        # real If-Match miss is a failed precondition.
+        for _ in range(_REPLACE_ATTEMPTS):
+            existing = await repository.get(task_id, owner_id)
+            if expected_version is not None and \
+                    existing.version != expected_version:
+                raise PreconditionFailedError()
+            new_model = TaskModel(
+                id=existing.id,
+                owner_id=owner_id,
+                title=data.title,
+                description=data.description,
+                status=data.status,
+                priority=data.priority,
+                created_at=existing.created_at,
+                updated_at=datetime.now(UTC),
+                version=existing.version + 1,
+            )
+            try:
+                replaced = await repository.replace(
+                    task_id, owner_id, new_model,
+                    expected_version=existing.version
+                )
+            except PreconditionFailedError:
+                if expected_version is not None:
+                    raise
+                continue
+            await bump_owner_generation(owner_id)
+            return replaced
+        raise ConcurrentUpdateError()
 
     @staticmethod
     async def patch_task(task_id: TaskId, owner_id: str, data: TaskPatchData,
-                         repository: TaskRepository) -> TaskModel:
-        return await repository.patch(task_id, owner_id, data)
+                         repository: TaskRepository,
+                         expected_version: Optional[int] = None
+                         ) -> TaskModel:
+        patched = await repository.patch(
+            task_id, owner_id, data, expected_version=expected_version
+        )
+        await bump_owner_generation(owner_id)
+        return patched
@@ -0,0 +1,69 @@
+"""
+Per-request cost of verifying a bearer token: python-jose decode on every
+request vs the verified-claims cache, for a pool of distinct live tokens.
+
+    APP_MODE=test python -m benchmarks.auth_path \
+        [--tokens 100] [--requests 20000]
+"""
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from bson import ObjectId
+
+from app.core.cache import CACHE_HITS, CACHE_MISSES
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token
+from app.core.token_cache import claims_cache, decode_token_cached
+
+
+def make_tokens(n: int) -> List[str]:
+    return [
+        create_access_token(
+            subject=str(ObjectId()), minutes=15,
+            secret=settings.jwt_secret_key.get_secret_value(),
+            algorithm=settings.jwt_algorithm,
+        )
+        for _ in range(n)
+    ]
+
+
+def per_request_us(decode: Callable[..., dict], tokens: List[str],
+                   requests: int) -> float:
+    secret = settings.jwt_secret_key.get_secret_value()
+    algorithms = [settings.jwt_algorithm]
+    # Same pseudo-random request order for both variants
+    order = random.Random(0).choices(tokens, k=requests)
+    start = time.perf_counter()
+    for token in order:
+        decode(token=token, secret=secret, algorithms=algorithms)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=100,
+                        help="distinct tokens (active sessions)")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    uncached = per_request_us(decode_token, tokens, args.requests)
+
+    claims_cache.clear()
+    hits_before = CACHE_HITS.labels(claims_cache.name).value
+    misses_before = CACHE_MISSES.labels(claims_cache.name).value
+    cached = per_request_us(decode_token_cached, tokens, args.requests)
+    hits = CACHE_HITS.labels(claims_cache.name).value - hits_before
+    misses = CACHE_MISSES.labels(claims_cache.name).value - misses_before
+
+    print(f"tokens={args.tokens} requests={args.requests} "
+          f"cache max_size={settings.jwt_claims_cache_max_size}")
+    print(f"decode every request : {uncached:8.2f} us/request")
+    print(f"claims cache         : {cached:8.2f} us/request  "
+          f"({uncached / cached:.1f}x, hit rate {hits / (hits + misses):.1%})")
+
+
+if __name__ == "__main__":
+    main()
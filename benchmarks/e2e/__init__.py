@@ -0,0 +1,9 @@
+"""
+End-to-end HTTP benchmark: seed users x tasks, start the API under uvicorn
+and drive every auth/task route at fixed concurrency.
+
+    pip install -r benchmarks/requirements.txt
+    APP_MODE=test python -m benchmarks.e2e --users 50 --tasks-per-user 200 \
+        --concurrency 16 --requests 500 --output bench.json \
+        [--baseline benchmarks/e2e/baseline.json --threshold 0.10]
+"""
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import contextlib
+import sys
+import uuid
+from typing import List, Optional
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.core.config import settings, RepositoryBackend
+from benchmarks.e2e import __doc__ as usage
+from benchmarks.e2e.report import build_results, print_table, compare, \
+    load, dump
+from benchmarks.e2e.runner import Server, run_all
+from benchmarks.e2e.scenarios import ROUTES, prepare_context
+from benchmarks.e2e.seed import seed_mongo, seed_api, username
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.e2e", description=usage,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--tasks-per-user", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=300,
+                        help="measured requests per route")
+    parser.add_argument("--warmup", type=int, default=20,
+                        help="unmeasured requests per route")
+    parser.add_argument("--routes", nargs="*", default=None,
+                        help="only routes whose name contains one of these")
+    parser.add_argument("--backend", choices=list(RepositoryBackend),
+                        default=RepositoryBackend.mongo)
+    parser.add_argument("--seed", choices=("auto", "mongo", "api", "none"),
+                        default="auto",
+                        help="auto: mongo (direct inserts) for the mongo "
+                             "backend, api for memory; none reuses the "
+                             "existing dataset")
+    parser.add_argument("--db", default=f"{settings.mongo_db}_bench",
+                        help="scratch database, dropped and reseeded")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--base-url", default=None,
+                        help="benchmark an already running server instead "
+                             "of spawning uvicorn")
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed p95/throughput regression (fraction)")
+    args = parser.parse_args(argv)
+
+    if args.seed == "auto":
+        args.seed = "mongo" if args.backend == RepositoryBackend.mongo \
+            else "api"
+    if args.backend == RepositoryBackend.memory:
+        if args.workers != 1:
+            parser.error("the memory backend is per process; use --workers 1")
+        if args.seed == "mongo":
+            parser.error("--seed mongo does not apply to the memory backend")
+    return args
+
+
+async def bench(args: argparse.Namespace) -> dict:
+    if args.seed == "mongo":
+        print(f"seeding {args.users} users x {args.tasks_per_user} tasks "
+              f"into {args.db}", file=sys.stderr)
+        mongo = AsyncIOMotorClient(settings.mongo_url, tz_aware=True)
+        try:
+            await seed_mongo(mongo[args.db], args.users, args.tasks_per_user)
+        finally:
+            mongo.close()
+
+    routes = [r for r in ROUTES if not args.routes or
+              any(part in r.name for part in args.routes)]
+    server = contextlib.nullcontext() if args.base_url else Server(
+        args.port, args.workers,
+        {"REPOSITORY_BACKEND": args.backend, "MONGO_DB": args.db},
+    )
+    async with server:
+        async with httpx.AsyncClient(
+            base_url=args.base_url or server.base_url, timeout=60,
+            limits=httpx.Limits(max_connections=args.concurrency),
+        ) as client:
+            if args.seed == "api":
+                print(f"seeding {args.users} users x {args.tasks_per_user} "
+                      f"tasks through the API", file=sys.stderr)
+                await seed_api(client, args.users, args.tasks_per_user,
+                               args.concurrency)
+            ctx = await prepare_context(
+                client, [username(n) for n in range(args.users)],
+                uuid.uuid4().hex[:8], args.concurrency,
+            )
+            samples = await run_all(client, ctx, routes, args.requests,
+                                    args.warmup, args.concurrency)
+
+    config = {key: getattr(args, key) for key in (
+        "users", "tasks_per_user", "concurrency", "requests", "warmup",
+        "backend", "workers",
+    )}
+    return build_results(samples, config)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = asyncio.run(bench(args))
+    dump(results, args.output)
+    print_table(results)
+    print(f"results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    regressions = compare(results, load(args.baseline), args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print("no regressions" if not regressions else
+          f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
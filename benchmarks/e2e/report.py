@@ -0,0 +1,93 @@
+"""
+Per-route summary (p50/p95/p99 latency, throughput), JSON results and
+comparison against a stored baseline.
+"""
+import json
+import math
+import platform
+from datetime import datetime, UTC
+from typing import Dict, List, Sequence
+
+from benchmarks.e2e.runner import RouteSample
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(sample: RouteSample) -> dict:
+    latencies = sorted(sample.latencies)
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": len(latencies),
+        "errors": sample.errors,
+        "statuses": {str(k): v for k, v in sorted(sample.statuses.items())},
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "mean_ms": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        "throughput_rps": round(len(latencies) / sample.elapsed, 2)
+        if sample.elapsed else 0.0,
+    }
+
+
+def build_results(samples: List[RouteSample], config: dict) -> dict:
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "config": config,
+        "routes": {s.name: summarize(s) for s in samples},
+    }
+
+
+def print_table(results: dict) -> None:
+    print(f"{'route':<40} {'req':>6} {'err':>4} {'p50':>8} {'p95':>8} "
+          f"{'p99':>8} {'rps':>9}")
+    for name, r in results["routes"].items():
+        print(f"{name:<40} {r['requests']:>6} {r['errors']:>4} "
+              f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+              f"{r['throughput_rps']:>9.1f}")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """
+    Return one line per regression: p95 latency above baseline by more
+    than ``threshold`` (fraction) or throughput below it by more than that.
+    Routes missing from either side are ignored.
+    """
+    regressions = []
+    for name, current in results["routes"].items():
+        base = baseline.get("routes", {}).get(name)
+        if base is None:
+            continue
+        if base["p95_ms"] and \
+                current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {base['p95_ms']:.2f} -> "
+                f"{current['p95_ms']:.2f} ms"
+            )
+        if base["throughput_rps"] and \
+                current["throughput_rps"] < \
+                base["throughput_rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {base['throughput_rps']:.1f} -> "
+                f"{current['throughput_rps']:.1f} rps"
+            )
+    return regressions
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump(results: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
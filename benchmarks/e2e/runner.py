@@ -0,0 +1,110 @@
+"""
+Fixed-concurrency driver: ``concurrency`` workers share one request
+counter and each records wall-clock latency per completed request.
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import httpx
+
+from benchmarks.e2e.scenarios import BenchContext, Route
+
+
+@dataclass
+class RouteSample:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+
+async def run_route(client: httpx.AsyncClient, ctx: BenchContext,
+                    route: Route, requests: int, concurrency: int,
+                    first_index: int = 0) -> RouteSample:
+    sample = RouteSample(route.name)
+    indexes = iter(range(first_index, first_index + requests))
+
+    async def worker() -> None:
+        for i in indexes:
+            method, url, kwargs = route.build(ctx, i)
+            started = time.perf_counter()
+            try:
+                r = await client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                sample.errors += 1
+                continue
+            sample.latencies.append(time.perf_counter() - started)
+            sample.statuses[r.status_code] = \
+                sample.statuses.get(r.status_code, 0) + 1
+            if r.status_code not in route.expect:
+                sample.errors += 1
+            if route.record is not None:
+                route.record(ctx, i, r)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    sample.elapsed = time.perf_counter() - started
+    return sample
+
+
+async def run_all(client: httpx.AsyncClient, ctx: BenchContext,
+                  routes: List[Route], requests: int, warmup: int,
+                  concurrency: int) -> List[RouteSample]:
+    samples = []
+    for route in routes:
+        if warmup:
+            await run_route(client, ctx, route, warmup, concurrency)
+        sample = await run_route(client, ctx, route, requests, concurrency,
+                                 first_index=warmup)
+        print(f"  {route.name:<40} {len(sample.latencies):>6} req "
+              f"{sample.errors:>4} err {sample.elapsed:7.2f}s",
+              file=sys.stderr)
+        samples.append(sample)
+    return samples
+
+
+class Server:
+    """
+    uvicorn child process serving app.main:app with ``env`` overrides.
+    """
+
+    def __init__(self, port: int, workers: int, env: Dict[str, str]):
+        self.base_url = f"http://127.0.0.1:{port}"
+        self._cmd = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+            "--no-access-log",
+        ]
+        self._env = os.environ | env
+        self._proc: subprocess.Popen | None = None
+
+    async def __aenter__(self) -> "Server":
+        self._proc = subprocess.Popen(self._cmd, env=self._env)
+        deadline = time.monotonic() + 30
+        async with httpx.AsyncClient(base_url=self.base_url) as client:
+            while time.monotonic() < deadline:
+                if self._proc.poll() is not None:
+                    raise RuntimeError("uvicorn exited during startup")
+                try:
+                    if (await client.get("/health")).status_code == 200:
+                        return self
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.2)
+        await self.__aexit__()
+        raise RuntimeError("server did not become healthy within 30s")
+
+    async def __aexit__(self, *exc) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
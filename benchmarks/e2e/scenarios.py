@@ -0,0 +1,238 @@
+"""
+One ``Route`` per auth/task endpoint (plus list variants). ``build`` turns
+a request index into (method, url, httpx kwargs); ``record`` lets a route
+hand created ids to a later one (creates feed the delete routes).
+"""
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.models.task_model import TaskPriority
+from benchmarks.e2e.seed import BENCH_PASSWORD, login, task_fields
+
+TASKS = "/api/v1/tasks"
+BULK_SIZE = 20
+MISSING_ID = "0" * 24
+
+Request = Tuple[str, str, dict]
+
+
+@dataclass
+class UserContext:
+    name: str
+    headers: Dict[str, str]
+    task_ids: List[str]
+    cursor: Optional[str]
+
+
+@dataclass
+class BenchContext:
+    run_id: str
+    users: List[UserContext]
+    created: Deque[Tuple[int, str]] = field(default_factory=deque)
+    bulk_created: Deque[Tuple[int, List[str]]] = field(default_factory=deque)
+
+    def user(self, i: int) -> Tuple[int, UserContext]:
+        n = i % len(self.users)
+        return n, self.users[n]
+
+    def task(self, i: int) -> Tuple[UserContext, str]:
+        _, user = self.user(i)
+        return user, user.task_ids[(i // len(self.users)) % len(user.task_ids)]
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str
+    build: Callable[[BenchContext, int], Request]
+    expect: Tuple[int, ...] = (200,)
+    record: Optional[
+        Callable[[BenchContext, int, httpx.Response], None]
+    ] = None
+
+
+async def prepare_context(client: httpx.AsyncClient, usernames: List[str],
+                          run_id: str, concurrency: int) -> BenchContext:
+    """
+    Log every bench user in once and collect a first page of task ids and
+    the cursor to the second page.
+    """
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(name: str) -> UserContext:
+        async with gate:
+            headers = await login(client, name)
+            r = await client.get(f"{TASKS}/", headers=headers,
+                                 params={"limit": 50, "count": "none"})
+            r.raise_for_status()
+            page = r.json()
+        ids = [t["id"] for t in page["items"]]
+        if not ids:
+            raise RuntimeError(f"{name} has no tasks; seed the dataset first")
+        return UserContext(name, headers, ids, page["meta"]["next_cursor"])
+
+    users = await asyncio.gather(*(one(name) for name in usernames))
+    return BenchContext(run_id=run_id, users=list(users))
+
+
+def _health(ctx: BenchContext, i: int) -> Request:
+    return "GET", "/health", {}
+
+
+def _register(ctx: BenchContext, i: int) -> Request:
+    name = f"bench_reg_{ctx.run_id}_{i}"
+    return "POST", "/api/v1/auth/register", {"json": {
+        "username": name, "email": f"{name}@example.com",
+        "password": BENCH_PASSWORD,
+    }}
+
+
+def _login(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "POST", "/api/v1/auth/login", {"data": {
+        "username": user.name, "password": BENCH_PASSWORD,
+    }}
+
+
+def _me(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "GET", "/api/v1/auth/me", {"headers": user.headers}
+
+
+def _create(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "POST", f"{TASKS}/", {"headers": user.headers, "json": {
+        "title": f"bench {ctx.run_id} create {i}",
+    }}
+
+
+def _record_created(ctx: BenchContext, i: int, r: httpx.Response) -> None:
+    if r.status_code == 201:
+        ctx.created.append((ctx.user(i)[0], r.json()["id"]))
+
+
+def _list(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "GET", f"{TASKS}/", {"headers": user.headers,
+                                "params": {"limit": 50}}
+
+
+def _list_cursor(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    params = {"limit": 50, "count": "none"}
+    if user.cursor:
+        params["cursor"] = user.cursor
+    return "GET", f"{TASKS}/", {"headers": user.headers, "params": params}
+
+
+def _list_filtered(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    fields = task_fields(i)
+    return "GET", f"{TASKS}/", {"headers": user.headers, "params": {
+        "limit": 50, "status": fields["status"],
+        "priority": fields["priority"], "sort": "updated_at",
+    }}
+
+
+def _get(ctx: BenchContext, i: int) -> Request:
+    user, task_id = ctx.task(i)
+    return "GET", f"{TASKS}/{task_id}", {"headers": user.headers}
+
+
+def _put(ctx: BenchContext, i: int) -> Request:
+    user, task_id = ctx.task(i)
+    fields = task_fields(i)
+    return "PUT", f"{TASKS}/{task_id}", {"headers": user.headers, "json": {
+        "title": f"bench {ctx.run_id} put {i}",
+        "description": fields["description"],
+        "status": fields["status"],
+        "priority": fields["priority"],
+    }}
+
+
+def _patch(ctx: BenchContext, i: int) -> Request:
+    user, task_id = ctx.task(i)
+    priorities = list(TaskPriority)
+    return "PATCH", f"{TASKS}/{task_id}", {"headers": user.headers, "json": {
+        "priority": priorities[i % len(priorities)].value,
+    }}
+
+
+def _stats(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "GET", f"{TASKS}/stats", {"headers": user.headers}
+
+
+def _export(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "GET", f"{TASKS}/export", {
+        "headers": user.headers,
+        "params": {"format": ("ndjson", "csv")[i % 2]},
+    }
+
+
+def _bulk_create(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    return "POST", f"{TASKS}/bulk", {"headers": user.headers, "json": {
+        "items": [{"title": f"bench {ctx.run_id} bulk {i} {k}"}
+                  for k in range(BULK_SIZE)],
+    }}
+
+
+def _record_bulk_created(ctx: BenchContext, i: int,
+                         r: httpx.Response) -> None:
+    if r.status_code == 200:
+        ids = [item["id"] for item in r.json()["items"] if item["id"]]
+        ctx.bulk_created.append((ctx.user(i)[0], ids))
+
+
+def _bulk_patch(ctx: BenchContext, i: int) -> Request:
+    _, user = ctx.user(i)
+    start = (i // len(ctx.users)) * BULK_SIZE
+    ids = [user.task_ids[(start + k) % len(user.task_ids)]
+           for k in range(BULK_SIZE)]
+    fields = task_fields(i)
+    return "PATCH", f"{TASKS}/bulk", {"headers": user.headers, "json": {
+        "items": [{"id": task_id, "status": fields["status"]}
+                  for task_id in ids],
+    }}
+
+
+def _bulk_delete(ctx: BenchContext, i: int) -> Request:
+    n, ids = ctx.bulk_created.popleft() if ctx.bulk_created else \
+        (ctx.user(i)[0], [MISSING_ID])
+    return "DELETE", f"{TASKS}/bulk", {"headers": ctx.users[n].headers,
+                                       "json": {"ids": ids}}
+
+
+def _delete(ctx: BenchContext, i: int) -> Request:
+    n, task_id = ctx.created.popleft() if ctx.created else \
+        (ctx.user(i)[0], MISSING_ID)
+    return "DELETE", f"{TASKS}/{task_id}", {"headers": ctx.users[n].headers}
+
+
+# Run in this order: creates come before the deletes that consume them
+ROUTES: List[Route] = [
+    Route("GET /health", _health),
+    Route("POST /api/v1/auth/register", _register, expect=(201,)),
+    Route("POST /api/v1/auth/login", _login),
+    Route("GET /api/v1/auth/me", _me),
+    Route("POST /api/v1/tasks/", _create, expect=(201,),
+          record=_record_created),
+    Route("GET /api/v1/tasks/", _list),
+    Route("GET /api/v1/tasks/ (cursor)", _list_cursor),
+    Route("GET /api/v1/tasks/ (filtered)", _list_filtered),
+    Route("GET /api/v1/tasks/{task_id}", _get),
+    Route("PUT /api/v1/tasks/{task_id}", _put),
+    Route("PATCH /api/v1/tasks/{task_id}", _patch),
+    Route("GET /api/v1/tasks/stats", _stats),
+    Route("GET /api/v1/tasks/export", _export),
+    Route("POST /api/v1/tasks/bulk", _bulk_create,
+          record=_record_bulk_created),
+    Route("PATCH /api/v1/tasks/bulk", _bulk_patch),
+    Route("DELETE /api/v1/tasks/bulk", _bulk_delete),
+    Route("DELETE /api/v1/tasks/{task_id}", _delete, expect=(204,)),
+]
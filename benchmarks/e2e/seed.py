@@ -0,0 +1,112 @@
+"""
+Benchmark dataset: ``users`` users named bench_user_<n>, each owning
+``tasks_per_user`` tasks with rotating status/priority.
+"""
+import asyncio
+from datetime import datetime, timedelta, UTC
+from typing import Dict, List
+
+import httpx
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.core.indexes import init_all_indexes
+from app.core.security import get_password_hash
+from app.models.task_model import TaskStatus, TaskPriority
+from app.repositories.task_repository_mongo import TaskRepositoryImpl, \
+    COLLECTION_NAME as TASKS_COLLECTION
+from app.repositories.task_stats_mongo import STATS_COLLECTION_NAME
+from app.repositories.user_repository_mongo import \
+    COLLECTION_NAME as USERS_COLLECTION
+
+BENCH_PASSWORD = "benchmark-password"
+INSERT_CHUNK = 10_000
+API_BULK_CHUNK = 100
+
+
+def username(n: int) -> str:
+    return f"bench_user_{n}"
+
+
+async def login(client: httpx.AsyncClient, name: str) -> Dict[str, str]:
+    r = await client.post("/api/v1/auth/login", data={
+        "username": name, "password": BENCH_PASSWORD,
+    })
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def task_fields(i: int) -> dict:
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    return {
+        "title": f"seeded task {i}",
+        "description": f"seeded benchmark task number {i}",
+        "status": statuses[i % len(statuses)].value,
+        "priority": priorities[(i // 2) % len(priorities)].value,
+    }
+
+
+async def seed_mongo(db: AsyncIOMotorDatabase, users: int,
+                     tasks_per_user: int) -> None:
+    """
+    Recreate the dataset by inserting documents directly (fast path).
+    """
+    for name in (USERS_COLLECTION, TASKS_COLLECTION, STATS_COLLECTION_NAME):
+        await db.drop_collection(name)
+    await init_all_indexes(db)
+
+    now = datetime.now(UTC)
+    hashed = get_password_hash(BENCH_PASSWORD)
+    res = await db[USERS_COLLECTION].insert_many([
+        {
+            "username": username(n),
+            "email": f"{username(n)}@example.com",
+            "hashed_password": hashed,
+            "created_at": now,
+        }
+        for n in range(users)
+    ])
+
+    batch: List[dict] = []
+    for owner_oid in res.inserted_ids:
+        for i in range(tasks_per_user):
+            created = now - timedelta(seconds=i)
+            batch.append(task_fields(i) | {
+                "owner_id": str(owner_oid),
+                "created_at": created,
+                "updated_at": created if i % 3 else None,
+                "version": 1,
+            })
+            if len(batch) >= INSERT_CHUNK:
+                await db[TASKS_COLLECTION].insert_many(batch, ordered=False)
+                batch = []
+    if batch:
+        await db[TASKS_COLLECTION].insert_many(batch, ordered=False)
+    await TaskRepositoryImpl(db).rebuild_stats()
+
+
+async def seed_api(client: httpx.AsyncClient, users: int,
+                   tasks_per_user: int, concurrency: int) -> None:
+    """
+    Create the dataset through the running API (works with any
+    REPOSITORY_BACKEND, e.g. memory). Existing bench users are reused.
+    """
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one_user(n: int) -> None:
+        async with gate:
+            r = await client.post("/api/v1/auth/register", json={
+                "username": username(n),
+                "email": f"{username(n)}@example.com",
+                "password": BENCH_PASSWORD,
+            })
+            if r.status_code not in (201, 409):
+                r.raise_for_status()
+            headers = await login(client, username(n))
+            for start in range(0, tasks_per_user, API_BULK_CHUNK):
+                stop = min(start + API_BULK_CHUNK, tasks_per_user)
+                r = await client.post("/api/v1/tasks/bulk", headers=headers,
+                                      json={"items": [task_fields(i) for i in
+                                                      range(start, stop)]})
+                r.raise_for_status()
+
+    await asyncio.gather(*(one_user(n) for n in range(users)))
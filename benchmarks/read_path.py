@@ -0,0 +1,67 @@
+"""
+Per-item cost of turning stored task documents into TaskResponse objects,
+strict (validate twice) vs trusted (construct) read path.
+
+    APP_MODE=test python -m benchmarks.read_path [--items 100] [--rounds 200]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Callable, List
+
+from bson import ObjectId
+
+from app.models.task_model import TaskStatus, TaskPriority
+from app.repositories.task_repository_mongo import task_from_doc
+from app.schemas.task_schema import TaskResponse
+
+
+def make_docs(n: int) -> List[dict]:
+    now = datetime.now(UTC)
+    owner_id = str(ObjectId())
+    return [
+        {
+            "_id": ObjectId(),
+            "owner_id": owner_id,
+            "title": f"benchmark task {i}",
+            "description": "x" * 200,
+            "status": list(TaskStatus)[i % 4].value,
+            "priority": list(TaskPriority)[i % 4].value,
+            "created_at": now - timedelta(seconds=i),
+            "updated_at": now if i % 2 else None,
+        }
+        for i in range(n)
+    ]
+
+
+def page(docs: List[dict], strict: bool) -> List[TaskResponse]:
+    return [
+        TaskResponse.from_model(task_from_doc(dict(d), strict), strict)
+        for d in docs
+    ]
+
+
+def per_item_us(fn: Callable[[], object], items: int, rounds: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / (rounds * items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    docs = make_docs(args.items)
+    strict = per_item_us(lambda: page(docs, True), args.items, args.rounds)
+    trusted = per_item_us(lambda: page(docs, False), args.items, args.rounds)
+    print(f"items/page={args.items} rounds={args.rounds}")
+    print(f"strict  : {strict:8.2f} us/item")
+    print(f"trusted : {trusted:8.2f} us/item  ({strict / trusted:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
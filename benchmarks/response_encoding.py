@@ -0,0 +1,79 @@
+"""
+Cost of turning a list page (TaskList) into JSON bytes: FastAPI's
+response_model path -- validate, then dump to Python and json.dumps
+(older FastAPI) or dump straight to JSON (recent FastAPI) -- vs
+FAST_JSON_RESPONSES (model_dump_json once).
+
+    APP_MODE=test python -m benchmarks.response_encoding \
+        [--items 100] [--rounds 500]
+"""
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from pydantic import TypeAdapter
+
+from app.repositories.task_repository_mongo import task_from_doc
+from app.schemas.task_schema import TaskList, TaskResponse, PageMeta
+from benchmarks.read_path import make_docs
+
+
+def make_page(items: int) -> TaskList:
+    tasks: List[TaskResponse] = [
+        TaskResponse.from_model(task_from_doc(doc, False), False)
+        for doc in make_docs(items)
+    ]
+    return TaskList(items=tasks, meta=PageMeta(
+        total=items, count="exact", limit=items, skip=0,
+        sort="created_at", sort_dir="desc", next_cursor=None,
+    ))
+
+
+def per_page_us(fn: Callable[[], bytes], rounds: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    page = make_page(args.items)
+    adapter = TypeAdapter(TaskList)
+
+    def response_model_python() -> bytes:
+        # What JSONResponse.render does with the serialized dict
+        content = adapter.dump_python(adapter.validate_python(page),
+                                      mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False,
+                          indent=None, separators=(",", ":")).encode()
+
+    def response_model_json() -> bytes:
+        return adapter.dump_json(adapter.validate_python(page))
+
+    def fast() -> bytes:
+        return page.model_dump_json().encode()
+
+    assert json.loads(response_model_python()) == json.loads(fast())
+    results = [
+        ("response_model + json.dumps", per_page_us(response_model_python,
+                                                    args.rounds)),
+        ("response_model + dump_json", per_page_us(response_model_json,
+                                                   args.rounds)),
+        ("model_dump_json (fast path)", per_page_us(fast, args.rounds)),
+    ]
+    print(f"items/page={args.items} rounds={args.rounds} "
+          f"body={len(fast())} bytes")
+    baseline = results[0][1]
+    for name, us in results:
+        print(f"{name:<32}: {us:9.1f} us/page  ({baseline / us:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Worker cold-start budget: ``python -X importtime`` report for app.main,
+a check that the lazily loaded stacks stay unloaded at startup, and the
+time from spawning uvicorn to the first 200 on /health.
+
+    APP_MODE=test python -m benchmarks.startup [--runs 5] [--output s.json]
+
+Budgets live in benchmarks/startup_budget.json; the exit status is non-zero
+when a median exceeds its budget or a lazy module is imported at startup.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import httpx
+
+BUDGET_FILE = Path(__file__).with_name("startup_budget.json")
+IMPORT_PROBE = (
+    "import json, sys, app.main; print(json.dumps(sorted(sys.modules)))"
+)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    ``(module, self_us, cumulative_us)`` rows from -X importtime output.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def import_report(env: Dict[str, str]) -> Tuple[dict, List[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PROBE],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(proc.stderr)
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+    total_us = next(c for name, _, c in rows if name == "app.main")
+    top = sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)
+    return {
+        "app_main_ms": round(total_us / 1000, 1),
+        "top_packages_ms": {k: round(v / 1000, 1) for k, v in top[:15]},
+    }, json.loads(proc.stdout)
+
+
+def first_200(env: Dict[str, str], port: int, timeout: float = 30) -> float:
+    """
+    Seconds from spawning uvicorn to the first 200 from /health.
+    """
+    url = f"http://127.0.0.1:{port}/health"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host",
+         "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        with httpx.Client(timeout=1) as client:
+            while time.perf_counter() - started < timeout:
+                if proc.poll() is not None:
+                    raise RuntimeError("uvicorn exited during startup")
+                try:
+                    if client.get(url).status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError(f"no 200 from /health within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--backend", default="memory",
+                        help="REPOSITORY_BACKEND for the /health runs "
+                             "(memory measures the app, not Mongo)")
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text(encoding="utf-8"))
+    env = os.environ | {"REPOSITORY_BACKEND": args.backend}
+
+    reports, modules = [], []
+    for _ in range(args.runs):
+        report, modules = import_report(env)
+        reports.append(report)
+    import_ms = statistics.median(r["app_main_ms"] for r in reports)
+    eager = sorted(m for m in budget["lazy_modules"] if m in modules)
+
+    ready_ms = [first_200(env, args.port) * 1000 for _ in range(args.runs)]
+    first_200_ms = statistics.median(ready_ms)
+
+    results = {
+        "import_app_main_ms": import_ms,
+        "first_200_ms": round(first_200_ms, 1),
+        "first_200_ms_runs": [round(v, 1) for v in ready_ms],
+        "top_packages_ms": reports[-1]["top_packages_ms"],
+        "eager_lazy_modules": eager,
+        "budget": budget,
+    }
+    print(f"import app.main  : {import_ms:8.1f} ms "
+          f"(budget {budget['import_ms']} ms)")
+    print(f"first 200 /health: {first_200_ms:8.1f} ms "
+          f"(budget {budget['first_200_ms']} ms)")
+    print("self import time by package (ms):")
+    for name, ms in results["top_packages_ms"].items():
+        print(f"  {name:<24} {ms:8.1f}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n",
+                                     encoding="utf-8")
+
+    failures = []
+    if import_ms > budget["import_ms"]:
+        failures.append("import time over budget")
+    if first_200_ms > budget["first_200_ms"]:
+        failures.append("time to first 200 over budget")
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager)}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
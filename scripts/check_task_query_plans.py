@@ -0,0 +1,195 @@
+"""
+Explain every task list/count/export query shape the API can issue, against
+both tasks and tasks_archive, and fail if any winning plan contains a
+COLLSCAN or a blocking in-memory SORT stage. The archiver's candidate query
+must also be served by its partial index.
+
+Runs against a scratch database on the configured Mongo server:
+
+    APP_MODE=test python -m scripts.check_task_query_plans
+"""
+import asyncio
+import itertools
+import sys
+from datetime import datetime, timedelta, UTC
+from typing import Iterator, List, Optional, Set
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+
+from app.core.config import settings
+from app.core.indexes import init_task_indexes, \
+    init_task_archive_indexes, TASK_SORT_FIELDS
+from app.models.task_model import TaskStatus, TaskPriority
+from app.repositories.task_archive_mongo import TaskArchiveStore
+from app.repositories.task_repository import TaskCursor
+from app.repositories.task_repository_mongo import TaskRepositoryImpl, \
+    COLLECTION_NAME, ARCHIVE_COLLECTION_NAME
+
+FORBIDDEN_STAGES = {"COLLSCAN", "SORT"}
+CANDIDATE_INDEX = "idx_tasks_resolved_updated_at_created_at"
+OWNERS = 3
+TASKS_PER_OWNER = 300
+PAGE_SIZE = 51
+
+
+def _nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for key in ("inputStage", "queryPlan", "thenStage", "elseStage",
+                "outerStage", "innerStage"):
+        if key in plan:
+            yield from _nodes(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _nodes(child)
+
+
+def _winning_stages(explain: dict) -> Set[str]:
+    return {node["stage"]
+            for node in _nodes(explain["queryPlanner"]["winningPlan"])
+            if "stage" in node}
+
+
+def _winning_indexes(explain: dict) -> Set[str]:
+    return {node["indexName"]
+            for node in _nodes(explain["queryPlanner"]["winningPlan"])
+            if "indexName" in node}
+
+
+async def _seed(db: AsyncIOMotorDatabase) -> List[str]:
+    await db.drop_collection(COLLECTION_NAME)
+    await db.drop_collection(ARCHIVE_COLLECTION_NAME)
+    await init_task_indexes(db)
+    await init_task_archive_indexes(db)
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    now = datetime.now(UTC)
+    owners = [str(ObjectId()) for _ in range(OWNERS)]
+    docs, archived = [], []
+    for owner_id in owners:
+        for i in range(TASKS_PER_OWNER):
+            created = now - timedelta(minutes=i)
+            docs.append({
+                "owner_id": owner_id,
+                "title": f"task {i}",
+                "description": None,
+                "status": statuses[i % len(statuses)],
+                "priority": priorities[(i // 2) % len(priorities)],
+                "created_at": created,
+                "updated_at": created if i % 3 else None,
+            })
+            created = now - timedelta(days=365, minutes=i)
+            archived.append({
+                "owner_id": owner_id,
+                "title": f"archived task {i}",
+                "description": None,
+                "status": TaskStatus.RESOLVED,
+                "priority": priorities[(i // 2) % len(priorities)],
+                "created_at": created,
+                "updated_at": created if i % 3 else None,
+            })
+    await db[COLLECTION_NAME].insert_many(docs)
+    await db[ARCHIVE_COLLECTION_NAME].insert_many(archived)
+    return owners
+
+
+async def check(db: AsyncIOMotorDatabase) -> List[str]:
+    owner_id = (await _seed(db))[0]
+    failures: List[str] = []
+    # Any filter combination reaches the archive with include_archived
+    for name in (COLLECTION_NAME, ARCHIVE_COLLECTION_NAME):
+        failures += await _check_lists(db, name, owner_id)
+    failures += await _check_archive_candidates(db)
+    return failures
+
+
+async def _check_lists(db: AsyncIOMotorDatabase, name: str,
+                       owner_id: str) -> List[str]:
+    collection = db[name]
+    cursors: List[Optional[TaskCursor]] = [
+        None,
+        TaskCursor(value=datetime.now(UTC) - timedelta(hours=1),
+                   id=str(ObjectId())),
+        TaskCursor(value=None, id=str(ObjectId())),
+    ]
+    failures: List[str] = []
+
+    for status, priority, sort, sort_dir, after, skip in itertools.product(
+        [None, *TaskStatus], [None, *TaskPriority], TASK_SORT_FIELDS,
+        ("asc", "desc"), cursors, (0, 100),
+    ):
+        if after is not None and skip:
+            continue
+        filters = {"owner_id": owner_id}
+        if status is not None:
+            filters["status"] = status
+        if priority is not None:
+            filters["priority"] = priority
+        query = TaskRepositoryImpl._build_query(filters)
+        shape = f"{name} filters={sorted(filters)} sort={sort} {sort_dir}"
+        order = DESCENDING if sort_dir == "desc" else ASCENDING
+
+        if after is None and skip == 0:
+            explain = await db.command(
+                "explain", {"count": name, "query": query},
+                verbosity="queryPlanner",
+            )
+            bad = _winning_stages(explain) & FORBIDDEN_STAGES
+            if bad:
+                failures.append(f"count {shape}: {sorted(bad)}")
+            if (sort, sort_dir) == ("created_at", "asc"):
+                # Exports: the whole result, unlimited
+                explain = await collection.find(query).sort(
+                    [(sort, order), ("_id", order)]
+                ).explain()
+                bad = _winning_stages(explain) & FORBIDDEN_STAGES
+                if bad:
+                    failures.append(f"export {shape}: {sorted(bad)}")
+
+        if after is not None:
+            query |= TaskRepositoryImpl._keyset_clause(sort, sort_dir, after)
+            shape += f" after={'null' if after['value'] is None else 'value'}"
+        # Merged pages read the first skip + limit rows of each collection
+        limit = PAGE_SIZE
+        if name == ARCHIVE_COLLECTION_NAME:
+            skip, limit = 0, skip + PAGE_SIZE
+        explain = await collection.find(query).sort(
+            [(sort, order), ("_id", order)]
+        ).skip(skip).limit(limit).explain()
+        bad = _winning_stages(explain) & FORBIDDEN_STAGES
+        if bad:
+            failures.append(f"list {shape} skip={skip}: {sorted(bad)}")
+    return failures
+
+
+async def _check_archive_candidates(db: AsyncIOMotorDatabase) -> List[str]:
+    cutoff = datetime.now(UTC) - timedelta(
+        days=settings.task_archive_after_days
+    )
+    explain = await db[COLLECTION_NAME].find(
+        TaskArchiveStore._candidate_query(cutoff)
+    ).limit(settings.task_archive_batch_size).explain()
+    failures = []
+    bad = _winning_stages(explain) & FORBIDDEN_STAGES
+    if bad:
+        failures.append(f"archive candidates: {sorted(bad)}")
+    if CANDIDATE_INDEX not in _winning_indexes(explain):
+        failures.append(f"archive candidates: not using {CANDIDATE_INDEX}")
+    return failures
+
+
+async def main() -> int:
+    client = AsyncIOMotorClient(settings.mongo_url, tz_aware=True)
+    db = client[f"{settings.mongo_db}_query_plans"]
+    try:
+        failures = await check(db)
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print("ok" if not failures else f"{len(failures)} bad plan(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))